@@ -87,6 +87,10 @@ def __hash__(self):
 
 
 django_admin = os.path.join(os.environ["VIRTUAL_ENV"], "bin", "django-admin")
+django_typer_serve = os.path.join(
+    os.environ["VIRTUAL_ENV"], "bin", "django-typer-serve"
+)
+django_typer_run = os.path.join(os.environ["VIRTUAL_ENV"], "bin", "django-typer-run")
 
 no_typer = {"DJANGO_SETTINGS_MODULE": "profiling.settings.no_typer"}
 with_typer = {"DJANGO_SETTINGS_MODULE": "profiling.settings.with_typer"}
@@ -305,6 +309,51 @@ def generate():
     pprint(profile_data[pos_str])
 
 
+@app.command(help="Compare cold runs to runs through the warm runner.")
+def warm(
+    runs: t.Annotated[int, typer.Option(help="The number of runs to average.")] = (
+        run_counts
+    ),
+):
+    import tempfile
+    import time
+
+    load_fixtures()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        socket = os.path.join(tmp_dir, "runner.sock")
+        env = {
+            "PYTHONPATH": pythonpath,
+            "VIRTUAL_ENV": os.environ["VIRTUAL_ENV"],
+            **polls_with_typer,
+        }
+        server = subprocess.Popen(
+            [django_typer_serve, "--socket", socket],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 30
+            while not os.path.exists(socket):
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("The warm runner did not start.")
+                time.sleep(0.05)
+            for cmd in [("polls", "2"), ("polls", "2", "--help")]:
+                for name, runner in [
+                    ("cold", [django_admin]),
+                    ("warm", [django_typer_run, "--socket", socket]),
+                ]:
+                    times = []
+                    for _ in range(runs):
+                        times.append(time_command(*runner, *cmd, **env)[-1])
+                    results[f"{' '.join(cmd)} ({name})"] = sum(times) / runs
+        finally:
+            server.terminate()
+            server.wait()
+    pprint(results)
+
+
 @app.command(help="Update documentation to reflect latest profiling data.")
 def document():
     if not rich_installed:
@@ -7,7 +7,7 @@
 
 from django.apps import AppConfig
 from django.conf import settings
-from django.core.checks import CheckMessage, register
+from django.core.checks import CheckMessage, Tags, register
 from django.core.checks import Warning as CheckWarning
 
 from django_typer import patch
@@ -51,6 +51,48 @@ def check_traceback_config(app_configs, **kwargs) -> list[CheckMessage]:
     return warnings
 
 
+@register(Tags.database)
+def check_completer_indexes(
+    app_configs, databases=None, **kwargs
+) -> list[CheckMessage]:
+    """
+    A database system check that warns about model object completers of
+    :class:`~django_typer.management.TyperCommand` parameters whose lookup fields can
+    not be completed using an index. This check loads every management command, run it
+    with ``manage.py check --database default``.
+    """
+    from django.core.management import CommandError, get_commands, load_command_class
+
+    from django_typer.completers.model import ModelObjectCompleter
+    from django_typer.management import TyperCommand, get_typer_command
+
+    if not databases:
+        return []
+
+    def walk(command, path):
+        for param in command.params:
+            completer = getattr(param, "_custom_shell_complete", None)
+            if isinstance(completer, ModelObjectCompleter) and (
+                app_configs is None
+                or completer.model_cls._meta.app_config in app_configs
+            ):
+                yield f"{path} {param.name}", completer
+        for name, sub in getattr(command, "commands", {}).items():
+            yield from walk(sub, f"{path} {name}")
+
+    warnings: list[CheckMessage] = []
+    for name, app_name in get_commands().items():
+        try:
+            cmd = load_command_class(app_name, name)
+        except (CommandError, ImportError, NotImplementedError):
+            continue
+        if not isinstance(cmd, TyperCommand):
+            continue
+        for path, completer in walk(get_typer_command(cmd.typer_app), name):
+            warnings.extend(completer.check_index(obj=path))
+    return warnings
+
+
 class DjangoTyperConfig(AppConfig):
     """
     Django Typer app config.
@@ -31,15 +31,37 @@
   :func:`~django_typer.completers.settings.languages`.
 - **settings**: Complete Django settings variable names using
   :func:`~django_typer.completers.settings.setting`.
+
+Completers may also be coroutine functions. Async completers and the completers they are
+chained with are run concurrently under a deadline, see :func:`run_completers`.
 """
 
+import asyncio
+import inspect
+import threading
 import typing as t
+from bisect import bisect_left
+from collections.abc import Hashable
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import wraps
+from time import monotonic
 
 from click import Context, Parameter
 from click.core import ParameterSource
 from click.shell_completion import CompletionItem
+from django.db import connections
+from django.utils.translation import gettext as _
+
+from django_typer.config import completion_deadline
 
 Completer = t.Callable[[Context, Parameter, str], list[CompletionItem]]
+AsyncCompleter = t.Callable[
+    [Context, Parameter, str], t.Awaitable[list[CompletionItem]]
+]
+
+# the monotonic time the completions being computed on this context are due
+_due: ContextVar[float | None] = ContextVar("completions_due", default=None)
 
 ItemTuple = t.Any | tuple[t.Any, t.Any]
 Strings = (
@@ -51,47 +73,328 @@
 )
 
 
+def _present(ctx: Context, param: Parameter) -> set[t.Any]:
+    """
+    :param ctx: The click context.
+    :param param: The click parameter.
+    :return: The set of values already given for the parameter.
+    """
+    if (
+        param.name
+        and ctx.get_parameter_source(param.name) is not ParameterSource.DEFAULT
+    ):
+        return {
+            value
+            for value in (ctx.params.get(param.name) or [])
+            if isinstance(value, Hashable)
+        }
+    return set()
+
+
+def _truncate(
+    items: list[CompletionItem], incomplete: str, max_results: int | None
+) -> list[CompletionItem]:
+    """
+    Cut the completion items off at the given maximum. If any are left out an item that
+    completes to the incomplete string and tells how many were left out is added.
+
+    :param items: The completion items.
+    :param incomplete: The incomplete string.
+    :param max_results: The maximum number of items, or None for no limit.
+    :return: The truncated completion items.
+    """
+    if max_results is None or len(items) <= max_results:
+        return items
+    return [
+        *items[:max_results],
+        CompletionItem(
+            incomplete,
+            type="plain",
+            help=_("{count} more entries").format(count=len(items) - max_results),
+        ),
+    ]
+
+
+def _item_tuples(
+    strings: t.Iterable[ItemTuple],
+) -> t.Iterator[tuple[t.Any, str | None]]:
+    """
+    :param strings: Strings or (string, help) tuples.
+    :return: An iterator over (string, help) tuples, help may be None.
+    """
+    for item in strings:
+        if isinstance(item, tuple):
+            yield str(item[0]), str(item[1])
+        else:
+            yield item, None
+
+
+def _key(string: str, case_sensitive: bool) -> str:
+    """
+    :param string: The string to get the match key of.
+    :param case_sensitive: Whether or not strings are matched case sensitively.
+    :return: The key to match prefixes against.
+    """
+    return str.__str__(string) if case_sensitive else string.casefold()
+
+
+class _StringIndex:
+    """
+    A sorted index of completion strings that finds the strings matching a prefix by
+    bisection.
+
+    :param strings: The strings or (string, help) tuples to index.
+    :param case_sensitive: Whether or not prefixes match case sensitively.
+    """
+
+    keys: list[str]
+    """The sorted match keys of the strings."""
+
+    positions: list[int]
+    """The input position of the string each sorted key belongs to."""
+
+    items: list[tuple[t.Any, str | None]]
+    """The (string, help) items in input order."""
+
+    def __init__(self, strings: t.Iterable[ItemTuple], case_sensitive: bool = True):
+        self.case_sensitive = case_sensitive
+        self.items = list(_item_tuples(strings))
+        keys = [_key(item, case_sensitive) for item, _help in self.items]
+        self.positions = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = [keys[pos] for pos in self.positions]
+
+    def match(self, prefix: str) -> list[tuple[t.Any, str | None]]:
+        """
+        :param prefix: The prefix to match.
+        :return: The (string, help) items that start with the prefix in input order.
+        """
+        prefix = _key(prefix, self.case_sensitive)
+        matches = []
+        for idx in range(bisect_left(self.keys, prefix), len(self.keys)):
+            if not self.keys[idx].startswith(prefix):
+                break
+            matches.append(self.positions[idx])
+        return [self.items[pos] for pos in sorted(matches)]
+
+
 def these_strings(
     strings: t.Callable[[], Strings] | Strings,
     allow_duplicates: bool = False,
+    case_sensitive: bool = True,
+    max_results: int | None = None,
+    ttl: float | None = None,
 ):
     """
     Get a completer that provides completion logic that matches the allowed strings.
 
+    Fixed collections of strings are sorted once, the first time they are completed, so
+    the matches are found by bisection instead of testing every string.
+
     :param strings: A sequence of allowed strings or a callable that generates a
         sequence of allowed strings. If the sequence contains 2-tuples the second
         element is used as the help text for the completion item.
     :param allow_duplicates: Whether or not to allow duplicate values. Defaults to
         False.
-    :return: A completer function.
+    :param case_sensitive: Whether or not to match the incomplete string case
+        sensitively. Defaults to True.
+    :param max_results: The maximum number of completions to return. If more strings
+        match an item that completes to the incomplete string and tells how many were
+        left out is added.
+    :param ttl: If strings is a callable, reuse the strings it generates for this many
+        seconds. By default the callable is called for every completion.
+    :return: A completer function. If strings is a fixed collection the function's
+        ``static`` attribute is True and static completion scripts may resolve its
+        completions without running the completion command.
     """
+    index: _StringIndex | None = None
+    expires = 0.0
+
+    def matches(incomplete: str) -> list[tuple[t.Any, str | None]]:
+        nonlocal index, expires
+        if not callable(strings):
+            if index is None:
+                index = _StringIndex(strings, case_sensitive)
+        elif ttl:
+            if index is None or monotonic() >= expires:
+                index = _StringIndex(strings(), case_sensitive)
+                expires = monotonic() + ttl
+        else:
+            # an index is not worth sorting for a single lookup
+            prefix = _key(incomplete, case_sensitive)
+            return [
+                (item, help)
+                for item, help in _item_tuples(strings())
+                if _key(item, case_sensitive).startswith(prefix)
+            ]
+        return index.match(incomplete)
 
     def complete(ctx: Context, param: Parameter, incomplete: str):
-        present = []
-        items = []
-        if (
-            not allow_duplicates
-            and param.name
-            and ctx.get_parameter_source(param.name) is not ParameterSource.DEFAULT
-        ):
-            present = [value for value in (ctx.params.get(param.name) or [])]
-
-        for item in strings() if callable(strings) else strings:
-            help = None
-            if isinstance(item, tuple):
-                item, help = str(item[0]), str(item[1])
-            if item.startswith(incomplete) and item not in present:
-                items.append(CompletionItem(item, help=help))
-        return items
+        present = set() if allow_duplicates else _present(ctx, param)
+        return _truncate(
+            [
+                CompletionItem(item, help=help)
+                for item, help in matches(incomplete)
+                if item not in present
+            ],
+            incomplete,
+            max_results,
+        )
+
+    complete.static = not callable(strings) and not isinstance(  # type: ignore[attr-defined]
+        strings, t.Generator
+    )
+    return complete
+
+
+def is_async(completer: t.Callable[..., t.Any]) -> bool:
+    """
+    :param completer: A completer function or callable object.
+    :return: True if the completer is a coroutine function or a callable object with
+        a coroutine ``__call__`` method.
+    """
+    return inspect.iscoroutinefunction(completer) or inspect.iscoroutinefunction(
+        type(completer).__call__
+    )
+
+
+@contextmanager
+def deadline(seconds: float | None = None) -> t.Iterator[None]:
+    """
+    A context manager that limits the time all of the completers run inside it may take
+    together. Nested deadlines can only shorten the time that remains.
+
+    :param seconds: The time budget, defaults to the ``DT_COMPLETION_DEADLINE``
+        setting. None means no limit.
+    """
+    seconds = completion_deadline() if seconds is None else seconds
+    due = _due.get()
+    if seconds is not None:
+        until = monotonic() + seconds
+        due = until if due is None else min(due, until)
+    token = _due.set(due)
+    try:
+        yield
+    finally:
+        _due.reset(token)
+
+
+def _items(results: t.Any) -> list[CompletionItem]:
+    # completers may return plain strings, click converts these the same way
+    results = list(results or [])
+    if results and isinstance(results[0], str):
+        return [CompletionItem(result) for result in results]
+    return results
+
+
+def _in_thread(
+    loop: asyncio.AbstractEventLoop, completer: Completer, *args: t.Any
+) -> asyncio.Future[t.Any]:
+    """
+    Run a synchronous completer on a daemon thread so that it can not keep the process
+    alive once its completions are no longer wanted.
+    """
+    future = loop.create_future()
+
+    def settle(result: t.Any, error: BaseException | None):
+        if not future.done():
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def run():
+        result, error = None, None
+        try:
+            result = completer(*args)
+        except BaseException as err:  # noqa: BLE001 - raised on the loop's thread
+            error = err
+        finally:
+            connections.close_all()
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # the deadline passed and the loop is closed
+
+    context = copy_context()
+    threading.Thread(target=context.run, args=(run,), daemon=True).start()
+    return future
+
+
+async def _run_concurrently(
+    completers: t.Sequence[Completer | AsyncCompleter],
+    ctx: Context,
+    param: Parameter,
+    incomplete: str,
+    timeout: float | None,
+) -> list[list[CompletionItem]]:
+    loop = asyncio.get_running_loop()
+    tasks = [
+        asyncio.ensure_future(t.cast(AsyncCompleter, cmpltr)(ctx, param, incomplete))
+        if is_async(cmpltr)
+        else _in_thread(loop, t.cast(Completer, cmpltr), ctx, param, incomplete)
+        for cmpltr in completers
+    ]
+    _, late = await asyncio.wait(tasks, timeout=timeout)
+    for task in late:
+        task.cancel()
+    await asyncio.gather(*late, return_exceptions=True)
+    return [[] if task in late else _items(task.result()) for task in tasks]
+
+
+def run_completers(
+    completers: t.Sequence[Completer | AsyncCompleter],
+    ctx: Context,
+    param: Parameter,
+    incomplete: str,
+) -> t.Iterator[list[CompletionItem]]:
+    """
+    Run the given completers and yield their completions in order. If none of them
+    are async they are run one after another as they are iterated over. Otherwise all
+    of them run at once - async completers on an event loop and synchronous completers
+    on threads - and completers that have not finished when the current
+    :func:`deadline` passes yield no completions.
+
+    :param completers: The completers to run.
+    :param ctx: The click context of the parameter being completed.
+    :param param: The parameter being completed.
+    :param incomplete: The incomplete value.
+    :return: An iterator over the completions of each completer.
+    """
+    if not any(is_async(cmpltr) for cmpltr in completers):
+        for cmpltr in completers:
+            yield _items(t.cast(Completer, cmpltr)(ctx, param, incomplete))
+        return
+    with deadline():
+        due = _due.get()
+        timeout = None if due is None else max(due - monotonic(), 0.0)
+        loop = asyncio.new_event_loop()
+        try:
+            yield from loop.run_until_complete(
+                _run_concurrently(completers, ctx, param, incomplete, timeout)
+            )
+        finally:
+            loop.close()
+
+
+def _blocking(completer: AsyncCompleter) -> Completer:
+    """
+    Click expects completers to return their completions. Wrap an async completer so
+    that it is run under the current :func:`deadline` when click calls it.
+    """
+
+    @wraps(completer)
+    def complete(ctx: Context, param: Parameter, incomplete: str):
+        return next(run_completers([completer], ctx, param, incomplete))
 
     return complete
 
 
 def chain(
-    completer: Completer,
-    *completers: Completer,
+    completer: Completer | AsyncCompleter,
+    *completers: Completer | AsyncCompleter,
     first_match: bool = False,
     allow_duplicates: bool = False,
+    max_results: int | None = None,
 ):
     """
     Run through the given completers and return the items from the first one, or all
@@ -109,36 +412,30 @@ def chain(
                 allow_duplicates=False
             )
 
+    If any of the completers are async all of them are run concurrently under the
+    current :func:`deadline`, see :func:`run_completers`.
+
     :param completer: The first completer to use (must be at least one!)
     :param completers: The completers to use
     :param first_match: If true, return only the matches from the first completer that
         finds completions. Default: False
     :param allow_duplicates: If False (default) remove completions from previously
         provided values.
+    :param max_results: The maximum number of completions to return. If there are
+        more an item that completes to the incomplete string and tells how many were
+        left out is added.
     """
 
     def complete(ctx: Context, param: Parameter, incomplete: str):
-        completions = []
-        present = []
-        if (
-            not allow_duplicates
-            and param.name
-            and ctx.get_parameter_source(param.name) is not ParameterSource.DEFAULT
-        ):
-            present = [value for value in (ctx.params.get(param.name) or [])]
-        for cmpltr in [completer, *completers]:
-            completions.extend(cmpltr(ctx, param, incomplete))
-            if first_match and completions:
+        completions: dict[t.Any, CompletionItem] = {}
+        present = set() if allow_duplicates else _present(ctx, param)
+        for items in run_completers([completer, *completers], ctx, param, incomplete):
+            for ci in items:
+                # eliminate duplicates
+                if ci.value and ci.value not in present:
+                    completions[ci.value] = ci
+            if first_match and items:
                 break
-
-        # eliminate duplicates
-        return list(
-            {
-                ci.value: ci
-                for ci in completions
-                if ci.value
-                if ci.value not in present
-            }.values()
-        )
+        return _truncate(list(completions.values()), incomplete, max_results)
 
     return complete
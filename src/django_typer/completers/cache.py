@@ -0,0 +1,258 @@
+"""
+Caches for completion results. Completing model objects runs a query on every
+``<tab>`` press. For large tables it can be worth caching the results of these
+queries between invocations. Pass a cache instance to
+:class:`~django_typer.completers.model.ModelObjectCompleter` (or
+:func:`~django_typer.utils.model_parser_completer`) to enable caching:
+
+.. code-block:: python
+
+    from django_typer.completers.cache import FileCompletionCache
+    from django_typer.utils import model_parser_completer
+
+    completions = FileCompletionCache(timeout=300)
+
+    class Command(TyperCommand):
+
+        def handle(
+            self,
+            polls: t.Annotated[
+                t.List[Poll],
+                typer.Argument(**model_parser_completer(Poll, cache=completions)),
+            ],
+        ):
+            ...
+
+Entries expire after the cache's timeout. They are also invalidated whenever a
+model instance of a cached table is saved or deleted in a process that is watching the
+model (see :meth:`~CompletionCache.watch`). Completers watch their models automatically,
+so saves and deletes made by management commands invalidate the cache. Updates made
+elsewhere, e.g. by your web server, are only seen after the timeout expires unless those
+processes also watch the model or call :meth:`~CompletionCache.invalidate`.
+
+.. note::
+
+    Changes made with :meth:`~django.db.models.query.QuerySet.update`, bulk operations
+    or raw SQL do not send signals and will only be seen after the timeout expires.
+"""
+
+import hashlib
+import json
+import os
+import time
+import typing as t
+from pathlib import Path
+from uuid import uuid4
+
+from django.db import models
+
+from django_typer.manifest import cache_dir, write_json
+
+__all__ = ["CompletionCache", "DjangoCompletionCache", "FileCompletionCache"]
+
+
+class CompletionCache:
+    """
+    The base class for completion caches. Subclasses need only implement
+    :meth:`get` and :meth:`set`.
+
+    :param timeout: The number of seconds completion results are cached for.
+    """
+
+    timeout: float = 60
+    """
+    The number of seconds completion results are cached for.
+    """
+
+    def __init__(self, timeout: float = timeout):
+        self.timeout = timeout
+
+    def get(self, key: str) -> t.Any:
+        """
+        Get the json serializable value stored under the given key.
+
+        :param key: The key of the value.
+        :return: The value, or None if there is no unexpired value.
+        """
+        raise NotImplementedError()
+
+    def set(self, key: str, value: t.Any, timeout: float | None) -> None:
+        """
+        Store a json serializable value under the given key.
+
+        :param key: The key of the value.
+        :param value: The value to store.
+        :param timeout: The number of seconds to keep the value for, or None to keep
+            it until it is replaced.
+        """
+        raise NotImplementedError()
+
+    def version(self, model: type[models.Model]) -> str:
+        """
+        Get the current version stamp of the given model's table.
+
+        :param model: The model class.
+        :return: The version stamp, this changes whenever the table is invalidated.
+        """
+        return self.get(f"version:{model._meta.db_table}") or ""
+
+    def invalidate(self, model: type[models.Model]) -> None:
+        """
+        Invalidate all cached completions of the given model's table.
+
+        :param model: The model class.
+        """
+        self.set(f"version:{model._meta.db_table}", uuid4().hex, None)
+
+    def watch(self, model: type[models.Model]) -> None:
+        """
+        Invalidate the cached completions of the given model's table whenever an
+        instance of the model is saved or deleted in this process.
+
+        :param model: The model class.
+        """
+        from django.db.models.signals import post_delete, post_save
+
+        for signal in (post_save, post_delete):
+            signal.connect(
+                self._changed,
+                sender=model,
+                dispatch_uid=f"django_typer.completions.{id(self)}.{model._meta.label}",
+            )
+
+    def _changed(self, sender: type[models.Model], **_) -> None:
+        self.invalidate(sender)
+
+    def key(self, model: type[models.Model], *parts: t.Any) -> str:
+        """
+        Build a cache key for a completion of the given model.
+
+        :param model: The model class.
+        :param parts: Everything else the completion results depend on.
+        :return: The cache key.
+        """
+        return hashlib.sha256(
+            "\0".join(
+                [model._meta.label, self.version(model), *(str(part) for part in parts)]
+            ).encode()
+        ).hexdigest()
+
+
+class FileCompletionCache(CompletionCache):
+    """
+    A completion cache that stores results in files on the local disk. This cache
+    requires no configuration and is shared by all processes of the current user.
+
+    Each entry is stored in its own file. When more than :attr:`max_entries` files
+    are stored, expired entries are removed and then the entries closest to
+    expiring, until a quarter of the room is free again.
+
+    :param timeout: The number of seconds completion results are cached for.
+    :param directory: The directory to store the cache files in. Defaults to a
+        ``django-typer/completions`` directory in the user's cache directory.
+    :param max_entries: The maximum number of entries to store.
+    """
+
+    directory: Path
+
+    max_entries: int = 1000
+    """
+    The maximum number of entries to store. Entries stored without a timeout, like the
+    version stamps of tables, are never removed to make room.
+    """
+
+    def __init__(
+        self,
+        timeout: float = CompletionCache.timeout,
+        directory: str | Path | None = None,
+        max_entries: int = max_entries,
+    ):
+        super().__init__(timeout=timeout)
+        self.directory = Path(directory) if directory else cache_dir("completions")
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> Path:
+        return self.directory / hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> t.Any:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if entry["expires"] is not None and entry["expires"] < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: t.Any, timeout: float | None) -> None:
+        try:
+            write_json(
+                self._path(key),
+                {
+                    "expires": None if timeout is None else time.time() + timeout,
+                    "value": value,
+                },
+            )
+            self._prune()
+        except OSError:
+            # a cache we can not write to is an empty cache
+            return
+
+    def _prune(self) -> None:
+        """
+        Make room if more than :attr:`max_entries` entries are stored. Entries of
+        superseded table versions are never read again, so they are only removed here.
+        """
+        with os.scandir(self.directory) as scan:
+            # entry files are named by the 64 character hex digests of their keys
+            paths = [Path(entry.path) for entry in scan if len(entry.name) == 64]
+        if len(paths) <= self.max_entries:
+            return
+        now = time.time()
+        timed = []
+        permanent = 0
+        for path in paths:
+            try:
+                expires = json.loads(path.read_text())["expires"]
+            except (OSError, ValueError, KeyError, TypeError):
+                expires = now
+            if expires is None:
+                permanent += 1
+                continue
+            if expires <= now:
+                path.unlink(missing_ok=True)
+            else:
+                timed.append((expires, path))
+        timed.sort()
+        keep = max(self.max_entries * 3 // 4 - permanent, 0)
+        for _, path in timed[: max(len(timed) - keep, 0)]:
+            path.unlink(missing_ok=True)
+
+
+class DjangoCompletionCache(CompletionCache):
+    """
+    A completion cache that stores results in one of your Django_
+    :doc:`caches <django:topics/cache>`. Use this cache to share results
+    across hosts or to invalidate them from processes that save models, like your web
+    server.
+
+    :param timeout: The number of seconds completion results are cached for.
+    :param alias: The alias of the cache in :setting:`CACHES` to use.
+    """
+
+    alias: str = "default"
+
+    def __init__(self, timeout: float = CompletionCache.timeout, alias: str = alias):
+        super().__init__(timeout=timeout)
+        self.alias = alias
+
+    def get(self, key: str) -> t.Any:
+        from django.core.cache import caches
+
+        return caches[self.alias].get(f"django_typer.completions.{key}")
+
+    def set(self, key: str, value: t.Any, timeout: float | None) -> None:
+        from django.core.cache import caches
+
+        caches[self.alias].set(f"django_typer.completions.{key}", value, timeout)
@@ -1,3 +1,4 @@
+import sys
 import typing as t
 from datetime import date, time, timedelta
 from functools import partial
@@ -6,15 +7,31 @@
 from click.core import ParameterSource
 from click.shell_completion import CompletionItem
 from django.conf import settings
+from django.core.checks import CheckMessage
+from django.core.exceptions import EmptyResultSet
 from django.db import models
 from django.db.models.query import QuerySet
 
+from django_typer.completers.cache import CompletionCache
 
-def int_ranges(incomplete: str, max_val: int) -> list[tuple[int, int]]:
+
+def int_ranges(incomplete: str, max_val: float) -> list[tuple[int, int]]:
+    """
+    Get the integer ranges that hold all of the integers that start with the given
+    incomplete string. Ranges that can not hold any values with a magnitude at or below
+    max_val are pruned.
+
+    :param incomplete: The incomplete integer string.
+    :param max_val: The largest magnitude of any value that may be matched.
+    :return: A list of (lower, upper) range tuples, lower is inclusive and upper is
+        exclusive for positive numbers and the reverse for negative numbers.
+    """
     lower = int(incomplete)
     neg = lower < 0
     lower = abs(lower)
     upper = abs(lower + 1)
+    if lower > max_val:
+        return []
     ranges = [(-upper, -lower)] if neg else [(lower, upper)]
     if not lower:
         # integers are never rendered with leading zeros, so 0 can only be
@@ -27,10 +44,30 @@ def int_ranges(incomplete: str, max_val: int) -> list[tuple[int, int]]:
     return ranges
 
 
+def _bounds(
+    queryset: QuerySet,
+    lookup_field: str,
+    completer: t.Optional["ModelObjectCompleter"] = None,
+) -> tuple[t.Any, t.Any]:
+    if completer:
+        return completer.bounds(queryset, lookup_field)
+    bounds = queryset.aggregate(
+        min=models.Min(lookup_field), max=models.Max(lookup_field)
+    )
+    return bounds["min"], bounds["max"]
+
+
+NO_MATCHES = models.Q(pk__in=[])
+"""
+A query that can not match anything. Django_ will not send it to the database.
+"""
+
+
 def int_query(
     incomplete: str,
     lookup_field: str,
     queryset: QuerySet,
+    completer: t.Optional["ModelObjectCompleter"] = None,
     **_,
 ) -> models.Q:
     """
@@ -44,16 +81,21 @@ def int_query(
     :param incomplete: The incomplete string.
     :param lookup_field: The name of the model field to use for lookup.
     :param queryset: The starting queryset to use to determine integer ranges.
+    :param completer: The completer to fetch the (cached) bounds of the field from.
     :return: A Q object to use for filtering the queryset.
     :raises ValueError: If the incomplete string is not a valid integer.
     :raises TypeError: If the incomplete string is not a valid integer.
     """
     qry = models.Q()
     neg = incomplete.startswith("-")
-    for lower, upper in int_ranges(
-        incomplete,
-        queryset.aggregate(models.Max(lookup_field))[f"{lookup_field}__max"],
-    ):
+    min_val, max_val = _bounds(queryset, lookup_field, completer)
+    bound = -min_val if neg and min_val is not None else max_val
+    if bound is None:
+        return NO_MATCHES
+    ranges = int_ranges(incomplete, bound)
+    if not ranges:
+        return NO_MATCHES
+    for lower, upper in ranges:
         qry |= models.Q(
             **{f"{lookup_field}__gt{'' if neg else 'e'}": lower}
         ) & models.Q(**{f"{lookup_field}__lt{'e' if neg else ''}": upper})
@@ -61,7 +103,11 @@ def int_query(
 
 
 def float_query(
-    incomplete: str, lookup_field: str, queryset: QuerySet, **_
+    incomplete: str,
+    lookup_field: str,
+    queryset: QuerySet,
+    completer: t.Optional["ModelObjectCompleter"] = None,
+    **_,
 ) -> models.Q:
     """
     The default completion query builder for float fields. This method will
@@ -74,6 +120,7 @@ def float_query(
     :param incomplete: The incomplete string.
     :param lookup_field: The name of the model field to use for lookup.
     :param queryset: The starting queryset to use to determine float ranges.
+    :param completer: The completer to fetch the (cached) bounds of the field from.
     :return: A Q object to use for filtering the queryset.
     :raises ValueError: If the incomplete string is not a valid float.
     :raises TypeError: If the incomplete string is not a valid float.
@@ -86,15 +133,69 @@ def float_query(
         )
     else:
         return int_query(
-            incomplete=incomplete, lookup_field=lookup_field, queryset=queryset
+            incomplete=incomplete,
+            lookup_field=lookup_field,
+            queryset=queryset,
+            completer=completer,
         )
     return models.Q(**{f"{lookup_field}__gte": lower}) & models.Q(
         **{f"{lookup_field}__lt": upper}
     )
 
 
+def prefix_range(prefix: str) -> tuple[str, str | None]:
+    """
+    Get the range of strings that start with the given prefix. Every string that starts
+    with the prefix is greater than or equal to the lower bound and less than the upper
+    bound.
+
+    :param prefix: The prefix string.
+    :return: A (lower, upper) tuple of strings, upper is None if there is no upper
+        bound.
+    """
+    successor = prefix.rstrip(chr(sys.maxunicode))
+    if not successor:
+        return prefix, None
+    return prefix, successor[:-1] + chr(ord(successor[-1]) + 1)
+
+
+_BINARY_COLLATIONS = {"sqlite": "BINARY", "postgresql": "C"}
+"""
+The collations that order strings by code point on the database backends prefix ranges
+are supported on, keyed by vendor.
+"""
+
+
+def _binary_collation(queryset: QuerySet | None, lookup_field: str) -> str | None:
+    """
+    :return: The collation prefix ranges must be compared under, an empty string if the
+        lookup field's collation is already binary or None if prefix ranges are not
+        supported on the queryset's database.
+    """
+    from django.db import connections
+
+    if queryset is None:
+        return None
+    vendor = connections[queryset.db].vendor
+    collation = _BINARY_COLLATIONS.get(vendor, None)
+    if collation is None:
+        return None
+    field_collation = getattr(
+        queryset.model._meta.get_field(lookup_field), "db_collation", None
+    )
+    if field_collation:
+        return "" if field_collation.upper() in {"BINARY", "C", "POSIX"} else collation
+    # SQLite columns are binary unless declared otherwise
+    return "" if vendor == "sqlite" else collation
+
+
 def text_query(
-    incomplete: str, lookup_field: str, case_insensitive: bool = False, **_
+    incomplete: str,
+    lookup_field: str,
+    case_insensitive: bool = False,
+    prefix_ranges: bool = False,
+    queryset: QuerySet | None = None,
+    **_,
 ) -> models.Q:
     """
     The default completion query builder for text-based fields. This method will
@@ -102,16 +203,53 @@ def text_query(
     string. Case sensitivity is determined by the case_insensitive constructor
     parameter.
 
-    **This query will utilize the database index if one exists.**
+    **This query will utilize the database index if one exists.** Case insensitive
+    prefix matches compile to ``UPPER(field) LIKE UPPER(prefix)`` which can not use
+    an index. If prefix_ranges is True, the match is bounded by a range predicate
+    (``>= prefix AND < successor``) that can use a plain index or, if case
+    insensitive, a functional index on ``Lower(field)``.
+
+    Ranges only hold every string with the prefix when strings are ordered by code
+    point, so they are compared under a binary collation. On SQLite the default
+    ``BINARY`` collation is used, on PostgreSQL the range is compared under the ``C``
+    collation (unless the field already has it) and the index must be defined with
+    ``Collate(..., "C")`` to be used. On other databases prefix ranges are not applied
+    and the plain prefix match is used. Case insensitive ranges are only applied to
+    ASCII prefixes because databases do not lower case other characters consistently.
 
     :param incomplete: The incomplete string.
     :param lookup_field: The name of the model field to use for lookup.
     :param case_insensitive: If the lookup should be case insensitive or not.
+    :param prefix_ranges: If the prefix match should be bounded by range predicates.
+    :param queryset: The queryset being completed, prefix ranges are only applied if
+        its database supports a binary collation.
     :return: A Q object to use for filtering the queryset.
     """
-    if case_insensitive:
-        return models.Q(**{f"{lookup_field}__istartswith": incomplete})
-    return models.Q(**{f"{lookup_field}__startswith": incomplete})
+    qry = models.Q(
+        **{f"{lookup_field}__{'i' if case_insensitive else ''}startswith": incomplete}
+    )
+    collation = (
+        _binary_collation(queryset, lookup_field)
+        # databases do not fold the case of non-ASCII characters the way python does
+        if prefix_ranges and (incomplete.isascii() or not case_insensitive)
+        else None
+    )
+    if collation is not None:
+        from django.db.models.functions import Collate, Lower
+        from django.db.models.lookups import GreaterThanOrEqual, LessThan
+
+        field: t.Any = models.F(lookup_field)
+        if case_insensitive:
+            field, incomplete = Lower(lookup_field), incomplete.lower()
+        if collation:
+            field = Collate(field, collation)
+        lower, upper = prefix_range(incomplete)
+        # the range narrows the scan to the index, the startswith filter keeps the
+        # database's own prefix matching semantics
+        qry = models.Q(GreaterThanOrEqual(field, lower)) & qry
+        if upper is not None:
+            qry = models.Q(LessThan(field, upper)) & qry
+    return qry
 
 
 def uuid_query(incomplete: str, lookup_field: str, **_) -> tuple[models.Q, int]:
@@ -260,7 +398,11 @@ def get_tz_part(dt_str: str) -> str:
 
 
 def duration_query(
-    incomplete: str, lookup_field: str, queryset: QuerySet, **_
+    incomplete: str,
+    lookup_field: str,
+    queryset: QuerySet,
+    completer: t.Optional["ModelObjectCompleter"] = None,
+    **_,
 ) -> models.Q:
     """
     Default completion query builder for duration fields. This method will return a
@@ -274,6 +416,7 @@ def duration_query(
     :param incomplete: The incomplete string.
     :param lookup_field: The name of the model field to use for lookup.
     :param queryset: The queryset to use to determine integer ranges.
+    :param completer: The completer to fetch the (cached) bounds of the field from.
     :return: A Q object to use for filtering the queryset.
     :raises ValueError: If the incomplete string is not a valid partial duration.
     :raises AssertionError: If the incomplete string is not a valid partial
@@ -292,19 +435,12 @@ def duration_query(
     if ambiguity and "T" not in incomplete and "D" not in incomplete:
         # days is unbounded
         # if days == 5, we want to match 5-<6, 50-<60, 500-<600, etc
-        max_val = (
-            queryset.filter(qry).aggregate(models.Min(lookup_field))[
-                f"{lookup_field}__min"
-            ]
-            if neg
-            else queryset.filter(qry).aggregate(models.Max(lookup_field))[
-                f"{lookup_field}__max"
-            ]
-        )
-        for lower, upper in int_ranges(
-            ambiguity,
-            max_val.days,
-        ):
+        min_val, max_val = _bounds(queryset, lookup_field, completer)
+        bound = abs(min_val) if neg and min_val is not None else max_val
+        ranges = int_ranges(ambiguity, bound.days) if bound is not None else []
+        if not ranges:
+            return NO_MATCHES
+        for lower, upper in ranges:
             qry |= models.Q(
                 **{f"{lookup_field}__gt{'' if neg else 'e'}": timedelta(days=lower)}
             ) & models.Q(
@@ -637,6 +773,18 @@ def handle(
     :param use_choices: Whether or not to use the field choices for completion. If True,
         matches to choice values coerced to strings will be returned. If False, the
         field's default query builder will be used instead.
+    :param cache: A :class:`~django_typer.completers.cache.CompletionCache` to store
+        completion results in. By default results are not cached. Custom query builders
+        must only depend on the incomplete string for their results to be cacheable.
+    :param bounds_timeout: The number of seconds to remember the minimum and maximum
+        values of the lookup field for. The bounds are used to prune impossible ranges
+        from numeric and duration queries. Saves and deletes of the model in this
+        process forget the bounds. Set to 0 to always query them.
+    :param prefix_ranges: Whether or not to bound text prefix matches by range
+        predicates so they can use an index. Case insensitive matches will use a
+        functional index on ``Lower(lookup_field)``. Ranges are only applied on SQLite
+        and PostgreSQL, where they are compared under a binary collation. See
+        :func:`~django_typer.completers.model.text_query`.
     """
 
     QueryBuilder = t.Callable[
@@ -655,8 +803,12 @@ def handle(
     # list per instance and this fallback is never mutated
     order_by: list[str] = []  # noqa: RUF012
     use_choices: bool = True
+    cache: CompletionCache | None = None
+    bounds_timeout: float = 60
+    prefix_ranges: bool = False
 
     _field: models.Field
+    _bounds: dict[tuple[str, str], tuple[float, tuple[t.Any, t.Any]]]
 
     @staticmethod
     def to_str(obj: t.Any) -> str:
@@ -690,9 +842,14 @@ def __init__(
         distinct: bool = distinct,
         order_by: str | t.Sequence[str] | None = order_by,
         use_choices: bool = use_choices,
+        cache: CompletionCache | None = cache,
+        bounds_timeout: float = bounds_timeout,
+        prefix_ranges: bool = prefix_ranges,
     ):
         import inspect
 
+        from django.db.models.signals import post_delete, post_save
+
         if inspect.isclass(model_or_qry) and issubclass(model_or_qry, models.Model):
             self.model_cls = model_or_qry
             self.queryset = model_or_qry.objects.all()
@@ -713,6 +870,14 @@ def __init__(
         if order_by:
             self.order_by = [order_by] if isinstance(order_by, str) else list(order_by)
         self.use_choices = use_choices
+        self.cache = cache
+        if self.cache:
+            self.cache.watch(self.model_cls)
+        self.bounds_timeout = bounds_timeout
+        self.prefix_ranges = prefix_ranges
+        self._bounds = {}
+        for signal in (post_save, post_delete):
+            signal.connect(self._forget_bounds, sender=self.model_cls)
 
         self._field = self.model_cls._meta.get_field(self.lookup_field)
         if query:
@@ -733,6 +898,7 @@ def __init__(
                 self.query = partial(
                     text_query,
                     case_insensitive=self.case_insensitive,
+                    prefix_ranges=self.prefix_ranges,
                 )
             elif isinstance(self._field, models.UUIDField):
                 self.query = uuid_query
@@ -768,6 +934,22 @@ def __call__(
         :return: A list of CompletionItem objects.
         """
 
+        excluded: list[models.Model] = []
+        if (
+            self.distinct
+            and parameter.name
+            and context.get_parameter_source(parameter.name)
+            is not ParameterSource.DEFAULT
+        ):
+            excluded = context.params.get(parameter.name, []) or []
+
+        key = None
+        if self.cache:
+            key = self._cache_key(incomplete, excluded)
+            cached = None if key is None else self.cache.get(key)
+            if cached is not None:
+                return [CompletionItem(value, help=hlp) for value, hlp in cached]
+
         completion_qry = models.Q(**{self.lookup_field + "__isnull": False})
 
         offset = 0
@@ -793,15 +975,6 @@ def __call__(
         if self.help_field:
             columns.append(self.help_field)
 
-        excluded: list[models.Model] = []
-        if (
-            self.distinct
-            and parameter.name
-            and context.get_parameter_source(parameter.name)
-            is not ParameterSource.DEFAULT
-        ):
-            excluded = context.params.get(parameter.name, []) or []
-
         qryset = self.queryset.filter(completion_qry).exclude(
             pk__in=[ex.pk for ex in excluded]
         )
@@ -820,4 +993,186 @@ def __call__(
                         help=values[1] if len(values) > 1 else None,
                     )
                 )
+        if self.cache and key:
+            self.cache.set(
+                key,
+                [
+                    [item.value, None if item.help is None else str(item.help)]
+                    for item in completions
+                ],
+                self.cache.timeout,
+            )
         return completions
+
+    def _cache_key(
+        self, incomplete: str, excluded: t.Sequence[models.Model]
+    ) -> str | None:
+        """
+        Build the cache key for a completion. The key depends on everything that the
+        completion results depend on.
+
+        :return: the cache key or None if the completion should not be cached because
+            its query is a callable object whose state can not be keyed
+        """
+        assert self.cache
+        query = self.query
+        keywords = {}
+        if isinstance(query, partial):
+            query, keywords = query.func, query.keywords
+        name = getattr(query, "__qualname__", None)
+        if name is None:
+            return None
+        try:
+            base = str(self.queryset.query)
+        except EmptyResultSet:
+            base = ""
+        return self.cache.key(
+            self.model_cls,
+            self.lookup_field,
+            self.help_field,
+            f"{query.__module__}.{name}",
+            sorted(keywords.items()),
+            base,
+            self.order_by,
+            self.limit,
+            sorted(str(ex.pk) for ex in excluded),
+            incomplete,
+        )
+
+    def bounds(self, queryset: QuerySet, lookup_field: str) -> tuple[t.Any, t.Any]:
+        """
+        Get the minimum and maximum values of the given field in the given queryset.
+        The bounds are remembered for :attr:`bounds_timeout` seconds and are stored in
+        the completion :attr:`cache` if there is one, so repeated completions do not
+        aggregate over the table each time.
+
+        :param queryset: The queryset to get the bounds of.
+        :param lookup_field: The field to get the bounds of.
+        :return: A (min, max) tuple, both are None if the queryset is empty.
+        """
+        import time
+
+        try:
+            sql = str(queryset.query)
+        except EmptyResultSet:
+            return None, None
+        memo = (lookup_field, sql)
+        now = time.monotonic()
+        expires, bounds = self._bounds.get(memo, (0, (None, None)))
+        if expires > now:
+            return bounds
+
+        field = queryset.model._meta.get_field(lookup_field)
+        key = None
+        if self.cache and self.bounds_timeout:
+            key = self.cache.key(self.model_cls, "bounds", lookup_field, sql)
+            cached = self.cache.get(key)
+            if cached is not None:
+                bounds = tuple(
+                    None if value is None else field.to_python(value)
+                    for value in cached
+                )
+                self._bounds[memo] = (now + self.bounds_timeout, bounds)
+                return bounds
+
+        aggregate = queryset.aggregate(
+            min=models.Min(lookup_field), max=models.Max(lookup_field)
+        )
+        bounds = (aggregate["min"], aggregate["max"])
+        if self.bounds_timeout:
+            self._bounds[memo] = (now + self.bounds_timeout, bounds)
+            if self.cache and key:
+                self.cache.set(
+                    key,
+                    [None if value is None else self.to_str(value) for value in bounds],
+                    self.bounds_timeout,
+                )
+        return bounds
+
+    def _forget_bounds(self, **_) -> None:
+        self._bounds.clear()
+
+    def check_index(self, obj: t.Any = None) -> list[CheckMessage]:
+        """
+        Check that the database can use an index to answer completion queries of the
+        lookup field. This check only inspects the model definition, indexes created
+        outside of Django_ migrations are not seen.
+
+        :param obj: The object to attribute check messages to, by default the
+            completer.
+        :return: A list of check warnings, empty if a usable index is defined.
+        """
+        from django.core.checks import Warning as CheckWarning
+        from django.db.models.functions import Collate, Lower
+
+        obj = self if obj is None else obj
+        meta = self.model_cls._meta
+        label = f"{meta.label}.{self.lookup_field}"
+        if (
+            self.case_insensitive
+            and isinstance(self.query, partial)
+            and self.query.func is text_query
+        ):
+            if not self.prefix_ranges:
+                return [
+                    CheckWarning(
+                        f"Case insensitive completions of {label} can not use an "
+                        "index.",
+                        hint="Pass prefix_ranges=True to the completer and add a "
+                        f"models.Index(Lower('{self.lookup_field}')) to "
+                        f"{meta.object_name}.Meta.indexes.",
+                        obj=obj,
+                        id="django_typer.W003",
+                    )
+                ]
+            leading = Lower(self.lookup_field)
+        else:
+            if (
+                self._field.primary_key
+                or self._field.unique
+                or self._field.db_index
+                or any(
+                    fields and fields[0] == self.lookup_field
+                    for fields in meta.unique_together
+                )
+            ):
+                return []
+            leading = models.F(self.lookup_field)
+
+        for index in [
+            *meta.indexes,
+            *(
+                constraint
+                for constraint in meta.constraints
+                if isinstance(constraint, models.UniqueConstraint)
+            ),
+        ]:
+            if getattr(index, "condition", None) is not None:
+                continue
+            if index.fields:
+                if index.fields[0].lstrip("-") == self.lookup_field and (
+                    leading == models.F(self.lookup_field)
+                ):
+                    return []
+                continue
+            if index.expressions:
+                expression = index.expressions[0]
+                if isinstance(expression, models.OrderBy):
+                    expression = expression.expression
+                if isinstance(expression, Collate):
+                    expression = expression.get_source_expressions()[0]
+                if expression == leading:
+                    return []
+        return [
+            CheckWarning(
+                f"Completions of {label} can not use an index.",
+                hint=(
+                    f"Add a models.Index(Lower('{self.lookup_field}')) to "
+                    f"{meta.object_name}.Meta.indexes."
+                    if isinstance(leading, Lower)
+                    else f"Set db_index=True on {label}."
+                ),
+                obj=obj,
+                id="django_typer.W002",
+            )
+        ]
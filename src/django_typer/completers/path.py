@@ -1,13 +1,74 @@
 import os
 import sys
 import typing as t
+from bisect import bisect_left
 from functools import partial
 from pathlib import Path
+from time import monotonic, time
 
 from click import Context, Parameter
 from click.shell_completion import CompletionItem
 from django.conf import settings
 
+from django_typer.manifest import VERSION, read_manifest, write_manifest
+
+from . import _truncate
+
+LISTING_TTL = 5.0
+"""
+The number of seconds a directory listing is reused for by the path completers, unless
+the directory is modified.
+"""
+
+LISTING_CACHE_SIZE = 64
+"""
+The maximum number of directory listings the path completers keep.
+"""
+
+MODULE_INDEX_TTL = 300.0
+"""
+The number of seconds an index of the modules in a package directory is reused for by
+the import path completer, unless the directory is modified. Subdirectories becoming or
+ceasing to be packages do not modify their parent directory, so they are only seen once
+the index expires.
+"""
+
+# directory -> (expires, mtime, [(name, is_dir), ...])
+_listings: dict[str, tuple[float, int, list[tuple[str, bool]]]] = {}
+
+
+def _listing(directory: Path) -> list[tuple[str, bool]]:
+    """
+    List the entries of a directory and whether or not each of them is a directory.
+    :func:`os.scandir` gets the entry types from the directory listing on most file
+    systems, so entries other than symbolic links are not stat'ed. Listings are cached
+    for :data:`LISTING_TTL` seconds or until the directory is modified.
+    """
+    key = os.fspath(directory)
+    try:
+        mtime = os.stat(key).st_mtime_ns
+    except OSError:
+        return []
+    now = monotonic()
+    cached = _listings.get(key, None)
+    if cached and cached[0] > now and cached[1] == mtime:
+        return cached[2]
+    entries = []
+    try:
+        with os.scandir(key) as scan:
+            for entry in scan:
+                try:
+                    entries.append((entry.name, entry.is_dir()))
+                except OSError:
+                    entries.append((entry.name, False))
+    except OSError:
+        return []
+    _listings.pop(key, None)
+    while len(_listings) >= LISTING_CACHE_SIZE:
+        _listings.pop(next(iter(_listings)), None)
+    _listings[key] = (now + LISTING_TTL, mtime, entries)
+    return entries
+
 
 def _settings_path(name: str) -> Path | None:
     s_pth = getattr(settings, name, None)
@@ -16,6 +77,47 @@ def _settings_path(name: str) -> Path | None:
     return None
 
 
+# sys.path entry -> {package directory: [mtime, expires, sorted module names]}
+_module_indexes: dict[str, dict[str, list[t.Any]]] = {}
+
+
+def _module_names(entry: str, package: Path) -> list[str]:
+    """
+    Get the sorted names of the modules and packages :func:`pkgutil.iter_modules`
+    finds in a package directory of a :data:`sys.path` entry. The names in each
+    directory are indexed the first time they are needed and the indexes of each entry
+    are persisted as a :mod:`manifest <django_typer.manifest>` so they can be reused by
+    later completions. An index is rebuilt when its directory is modified or after
+    :data:`MODULE_INDEX_TTL` seconds.
+
+    :param entry: The absolute :data:`sys.path` entry.
+    :param package: The path of the package directory relative to the entry.
+    :return: The sorted module names.
+    """
+    import pkgutil
+
+    directory = Path(entry) / package
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return []
+    # the extension modules that are importable depend on the interpreter
+    manifest = f"module-index:{sys.implementation.cache_tag}:{entry}"
+    version = f"{VERSION}:{sys.implementation.cache_tag}:{entry}"
+    index = _module_indexes.get(entry, None)
+    if index is None:
+        index = _module_indexes[entry] = read_manifest(manifest, version) or {}
+    key = package.as_posix()
+    now = time()
+    cached = index.get(key, None)
+    if cached and cached[0] == mtime and cached[1] > now:
+        return cached[2]
+    names = sorted({module.name for module in pkgutil.iter_modules([str(directory)])})
+    index[key] = [mtime, now + MODULE_INDEX_TTL, names]
+    write_manifest(manifest, version, index)
+    return names
+
+
 def import_paths(
     ctx: Context,
     param: Parameter,
@@ -31,8 +133,6 @@ def import_paths(
     :param root: The root path to search for modules.
     :return: A list of available matching import paths
     """
-    import pkgutil
-
     rt = root() if callable(root) else root
     incomplete = incomplete.strip()
     completions = []
@@ -40,21 +140,25 @@ def import_paths(
     pkg_complete = not incomplete or incomplete.endswith(".")
     module_import = ".".join(packages) if pkg_complete else ".".join(packages[:-1])
     module_path = Path(module_import.replace(".", "/"))
-    search_paths = []
 
     if rt and (rt / module_path).exists():
-        search_paths.append(str(rt / module_path))
+        entries = [rt]
     else:
-        for pth in sys.path:
-            if (Path(pth) / module_path).exists():
-                search_paths.append(str(Path(pth) / module_path))
+        entries = [Path(pth) for pth in sys.path]
 
     prefix = "" if pkg_complete else packages[-1]
-    for module in pkgutil.iter_modules(path=search_paths):
-        if module.name.startswith(prefix):
+    seen = set()
+    for entry in entries:
+        names = _module_names(os.path.abspath(entry), module_path)
+        for name in names[bisect_left(names, prefix) :]:
+            if not name.startswith(prefix):
+                break
+            if name in seen:
+                continue
+            seen.add(name)
             completions.append(
                 CompletionItem(
-                    f"{module_import}{'.' if module_import else ''}{module.name}",
+                    f"{module_import}{'.' if module_import else ''}{name}",
                     type="plain",
                 )
             )
@@ -69,10 +173,12 @@ def paths(
     incomplete: str,
     dir_only: bool | None = None,
     root: t.Callable[[], Path | None] | Path | None = None,
+    max_results: int | None = None,
 ) -> list[CompletionItem]:
     """
     A completer that completes a path. Relative incomplete paths are interpreted
-    relative to the current working directory.
+    relative to the current working directory. Directory listings are briefly cached,
+    see :data:`LISTING_TTL`.
 
     :param ctx: The click context.
     :param param: The click parameter.
@@ -80,6 +186,9 @@ def paths(
     :param dir_only: Restrict completions to paths to directories only, otherwise
         complete directories or files.
     :param root: Restrict completions to this root path.
+    :param max_results: The maximum number of paths to return. If there are more
+        matching paths an item that completes to the incomplete string and tells how
+        many were left out is added.
     :return: A list of available matching directories
     """
     rt = root() if callable(root) else root
@@ -109,42 +218,30 @@ def exists(pth: Path) -> bool:
         incomplete_path = incomplete_path.parent
     elif incomplete_path.is_file() and not dir_only:
         return [CompletionItem(incomplete, type="file")]
-    if incomplete_path.is_dir():
-        for child in os.listdir(incomplete_path):
-            if not exists(incomplete_path / child):
-                continue
-            if child.startswith(partial_dir):
-                to_complete = incomplete[0 : (-len(partial_dir) or None)]
-                sep = (
-                    ""
-                    if not to_complete or to_complete.endswith(separator)
-                    else separator
-                )
-                ctype = (
-                    "plain"
-                    if rt
-                    else "dir"
-                    if (incomplete_path / child).is_dir()
-                    else "file"
-                )
-                completions.append(
-                    CompletionItem(
-                        f"{to_complete}{sep}{child}",
-                        type=ctype,
-                    )
-                )
+    to_complete = incomplete[0 : (-len(partial_dir) or None)]
+    sep = "" if not to_complete or to_complete.endswith(separator) else separator
+    for child, is_dir in _listing(incomplete_path):
+        if (dir_only and not is_dir) or not child.startswith(partial_dir):
+            continue
+        completions.append(
+            CompletionItem(
+                f"{to_complete}{sep}{child}",
+                type="plain" if rt else "dir" if is_dir else "file",
+            )
+        )
     if (
         len(completions) == 1
-        and Path(completions[0].value).is_dir()
-        and [
-            child
-            for child in os.listdir(completions[0].value)
-            if exists(Path(completions[0].value) / child)
-        ]
+        and completions[0].type == "dir"
+        and any(
+            is_dir or not dir_only
+            for _name, is_dir in _listing(Path(completions[0].value))
+        )
     ):
         # recurse because we can go futher
-        return paths(ctx, param, completions[0].value, dir_only=dir_only)
-    return completions
+        return paths(
+            ctx, param, completions[0].value, dir_only=dir_only, max_results=max_results
+        )
+    return _truncate(completions, incomplete, max_results)
 
 
 directories = partial(paths, dir_only=True)
@@ -155,6 +252,7 @@ def exists(pth: Path) -> bool:
 :param ctx: The click context.
 :param param: The click parameter.
 :param incomplete: The incomplete string.
+:param max_results: The maximum number of paths to return.
 :return: A list of available matching directories
 """
 
@@ -168,6 +266,7 @@ def exists(pth: Path) -> bool:
 :param incomplete: The incomplete string.
 :param dir_only: Restrict completions to paths to directories only, otherwise
     complete directories or files.
+:param max_results: The maximum number of paths to return.
 :return: A list of available matching directories
 """
 
@@ -180,5 +279,6 @@ def exists(pth: Path) -> bool:
 :param incomplete: The incomplete string.
 :param dir_only: Restrict completions to paths to directories only, otherwise
     complete directories or files.
+:param max_results: The maximum number of paths to return.
 :return: A list of available matching directories
 """
@@ -36,3 +36,12 @@ def use_rich_tracebacks() -> bool:
     return rich_installed and (
         (isinstance(cfg, dict) and not cfg.get("no_install", False)) or cfg is True
     )
+
+
+def completion_deadline() -> float | None:
+    """
+    Return the number of seconds concurrently run completers may take to complete a
+    parameter value. Completers that have not finished by then are ignored so the
+    shell does not freeze. None means there is no limit.
+    """
+    return getattr(settings, "DT_COMPLETION_DEADLINE", 0.15)
@@ -0,0 +1,288 @@
+"""
+A minimal unix socket request/response channel used to keep a warm Django_ process
+around for latency sensitive invocations like shell completion.
+
+The client half of this module is run on every ``<tab>`` press by the installed shell
+completion scripts, so **this module must only import from the standard library** -
+importing Django_, click or Typer_ here would defeat the purpose:
+
+.. code-block:: bash
+
+    python -m django_typer.daemon --manage ./manage.py -- shellcompletion --shell zsh \\
+        complete "./manage.py mycommand --opt"
+
+If no daemon is listening, the client starts one in the background (using the manage
+script it was given) and exits with :data:`FALLBACK` so the caller can spawn the
+command the normal way. Subsequent requests are then answered by the warm process.
+
+Messages are single JSON documents. The client writes its request and shuts down the
+write half of the connection, the server replies with a JSON document and closes.
+"""
+
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import socket
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+import traceback
+import typing as t
+from pathlib import Path
+
+__all__ = ["FALLBACK", "request", "serve", "socket_path", "supported"]
+
+FALLBACK = 3
+"""
+The exit code the client returns when the request could not be answered by a daemon
+and the caller should invoke the command directly instead.
+"""
+
+supported = hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+"""
+True if unix sockets are available on this platform.
+"""
+
+SPAWN_GRACE = 30
+"""
+The number of seconds the client will wait for a daemon it started to come up before
+it will try to start another one.
+"""
+
+_FORWARDED = ("--settings", "--pythonpath")
+
+
+def socket_dir() -> Path:
+    """
+    Get the per-user directory sockets are created in. The directory is created if it
+    does not exist and must be owned by and only accessible to the current user.
+
+    :raises PermissionError: if the directory is accessible to other users
+    :return: the directory path
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    pth = Path(base) / f"django-typer-{os.getuid()}"
+    pth.mkdir(mode=0o700, exist_ok=True)
+    stat = pth.stat()
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+        raise PermissionError(f"{pth} must be owned by and private to the user.")
+    return pth
+
+
+def _resolve_script(manage: str) -> str:
+    """
+    Resolve the manage script from a command string. The script is the last token that
+    resolves to a file, either directly or through the user's path.
+    """
+    script = manage
+    for token in shlex.split(manage) or [manage]:
+        found = token if os.path.isfile(token) else shutil.which(token)
+        if found:
+            script = found
+    return os.path.realpath(script)
+
+
+def socket_path(manage: str, *key: str) -> Path:
+    """
+    Get the socket path for the given manage script command. Each manage script gets
+    its own daemon, regardless of how the script is invoked.
+
+    :param manage: the manage script command, e.g. ``./manage.py`` or
+        ``python manage.py``
+    :param key: any additional strings that should distinguish this daemon
+    :return: the path to the unix socket
+    """
+    digest = hashlib.sha256(
+        "\0".join([_resolve_script(manage), *key]).encode()
+    ).hexdigest()[:16]
+    return socket_dir() / f"{digest}.sock"
+
+
+def _recv(conn: socket.socket) -> dict[str, t.Any]:
+    chunks = []
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+    return json.loads(b"".join(chunks) or b"{}")
+
+
+def request(
+    path: Path, payload: dict[str, t.Any], timeout: float | None = None
+) -> dict[str, t.Any]:
+    """
+    Send a request to the daemon listening on the given socket and return its response.
+
+    :param path: the path to the unix socket
+    :param payload: the json serializable request
+    :param timeout: seconds to wait for a response
+    :raises OSError: if the daemon could not be reached
+    :return: the decoded response
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(str(path))
+        conn.sendall(json.dumps(payload).encode())
+        conn.shutdown(socket.SHUT_WR)
+        return _recv(conn)
+
+
+def serve(
+    path: Path,
+    handler: t.Callable[[dict[str, t.Any]], dict[str, t.Any]],
+    idle_timeout: float | None = None,
+) -> bool:
+    """
+    Answer requests on the given socket until the idle timeout expires or the handler
+    asks for a shutdown by including a truthy ``shutdown`` key in its response.
+    Requests are handled serially. If the handler raises, the error is printed to
+    stderr and the client is told to fall back to running the command directly.
+
+    :param path: the path of the unix socket to listen on
+    :param handler: a callable that accepts a request and returns a response
+    :param idle_timeout: shutdown after this many seconds without a request, if None
+        or 0 wait forever
+    :return: False if another daemon was already listening on the socket, True
+        otherwise
+    """
+    try:
+        request(path, {"ping": True}, timeout=1)
+        return False
+    except OSError:
+        path.unlink(missing_ok=True)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        # bind to a temporary name and move the socket into place once it is
+        # listening so that the socket path only ever names a usable socket
+        pending = path.with_suffix(f".{os.getpid()}")
+        pending.unlink(missing_ok=True)
+        umask = os.umask(0o177)
+        try:
+            sock.bind(str(pending))
+        finally:
+            os.umask(umask)
+        try:
+            sock.listen()
+            path.with_suffix(".lock").unlink(missing_ok=True)
+            os.replace(pending, path)
+        except BaseException:
+            pending.unlink(missing_ok=True)
+            raise
+        sock.settimeout(idle_timeout or None)
+        try:
+            while True:
+                try:
+                    conn, _ = sock.accept()
+                except TimeoutError:
+                    return True
+                with conn:
+                    conn.settimeout(None)
+                    try:
+                        req = _recv(conn)
+                    except (OSError, ValueError):
+                        continue
+                    try:
+                        response = {} if req.get("ping") else handler(req)
+                    except Exception:  # noqa: BLE001 - the daemon must stay up
+                        traceback.print_exc()
+                        response = {"fallback": True}
+                    if response.get("shutdown"):
+                        # the socket must be gone by the time the client is told
+                        path.unlink(missing_ok=True)
+                    try:
+                        conn.sendall(json.dumps(response).encode())
+                    except OSError:
+                        pass
+                    if response.get("shutdown"):
+                        return True
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def _spawn(manage: str, argv: list[str], path: Path) -> None:
+    """
+    Start a daemon in the background unless one has been started recently.
+    """
+    lock = path.with_suffix(".lock")
+    try:
+        if time.time() - lock.stat().st_mtime < SPAWN_GRACE:
+            return
+        lock.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+    except FileExistsError:
+        return
+    # run the daemon with the same command options as the request, up to the
+    # subcommand being invoked
+    prefix = argv[: argv.index("complete")] if "complete" in argv else argv[:1]
+    subprocess.Popen(  # nosec B603
+        [*shlex.split(manage), *prefix, "serve", "--socket", str(path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        env={**os.environ, "TYPER_USE_RICH": "0"},
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    The client entry point. Forward the command line after ``--`` to the daemon for
+    the given manage script and write its output. The output is only written if the
+    daemon successfully handled the request.
+
+    :param argv: the client's command line arguments
+    :return: the exit code, :data:`FALLBACK` if the caller should run the command
+        directly
+    """
+    import argparse
+
+    argv = sys.argv[1:] if argv is None else argv
+    forwarded: list[str] = []
+    if "--" in argv:
+        argv, forwarded = argv[: argv.index("--")], argv[argv.index("--") + 1 :]
+
+    parser = argparse.ArgumentParser(prog="python -m django_typer.daemon")
+    parser.add_argument("--manage", required=True)
+    parser.add_argument("--timeout", type=float, default=10)
+    parser.add_argument("--no-start", dest="start", action="store_false")
+    args = parser.parse_args(argv)
+
+    # the daemon is bound to its own settings and python path
+    if (
+        not supported
+        or not forwarded
+        or any(arg.startswith(_FORWARDED) for arg in forwarded)
+    ):
+        return FALLBACK
+    try:
+        path = socket_path(args.manage)
+    except OSError:
+        return FALLBACK
+    try:
+        response = request(
+            path,
+            {"argv": forwarded, "cwd": os.getcwd(), "env": dict(os.environ)},
+            timeout=args.timeout,
+        )
+    except OSError:
+        if args.start:
+            try:
+                _spawn(args.manage, forwarded, path)
+            except OSError:
+                pass
+        return FALLBACK
+    if response.get("fallback"):
+        return FALLBACK
+    status = int(response.get("status", 1))
+    if status == 0:
+        sys.stdout.write(response.get("stdout", ""))
+        sys.stderr.write(response.get("stderr", ""))
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import sys
 import typing as t
 from collections import deque
-from copy import copy, deepcopy
-from functools import cache, cached_property
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from copy import copy
+from functools import cached_property
 from importlib import import_module
 from pathlib import Path
 from types import MethodType, SimpleNamespace
+from weakref import WeakValueDictionary
 
 import click
 from click.shell_completion import CompletionItem
@@ -16,6 +21,8 @@
 from django.core.management.base import BaseCommand, CommandError
 from django.core.management.base import OutputWrapper as BaseOutputWrapper
 from django.core.management.color import Style as ColorStyle
+from django.db import connections
+from django.db.models import Model, QuerySet
 from django.utils.functional import Promise, classproperty
 
 from django_typer import patch
@@ -26,28 +33,44 @@
 import typer.core
 from typer.core import TyperCommand as CoreTyperCommand
 from typer.core import TyperGroup as CoreTyperGroup
-from typer.main import get_command as get_typer_command
+from typer.main import get_command as _get_typer_command
 from typer.main import get_params_convertors_ctx_param_name_from_function
 from typer.models import Context as TyperContext
 from typer.models import Default, DefaultPlaceholder
 
+from ..completers import _blocking, is_async
 from ..config import show_locals, traceback_config, use_rich_tracebacks
+from ..manifest import (
+    import_target,
+    param_from_schema,
+    param_schema,
+    read_manifest,
+    source_key,
+    target_module,
+    write_manifest,
+)
+from ..parsers.model import _bulk_lookups, _resolve_before
+from ..timings import Timer, timings_recorded
 from ..types import (
     ForceColor,
     HideLocals,
     NoColor,
     PythonPath,
+    ResultFormat,
     Settings,
     ShowLocals,
     SkipChecks,
+    Timings,
     Traceback,
     Verbosity,
     Version,
 )
 from ..utils import (
     _command_context,
+    _command_plugins,
     _load_command_plugins,
-    accepted_kwargs,
+    _plugin_paths,
+    _signature_info,
     called_from_command_definition,
     called_from_module,
     get_current_command,
@@ -67,12 +90,14 @@
     "DTCommand",
     "DTGroup",
     "DjangoTyperMixin",
+    "LazyCommand",
     "Typer",
     "TyperCommand",
     "callback",
     "command",
     "finalize",
     "get_command",
+    "get_typer_command",
     "group",
     "initialize",
 ]
@@ -233,6 +258,8 @@ def _common_options(  # pyright: ignore[reportRedeclaration]
     no_color: NoColor = False,
     force_color: ForceColor = False,
     skip_checks: SkipChecks = False,
+    timings: Timings = False,
+    result_format: ResultFormat = None,
 ) -> None:
     """
     Common django options.
@@ -253,6 +280,8 @@ def _normalize_suppressed_arguments(
             arg.lstrip("-").replace("-", "_")
             for arg in command.suppressed_base_arguments
         }
+    if not command.result_format_option:
+        suppressed.add("result_format")
     if not rich_installed or not use_rich_tracebacks():
         suppressed.update({"show_locals", "hide_locals"})
     else:
@@ -326,6 +355,12 @@ class Context(TyperContext):
     children: list[Context]
     _supplied_params: dict[str, t.Any]
 
+    defer_awaitables: bool = False
+    """
+    If True, awaitables returned by the callback of this context's command are
+    returned instead of run, so that chained subcommands can be gathered.
+    """
+
     parent: Context  # pyright: ignore[reportIncompatibleVariableOverride]
 
     class ParamDict(dict):
@@ -398,6 +433,30 @@ def __init__(
             parent.children.append(self)
 
 
+def _timer(ctx: click.Context | None) -> Timer | None:
+    """
+    Get the timer of the django command the given context is running, if any.
+    """
+    return getattr(getattr(ctx, "django_command", None), "timer", None)
+
+
+def _await(cmd: t.Any, value: t.Any) -> t.Any:
+    """
+    Run the value to completion if it is awaitable. Awaitables run on the event loop
+    of the given django command's invocation or on a new event loop if there is no
+    command.
+    """
+    if not inspect.isawaitable(value):
+        return value
+    if isinstance(cmd, TyperCommand):
+        return cmd.run_async(value)
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(value)
+    finally:
+        loop.close()
+
+
 class DjangoTyperMixin(with_typehint(CoreTyperGroup)):  # type: ignore[misc]
     """
     A mixin we use to add additional needed contextual awareness to click Commands
@@ -424,6 +483,23 @@ def is_method(self) -> bool | None:
             self._callback_is_method = is_method(self._callback)
         return self._callback_is_method
 
+    @property
+    def is_async(self) -> bool:
+        """True if the callback is a coroutine function."""
+        return inspect.iscoroutinefunction(inspect.unwrap(self._callback))
+
+    @cached_property
+    def _tree_params(self) -> list[click.Parameter]:
+        """
+        The parameters of this command and of all of its subcommands, depth first.
+        Compiled commands are discarded when their apps are modified so these are
+        only collected once per compiled command tree.
+        """
+        params = list(self.params)
+        for cmd in getattr(self, "commands", {}).values():
+            params.extend(getattr(cmd, "_tree_params", cmd.params))
+        return params
+
     class Converter:
         """
         Because of the way the BaseCommand forces parsing to be done in a separate
@@ -460,6 +536,27 @@ def get_params(self, ctx: click.Context) -> list[click.Parameter]:
             modified.append(param)
         return modified
 
+    def make_parser(self, ctx: click.Context) -> t.Any:
+        """
+        We override make_parser to time the splitting of the command line into
+        parameter values as the ``parse`` phase.
+        """
+        parser = super().make_parser(ctx)
+        timer = _timer(ctx)
+        if timer:
+            parser.parse_args = timer.timed("parse", parser.parse_args)
+        return parser
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """
+        We override parse_args to resolve model object lookups in bulk once all of the
+        parameters have been parsed. Time spent processing the parsed values is timed
+        as the ``convert`` phase.
+        """
+        timer = _timer(ctx)
+        with timer.phase("convert") if timer else nullcontext(), _bulk_lookups(ctx):
+            return super().parse_args(ctx, args)
+
     def shell_complete(
         self, ctx: click.Context, incomplete: str
     ) -> list[CompletionItem]:
@@ -503,26 +600,41 @@ def call_with_self(*args, **kwargs):
             if not callback:
                 return
             ctx = t.cast(Context, click.get_current_context())
-            return callback(
-                *args,
-                **{
-                    # we could call param.process_value() here to allow named
-                    # parameters to be passed as their unparsed string values,
-                    # we don't because this forces some weird idempotency on custom
-                    # parsers that might make errors more frequent for users and also
-                    # this would be inconsistent with call_command behavior for
-                    # BaseCommands which expect the parsed values to be passed by name.
-                    # Unparsed values can always be passed as argument strings.
-                    param: val
-                    for param, val in kwargs.items()
-                    if param in expected
-                },
-                **(
-                    {str(params[0].name): getattr(ctx, "django_command", None)}
-                    if self.is_method
-                    else {}
-                ),
-            )
+            timer = _timer(ctx)
+            with timer.phase("callbacks") if timer else nullcontext():
+                rv = callback(
+                    *args,
+                    **{
+                        # we could call param.process_value() here to allow named
+                        # parameters to be passed as their unparsed string values,
+                        # we don't because this forces some weird idempotency on
+                        # custom parsers that might make errors more frequent for
+                        # users and also this would be inconsistent with
+                        # call_command behavior for BaseCommands which expect the
+                        # parsed values to be passed by name. Unparsed values can
+                        # always be passed as argument strings.
+                        param: val
+                        for param, val in kwargs.items()
+                        if param in expected
+                    },
+                    **(
+                        {str(params[0].name): getattr(ctx, "django_command", None)}
+                        if self.is_method
+                        else {}
+                    ),
+                )
+                if getattr(ctx, "defer_awaitables", False):
+                    return rv
+                return _await(getattr(ctx, "django_command", None), rv)
+
+        # model lookups are resolved in bulk after parsing, but click calls parameter
+        # callbacks during parsing
+        for param in params:
+            if param.callback is not None:
+                param.callback = _resolve_before(param.callback)
+            complete = getattr(param, "_custom_shell_complete", None)
+            if complete is not None and is_async(complete):
+                param._custom_shell_complete = _blocking(complete)
 
         super().__init__(
             *args,
@@ -563,6 +675,12 @@ def handle(self):
     See :doc:`click:commands` for more information.
     """
 
+    independent: bool = False
+    """
+    True if this command does not depend on the other subcommands of a chained group,
+    so it may run concurrently with them if the group sets ``max_workers``.
+    """
+
 
 class DTGroup(DjangoTyperMixin, CoreTyperGroup):
     """
@@ -589,6 +707,12 @@ def grp(self):
     and :doc:`click:advanced` for more information.
     """
 
+    max_workers: int | None = None
+    """
+    If set on a chained group, :attr:`independent <DTCommand.independent>`
+    subcommands run concurrently on a pool of at most this many threads.
+    """
+
     def list_commands(self, ctx: click.Context) -> list[str]:
         """
         Do our best to list commands in definition order.
@@ -607,10 +731,12 @@ def invoke(self, ctx: click.Context) -> t.Any:
         the results list when chain=True and invoke_without_command=True. In Click's
         default implementation the group callback's return is discarded in chain mode;
         here we prepend it to the subcommand results so finalize handlers can see it.
+        Chained subcommands are also invoked concurrently if max_workers is set, see
+        :meth:`invoke_chain`.
 
         Hopefully this gets fixed upstream and we can remove this override.
         """
-        if not self.chain or not self.invoke_without_command:
+        if not self.chain or not (self.invoke_without_command or self.max_workers):
             return super().invoke(ctx)
 
         def _process_result(value: t.Any) -> t.Any:
@@ -624,6 +750,8 @@ def _process_result(value: t.Any) -> t.Any:
             ctx, "protected_args", None
         )
         if not prot_args:
+            if not self.invoke_without_command:
+                return super().invoke(ctx)
             with ctx:
                 group_rv = click.Command.invoke(self, ctx)
                 return _process_result([group_rv] if group_rv is not None else [])
@@ -654,11 +782,259 @@ def _process_result(value: t.Any) -> t.Any:
                 contexts.append(sub_ctx)
                 args, sub_ctx.args = sub_ctx.args, []
 
-            rv = [group_rv] if group_rv is not None else []
-            for sub_ctx in contexts:
-                with sub_ctx:
-                    rv.append(sub_ctx.command.invoke(sub_ctx))
-            return _process_result(rv)
+            rv = (
+                [group_rv]
+                if self.invoke_without_command and group_rv is not None
+                else []
+            )
+            return _process_result([*rv, *self.invoke_chain(contexts)])
+
+    def invoke_chain(self, contexts: list[click.Context]) -> list[t.Any]:
+        """
+        Invoke the chained subcommands of the given contexts. If max_workers is set,
+        :attr:`independent <DTCommand.independent>` subcommands run concurrently. Async
+        ones are gathered on the invocation's event loop and the others are submitted
+        to a thread pool. Subcommands that are not independent run on this thread once
+        all of the subcommands before them have finished, so the order of dependent
+        subcommands relative to everything else on the command line is kept.
+
+        :param contexts: The contexts of the subcommands in command line order.
+        :return: The results of the subcommands in command line order.
+        """
+        if not self.max_workers:
+            return [_invoke_context(sub_ctx) for sub_ctx in contexts]
+        results: list[t.Any] = [None] * len(contexts)
+        pending: dict[int, Future[t.Any]] = {}
+        deferred: dict[int, click.Context] = {}
+
+        def wait():
+            try:
+                if deferred:
+                    gathered = _await(
+                        getattr(contexts[0], "django_command", None),
+                        _gather(
+                            [_defer(sub_ctx) for sub_ctx in deferred.values()],
+                            t.cast(int, self.max_workers),
+                        ),
+                    )
+                    for idx, result in zip(deferred, gathered):
+                        results[idx] = result
+            finally:
+                for sub_ctx in deferred.values():
+                    sub_ctx.close()
+                deferred.clear()
+            for idx, future in pending.items():
+                results[idx] = future.result()
+            pending.clear()
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=self.name or "chain"
+        )
+        try:
+            for idx, sub_ctx in enumerate(contexts):
+                if not getattr(sub_ctx.command, "independent", False):
+                    wait()
+                    results[idx] = _invoke_context(sub_ctx)
+                elif getattr(sub_ctx.command, "is_async", False):
+                    deferred[idx] = sub_ctx
+                else:
+                    pending[idx] = pool.submit(_invoke_independent, sub_ctx)
+            wait()
+        finally:
+            pool.shutdown(cancel_futures=True)
+        return results
+
+
+def _invoke_context(ctx: click.Context) -> t.Any:
+    with ctx:
+        return ctx.command.invoke(ctx)
+
+
+def _defer(ctx: click.Context) -> t.Any:
+    """
+    Invoke a subcommand but return the awaitable its callback returns instead of
+    running it. The context is left open, it must be closed once the awaitable is done.
+    """
+    ctx.defer_awaitables = True  # type: ignore[attr-defined]
+    with ctx.scope(cleanup=False):
+        return ctx.command.invoke(ctx)
+
+
+async def _gather(awaitables: list[t.Any], limit: int) -> list[t.Any]:
+    """
+    Await the given awaitables concurrently, at most limit of them at a time. If any
+    of them fail, the first error is raised once all of them are done.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: t.Any) -> t.Any:
+        async with semaphore:
+            return await awaitable if inspect.isawaitable(awaitable) else awaitable
+
+    results = await asyncio.gather(
+        *(run(awaitable) for awaitable in awaitables), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def _invoke_independent(ctx: click.Context) -> t.Any:
+    """
+    Invoke a subcommand on a worker thread. The command instance is made current on
+    this thread and the database connections the subcommand opened on this thread are
+    closed when it finishes.
+    """
+    stack = _command_context.__dict__.setdefault("stack", [])
+    stack.append(getattr(ctx, "django_command", None))
+    try:
+        return _invoke_context(ctx)
+    finally:
+        stack.pop()
+        connections.close_all()
+
+
+class LazyCommand(DTCommand):
+    """
+    A stand in for a command whose function is not imported until the command is
+    invoked or its help is requested. Until then, the parameters and help of the
+    command come from a :mod:`manifest <django_typer.manifest>` written the last time
+    the function was imported, so helps of parent groups and shell completions never
+    import the function. Lazy commands are added with :meth:`Typer.lazy_command`.
+    """
+
+    import_path: str
+    """
+    The ``module:function`` import path of the command function.
+    """
+
+    command_cls: type[DTCommand] = DTCommand
+    """
+    The command class to use for the command once its function is imported.
+    """
+
+    command_info: typer.models.CommandInfo
+    pretty_exceptions_short: bool = True
+
+    described: bool = False
+    """
+    True if the parameters of this command are known, either from the manifest or
+    because the command function was imported.
+    """
+
+    _callback_is_method = False
+    _resolved: DTCommand | None = None
+    _manifest_key: str | None = None
+    _rich_markup_mode: typer.core.MarkupMode = DEFAULT_MARKUP_MODE
+
+    @property
+    def _callback(self) -> t.Callable[..., t.Any] | None:  # type: ignore[override]
+        return self.resolve()._callback
+
+    @_callback.setter
+    def _callback(self, _):
+        pass
+
+    def __init__(
+        self,
+        *args,
+        callback: t.Callable[..., t.Any] | None,
+        params: list[click.Parameter] | None = None,
+        help: str | None = None,
+        short_help: str | None = None,
+        rich_markup_mode: typer.core.MarkupMode = DEFAULT_MARKUP_MODE,
+        **kwargs: t.Any,
+    ):
+        self._rich_markup_mode = rich_markup_mode
+        resolved = type(self)._resolved
+        if resolved:
+            manifest = {
+                "help": resolved.help,
+                "short_help": resolved.short_help,
+                "params": [],
+            }
+            params = list(resolved.params)
+            self.described = True
+        else:
+            self._manifest_key = source_key(target_module(self.import_path))
+            manifest = read_manifest(self.import_path, self._manifest_key) or {}
+            self.described = bool(manifest)
+            params = [param_from_schema(prm) for prm in manifest.get("params", [])]
+        super().__init__(
+            *args,
+            callback=None,
+            params=params,
+            help=help or manifest.get("help", None),
+            short_help=short_help or manifest.get("short_help", None),
+            rich_markup_mode=rich_markup_mode,
+            **kwargs,
+        )
+
+    @cached_property
+    def _tree_params(self) -> list[click.Parameter]:
+        return self.params if self.described else self.resolve().params
+
+    def resolve(self) -> DTCommand:
+        """
+        Import the command function and build the real command.
+
+        :return: The real command.
+        """
+        cls = type(self)
+        if cls._resolved is None:
+            func = _strip_static(import_target(self.import_path))
+            info = copy(self.command_info)
+            info.callback = func
+            info.cls = type(
+                "_Command", (self.command_cls,), {"django_command": self.django_command}
+            )
+            cls._resolved = t.cast(
+                DTCommand,
+                typer.main.get_command_from_info(
+                    info,
+                    pretty_exceptions_short=self.pretty_exceptions_short,
+                    rich_markup_mode=self._rich_markup_mode,
+                ),
+            )
+            params = get_params_convertors_ctx_param_name_from_function(func)[0]
+            help, short_help = cls._resolved.help, cls._resolved.short_help
+            write_manifest(
+                self.import_path,
+                self._manifest_key,
+                {
+                    "help": str(help) if help is not None else None,
+                    "short_help": str(short_help) if short_help is not None else None,
+                    "params": [
+                        param_schema(param, target_module(self.import_path))
+                        for param in params[1 if is_method(func) else 0 :]
+                    ],
+                },
+            )
+        return cls._resolved
+
+    def make_context(
+        self,
+        info_name: str | None,
+        args: list[str],
+        parent: click.Context | None = None,
+        **extra: t.Any,
+    ) -> click.Context:
+        """
+        Contexts made for shell completion use the parameters from the manifest, all
+        other contexts are made by the real command.
+        """
+        if extra.get("resilient_parsing", False) or getattr(
+            parent, "resilient_parsing", False
+        ):
+            return super().make_context(info_name, args, parent=parent, **extra)
+        return self.resolve().make_context(info_name, args, parent=parent, **extra)
+
+    def get_help(self, ctx: click.Context) -> str:
+        """
+        Helps are rendered by the real command.
+        """
+        return self.resolve().get_help(ctx)
 
 
 # staticmethod objects are not picklable which causes problems with deepcopy
@@ -682,22 +1058,47 @@ def __init__(self, finalizer: t.Callable[P, R]):
         self.finalizer = finalizer
         self.is_method = bool(is_method(finalizer))
 
+    def bind(self, cmd: TyperCommand | None) -> t.Callable[..., R]:
+        """
+        Precompile a call of this finalizer for the given command instance. The
+        keyword arguments the finalizer accepts are only resolved once.
+
+        :param cmd: The django command instance to bind to if the finalizer is a
+            method.
+        :return: A callable that invokes the finalizer with its accepted keyword
+            arguments.
+        """
+        finalizer = (
+            MethodType(self.finalizer, cmd) if self.is_method else self.finalizer
+        )
+        signature = _signature_info(self.finalizer)
+        accepted = None if signature.var_kwargs else set(signature.params)
+        timer = getattr(cmd, "timer", None)
+
+        def invoke(*args, **kwargs) -> R:
+            if accepted is not None:
+                kwargs = {k: v for k, v in kwargs.items() if k in accepted}
+            with timer.phase("finalize") if timer else nullcontext():
+                return finalizer(*args, **kwargs)
+
+        return invoke
+
     def __call__(
         self,
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> R:
-        if self.is_method:
-            cmd = kwargs.pop("_command", None) or (
-                getattr(
-                    t.cast(Context, click.get_current_context(silent=True)),
-                    "django_command",
-                    None,
-                )
-                or get_current_command()
+        cmd = kwargs.pop("_command", None) or (
+            getattr(
+                t.cast(Context, click.get_current_context(silent=True)),
+                "django_command",
+                None,
             )
-            args = [cmd, *args]  # type: ignore
-        return self.finalizer(*args, **accepted_kwargs(self.finalizer, kwargs))
+            or get_current_command()
+        )
+        if isinstance(cmd, TyperCommand):
+            return _await(cmd, cmd._invoker(self)(*args, **kwargs))
+        return _await(cmd, self.bind(cmd)(*args, **kwargs))
 
 
 @t.overload  # pragma: no cover
@@ -767,6 +1168,7 @@ def _cache_finalizer(callback: t.Callable[..., t.Any]):
     def register(cmd: type[TyperCommand]):
         finalizer = Finalizer(_strip_static(callback))
         cmd.typer_app.info.result_callback = finalizer
+        cmd.typer_app.invalidate()
 
     setattr(callback, _CACHE_KEY, register)
 
@@ -873,6 +1275,9 @@ class Typer(typer.Typer, t.Generic[P, R], metaclass=AppFactory):
     :param chain: whether to chain commands, this allows multiple commands from the
         group to be specified and run in order sequentially in one call from the command
         line.
+    :param max_workers: if chain is set, run the subcommands marked independent
+        concurrently on at most this many threads - see
+        :attr:`DTGroup.max_workers`.
     :param result_callback: a callback to invoke with the result of the command
     :param context_settings: the click context settings to use - see
         :class:`click.Context`.
@@ -921,6 +1326,19 @@ class Typer(typer.Typer, t.Generic[P, R], metaclass=AppFactory):
 
     is_method: bool | None = None
     top_level: bool = False
+    max_workers: int | None = None
+
+    _click_command: click.Command | None = None
+
+    # name -> node indexes, see _index() and _bfs_match()
+    _name_index: (
+        tuple[
+            dict[str, typer.models.CommandInfo | Typer | Finalizer],
+            dict[str, typer.models.CommandInfo | Typer],
+        ]
+        | None
+    ) = None
+    _bfs_index: WeakValueDictionary[str, t.Any] | None = None
 
     @property
     def django_command(self) -> type[TyperCommand] | None:
@@ -929,6 +1347,91 @@ def django_command(self) -> type[TyperCommand] | None:
     @django_command.setter
     def django_command(self, cmd: type[TyperCommand] | None):
         self._django_command = cmd
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Discard the compiled click command and name indexes of this app and of all of
+        its parents. This is called whenever the app is modified and only needs to be
+        called directly if the registered commands, groups or their info objects are
+        modified by hand.
+        """
+        app: Typer | None = self
+        while app is not None:
+            app.__dict__.pop("_click_command", None)
+            app.__dict__.pop("_name_index", None)
+            app.__dict__.pop("_bfs_index", None)
+            app = app.parent
+
+    def __getstate__(self) -> dict[str, t.Any]:
+        # copies (e.g. of inherited groups) must compile their own click commands
+        # and build their own indexes
+        state = self.__dict__.copy()
+        state.pop("_click_command", None)
+        state.pop("_name_index", None)
+        state.pop("_bfs_index", None)
+        return state
+
+    def _index(
+        self,
+    ) -> tuple[
+        dict[str, typer.models.CommandInfo | Typer | Finalizer],
+        dict[str, typer.models.CommandInfo | Typer],
+    ]:
+        """
+        Get the name indexes of this level of the app tree. The indexes are built on
+        first use and discarded by :meth:`invalidate`.
+
+        :return: A 2-tuple of the names this level resolves to during breadth first
+            searches - this app, its commands and its finalizer, where the most recently
+            registered command wins - and the names of the commands and groups
+            registered on this app, where the first registered command or group wins.
+        """
+        if self._name_index is None:
+            level: dict[str, typer.models.CommandInfo | Typer | Finalizer] = {}
+            members: dict[str, typer.models.CommandInfo | Typer] = {}
+            if isinstance(self.info.result_callback, Finalizer):
+                level[self.info.result_callback.name] = self.info.result_callback
+            level.update(dict.fromkeys(_names(self), self))
+            for cmd in self.registered_commands:
+                assert cmd.callback
+                level.update(dict.fromkeys(_names(cmd), cmd))
+            for grp in reversed(self.registered_groups):
+                cmd_grp = t.cast(Typer, grp.typer_instance)
+                assert cmd_grp
+                members.update(dict.fromkeys(_names(cmd_grp), cmd_grp))
+            for cmd in reversed(self.registered_commands):
+                members.update(dict.fromkeys(_names(cmd), cmd))
+            self._name_index = (level, members)
+        return self._name_index
+
+    def _fork(self, parent: Typer | None = None) -> Typer[P, R]:
+        """
+        Make a copy-on-write copy of this app tree for an inheriting command. Each
+        group in the tree gets its own :class:`Typer` node so it can be modified
+        without affecting this tree, but the command and callback info objects are
+        shared with this tree. Decorators only ever append or replace info objects,
+        so shared info objects must never be modified in place.
+
+        :param parent: The parent app of the copy.
+        :return: The copied app.
+        """
+        fork = copy(self)
+        fork.parent = parent
+        fork.info = copy(self.info)
+        fork.registered_commands = list(self.registered_commands)
+        fork.registered_groups = [
+            self._fork_group(grp, fork) for grp in self.registered_groups
+        ]
+        return fork
+
+    @staticmethod
+    def _fork_group(
+        grp: typer.models.TyperInfo, parent: Typer
+    ) -> typer.models.TyperInfo:
+        grp = copy(grp)
+        grp.typer_instance = t.cast(Typer, grp.typer_instance)._fork(parent)
+        return grp
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
         return super().__call__(*args, **kwargs)
@@ -946,15 +1449,9 @@ def __get__(self, obj, _=None) -> Typer[P, R]:
         return self
 
     def __getattr__(self, name: str) -> t.Any:
-        for cmd in self.registered_commands:
-            assert cmd.callback
-            if name in _names(cmd):
-                return cmd
-        for grp in self.registered_groups:
-            cmd_grp = t.cast(Typer, grp.typer_instance)
-            assert cmd_grp
-            if name in _names(cmd_grp):
-                return cmd_grp
+        # guard against lookups before the app is initialized (e.g. when copying)
+        if "info" in self.__dict__ and (found := self._index()[1].get(name)):
+            return found
         raise AttributeError(
             f"{self.__class__.__name__} object has no attribute {name}"
         )
@@ -968,6 +1465,7 @@ def __init__(
         no_args_is_help: bool = Default(False),
         subcommand_metavar: str | None = Default(None),
         chain: bool = Default(False),
+        max_workers: int | None = None,
         result_callback: t.Callable[..., t.Any] | None = Default(None),
         # Command
         context_settings: dict[t.Any, t.Any] | None = Default(None),
@@ -994,6 +1492,7 @@ def __init__(
         assert not args  # should have been removed by metaclass
         self.parent = parent
         self._django_command = django_command
+        self.max_workers = max_workers
         self.top_level = kwargs.pop("top_level", False)
         typer_app = kwargs.pop("typer_app", None)
         callback = _strip_static(callback)
@@ -1003,7 +1502,12 @@ def __init__(
         super().__init__(
             name=name,
             cls=type(
-                "_DTGroup", (cls or DTGroup,), {"django_command": self.django_command}
+                "_DTGroup",
+                (cls or DTGroup,),
+                {
+                    "django_command": self.django_command,
+                    **({"max_workers": max_workers} if max_workers else {}),
+                },
             ),
             invoke_without_command=invoke_without_command,
             no_args_is_help=no_args_is_help,
@@ -1032,7 +1536,9 @@ def __init__(
         if typer_app:
             self.registered_callback = typer_app.registered_callback
             self.registered_commands = copy(typer_app.registered_commands)
-            self.registered_groups = deepcopy(typer_app.registered_groups)
+            self.registered_groups = [
+                self._fork_group(grp, self) for grp in typer_app.registered_groups
+            ]
             self.rich_help_panel = (
                 typer_app.rich_help_panel
                 if isinstance(self.rich_help_panel, DefaultPlaceholder)
@@ -1050,6 +1556,7 @@ def callback(  # type: ignore
         no_args_is_help: bool = Default(False),
         subcommand_metavar: str | None = Default(None),
         chain: bool = Default(False),
+        max_workers: int | None = None,
         result_callback: t.Callable[..., t.Any] | None = Default(None),
         # Command
         context_settings: dict[t.Any, t.Any] | None = Default(None),
@@ -1073,6 +1580,7 @@ def make_callback(
             func: typer.models.CommandFunctionType,
         ) -> typer.models.CommandFunctionType:
             self.is_method = is_method(func)
+            workers = max_workers or self.max_workers
             self.registered_callback = typer.models.TyperInfo(
                 cls=type(
                     "_Initializer",
@@ -1080,6 +1588,7 @@ def make_callback(
                     {
                         "django_command": self.django_command,
                         "common_init": self.parent is None,
+                        **({"max_workers": workers} if workers else {}),
                     },
                 ),
                 invoke_without_command=invoke_without_command,
@@ -1102,6 +1611,7 @@ def make_callback(
                 rich_help_panel=rich_help_panel,
                 **kwargs,
             )
+            self.invalidate()
             return _check_static(func)
 
         return make_callback
@@ -1124,6 +1634,7 @@ def command(  # type: ignore
         deprecated: bool = False,
         # Rich settings
         rich_help_panel: str | None = Default(None),
+        independent: bool = False,
         **kwargs: t.Any,
     ) -> t.Callable[[t.Callable[P2, R2]], t.Callable[P2, R2]]:
         """
@@ -1170,14 +1681,22 @@ def command1(self):
         :param deprecated: show a deprecation warning
         :param rich_help_panel: the rich help panel to use - if rich is installed
             this can be used to group commands into panels in the help output.
+        :param independent: whether the command may run concurrently with the other
+            subcommands of a chained group - see :attr:`DTCommand.independent`.
         """
 
         def make_command(func: t.Callable[P2, R2]) -> t.Callable[P2, R2]:
+            self.invalidate()
             return _check_static(
                 super(Typer, self).command(
                     name=name,
                     cls=type(
-                        "_Command", (cls,), {"django_command": self.django_command}
+                        "_Command",
+                        (cls,),
+                        {
+                            "django_command": self.django_command,
+                            **({"independent": True} if independent else {}),
+                        },
                     ),
                     context_settings=context_settings,
                     help=t.cast(str, help),
@@ -1195,6 +1714,98 @@ def make_command(func: t.Callable[P2, R2]) -> t.Callable[P2, R2]:
 
         return make_command
 
+    def lazy_command(
+        self,
+        import_path: str,
+        name: str | None = None,
+        *,
+        cls: type[DTCommand] = DTCommand,
+        context_settings: dict[t.Any, t.Any] | None = None,
+        help: str | Promise | None = None,
+        epilog: str | None = None,
+        short_help: str | Promise | None = None,
+        options_metavar: str | None = Default(None),
+        add_help_option: bool = True,
+        no_args_is_help: bool = False,
+        hidden: bool = False,
+        deprecated: bool = False,
+        # Rich settings
+        rich_help_panel: str | None = Default(None),
+        **kwargs: t.Any,
+    ) -> None:
+        """
+        Add a command to this group by the import path of its function. The function
+        is only imported when the command is invoked or its help is requested. The help
+        of this group and shell completions use a manifest of the command's parameters
+        and help that is cached the first time the function is imported, so commands
+        with expensive imports do not slow down the rest of the command tree.
+
+        .. code-block:: python
+
+            class Command(TyperCommand):
+
+                @group()
+                def reports(self):
+                    pass
+
+                reports.lazy_command("reports.cli:export")
+
+        The function may be a plain function or take the django command instance as
+        its first ``self`` argument. The other parameters are the same as
+        :meth:`Typer.command`.
+
+        :param import_path: the import path of the command function in
+            ``module:function`` form
+        :param name: the name of the command (defaults to the name of the function)
+        :param cls: the command class to use
+        :param context_settings: the context settings to use - see
+            :class:`click.Context`
+        :param help: the help string to use, defaults to the function docstring
+        :param epilog: the epilog to use in the help output
+        :param short_help: the short help to use in the help output
+        :param options_metavar: the metavar to use for options in the help output
+        :param add_help_option: whether to add the help option to the command
+        :param no_args_is_help: whether to show the help if no arguments are provided
+        :param hidden: whether to hide the command from help output
+        :param deprecated: show a deprecation warning
+        :param rich_help_panel: the rich help panel to use - if rich is installed
+            this can be used to group commands into panels in the help output.
+        """
+        func_name = import_path[len(target_module(import_path)) + 1 :].split(".")[-1]
+
+        def lazy(*args, **kwargs):
+            return import_target(import_path)(*args, **kwargs)
+
+        lazy.__name__ = lazy.__qualname__ = func_name
+        lazy.__doc__ = None
+        super().command(
+            name=name or typer.main.get_command_name(func_name),
+            context_settings=context_settings,
+            help=t.cast(str, help),
+            epilog=epilog,
+            short_help=t.cast(str, short_help),
+            options_metavar=options_metavar,
+            add_help_option=add_help_option,
+            no_args_is_help=no_args_is_help,
+            hidden=hidden,
+            deprecated=deprecated,
+            rich_help_panel=rich_help_panel,
+            **kwargs,
+        )(lazy)
+        info = self.registered_commands[-1]
+        info.cls = type(
+            "_LazyCommand",
+            (LazyCommand,),
+            {
+                "django_command": self.django_command,
+                "import_path": import_path,
+                "command_cls": cls,
+                "command_info": info,
+                "pretty_exceptions_short": self.pretty_exceptions_short,
+            },
+        )
+        self.invalidate()
+
     def add_typer(  # type: ignore
         self,
         typer_instance: Typer,
@@ -1237,6 +1848,7 @@ def add_typer(  # type: ignore
             else typer_instance.info.cls
         )
 
+        self.invalidate()
         return super().add_typer(
             typer_instance=typer_instance,
             name=name,
@@ -1381,6 +1993,7 @@ def finalize(self):
         def create_finalizer(func: t.Callable[P2, R2]) -> t.Callable[P2, R2]:
             func = _strip_static(func)
             self.info.result_callback = Finalizer(func)
+            self.invalidate()
             return func
 
         return create_finalizer
@@ -1403,9 +2016,7 @@ def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
         if isinstance(self.proxied, Typer) and not self.proxied.parent:
             # if we're calling a top level Typer app we need invoke Typer's call
             return self.proxied(*args, **kwargs)
-        elif isinstance(self.proxied, Finalizer):
-            return self.proxied(*args, _command=self.command, **kwargs)
-        return _get_direct_function(self.command, self.proxied)(*args, **kwargs)
+        return self.command._invoker(self.proxied)(*args, **kwargs)
 
     def __getattr__(self, name: str) -> t.Any:
         """
@@ -1429,6 +2040,24 @@ def __getattr__(self, name: str) -> t.Any:
         )
 
 
+def get_typer_command(typer_app: typer.Typer) -> click.Command:
+    """
+    Get the click command for the given Typer_ app. Building the click command
+    hierarchy is expensive, so the command is compiled once and cached on our
+    :class:`Typer` apps until they are modified.
+
+    :param typer_app: the Typer_ app to get the click command for
+    :return: the compiled click command
+    """
+    if isinstance(typer_app, BoundProxy):
+        typer_app = typer_app.proxied
+    if isinstance(typer_app, Typer):
+        if typer_app._click_command is None:
+            typer_app._click_command = _get_typer_command(typer_app)
+        return typer_app._click_command
+    return _get_typer_command(typer_app)
+
+
 def initialize(
     *,
     cls: type[DTGroup] = DTGroup,
@@ -1689,6 +2318,8 @@ def other_command(self):
     :param deprecated: show a deprecation warning
     :param rich_help_panel: the rich help panel to use - if rich is installed
         this can be used to group commands into panels in the help output.
+    :param independent: whether the command may run concurrently with the other
+        subcommands of a chained group - see :attr:`DTCommand.independent`.
     """
 
     def make_command(func: t.Callable[P, R]) -> t.Callable[P, R]:
@@ -1788,6 +2419,9 @@ def subcommand(self):
     :param chain: whether to chain commands, this allows multiple commands from the
         group to be specified and run in order sequentially in one call from the command
         line.
+    :param max_workers: if chain is set, run the subcommands marked independent
+        concurrently on at most this many threads - see
+        :attr:`DTGroup.max_workers`.
     :param result_callback: a callback to invoke with the result of the command
     :param context_settings: the click context settings to use - see
         :class:`click.Context`
@@ -1880,6 +2514,8 @@ def _resolve_help(dj_cmd: TyperCommand):
         if dj_cmd.typer_app.registered_callback:
             cb = dj_cmd.typer_app.registered_callback
             if not cb.help and not cb.callback.__doc__:
+                # info objects may be shared with other commands - copy on write
+                type(dj_cmd).typer_app.registered_callback = cb = copy(cb)
                 cb.help = hlp
         else:
             cmd = (
@@ -1888,6 +2524,7 @@ def _resolve_help(dj_cmd: TyperCommand):
                 else None
             )
             if cmd and not cmd.help and not cmd.callback.__doc__:
+                type(dj_cmd).typer_app.registered_commands[0] = cmd = copy(cmd)
                 cmd.help = hlp
             elif not dj_cmd.typer_app.info.help:
                 dj_cmd.typer_app.info.help = hlp
@@ -1897,7 +2534,12 @@ def _resolve_help(dj_cmd: TyperCommand):
         and dj_cmd.typer_app.registered_commands
         and not dj_cmd.typer_app.registered_commands[0].help
     ):
-        dj_cmd.typer_app.registered_commands[0].help = dj_cmd.typer_app.info.help
+        cmd = copy(dj_cmd.typer_app.registered_commands[0])
+        cmd.help = dj_cmd.typer_app.info.help
+        type(dj_cmd).typer_app.registered_commands[0] = cmd
+    else:
+        return
+    dj_cmd.typer_app.invalidate()
 
 
 def _names(tc: typer.models.CommandInfo | Typer) -> set[str]:
@@ -1924,36 +2566,55 @@ def _names(tc: typer.models.CommandInfo | Typer) -> set[str]:
     return names
 
 
-@cache
+def _tree_snapshot(app: Typer) -> dict[str, t.Any]:
+    """
+    Get a mapping of the space separated command paths of the given app's command tree
+    to values that change when the group or command at the path is redefined.
+    """
+    snapshot: dict[str, t.Any] = {}
+
+    def walk(grp: Typer, path: tuple[str, ...]) -> None:
+        snapshot[" ".join(path)] = (
+            id(grp),
+            id(getattr(grp.registered_callback, "callback", None)),
+            id(grp.info.result_callback),
+        )
+        for cmd in grp.registered_commands:
+            assert cmd.callback
+            name = cmd.name or typer.main.get_command_name(cmd.callback.__name__)
+            snapshot[" ".join((*path, name))] = id(cmd.callback)
+        for info in grp.registered_groups:
+            child = t.cast(Typer, info.typer_instance)
+            name = info.name if not isinstance(info.name, DefaultPlaceholder) else None
+            walk(child, (*path, str(name or child.info.name)))
+
+    walk(app.proxied if isinstance(app, BoundProxy) else app, ())
+    return snapshot
+
+
 def _bfs_match(
     app: Typer, name: str
 ) -> typer.models.CommandInfo | Typer | Finalizer | None:
     """
-    Perform a breadth first search for a command or group by name.
+    Perform a breadth first search for a command or group by name. Each level of the
+    search is a lookup in the level's name index and results are remembered on the
+    app until it or one of its descendants is modified. Results are only weakly
+    referenced so they do not keep removed commands and groups alive.
 
     :param app: The Typer app to search.
     :param name: The name of the command or group to search for.
     :return: The command or group if found, otherwise None.
     """
-
-    def find_at_level(
-        lvl: Typer,
-    ) -> typer.models.CommandInfo | Typer | Finalizer | None:
-        for cmd in reversed(lvl.registered_commands):
-            if name in _names(cmd):
-                return cmd
-        if name in _names(lvl):
-            return lvl
-
-        if (
-            isinstance(lvl.info.result_callback, Finalizer)
-            and lvl.info.result_callback.name == name
-        ):
-            return lvl.info.result_callback
-        return None
+    if isinstance(app, BoundProxy):
+        app = app.proxied
 
     # fast exit out if at top level (most searches - avoid building BFS)
-    if found := find_at_level(app):
+    if found := app._index()[0].get(name):
+        return found
+
+    if app._bfs_index is None:
+        app._bfs_index = WeakValueDictionary()
+    elif found := app._bfs_index.get(name):
         return found
 
     bfs_order: list[Typer] = []
@@ -1973,8 +2634,8 @@ def find_at_level(
                 queue.append(child_app)
 
     for grp in bfs_order[1:]:
-        found = find_at_level(grp)
-        if found:
+        if found := grp._index()[0].get(name):
+            app._bfs_index[name] = found
             return found
     return None
 
@@ -2003,6 +2664,9 @@ class TyperCommandMeta(type):
     :param chain: whether to chain commands, this allows multiple commands from the
         group to be specified and run in order sequentially in one call from the command
         line.
+    :param max_workers: if chain is set, run the subcommands marked independent
+        concurrently on at most this many threads - see
+        :attr:`DTGroup.max_workers`.
     :param result_callback: a callback to invoke with the result of the command
     :param context_settings: the click context settings to use - see
         :class:`click.Context`
@@ -2209,8 +2873,7 @@ def get_ctor(attr: t.Any) -> t.Callable[..., t.Any] | None:
 
             for grp in set(_defined_groups.values()):
                 if grp.top_level:
-                    cpy = deepcopy(grp)
-                    cpy.parent = typer_app
+                    cpy = grp._fork(typer_app)
                     typer_app.add_typer(
                         cpy,
                         name=cpy.info.name,
@@ -2270,6 +2933,7 @@ def __init__(self, cls_name, bases, attrs, **kwargs):
             cls.typer_app.info.name = (
                 cls.typer_app.info.name or cls.__module__.rsplit(".", maxsplit=1)[-1]
             )
+            cls.typer_app.invalidate()
             for cmd in getattr(cls, "_to_register", []):
                 cmd(cls)
 
@@ -2353,8 +3017,7 @@ def children(self) -> dict[str, CommandNode]:
     def callback(self) -> t.Callable[..., t.Any]:
         """Get the function for this command or group"""
         assert self.click_command._callback
-        return _get_direct_function(
-            self.django_command,
+        return self.django_command._invoker(
             self.click_command._callback.__wrapped__,  # pyright: ignore[reportFunctionMemberAccess]
         )
 
@@ -2463,7 +3126,6 @@ def option_strings(self) -> list[str]:
             """
             return []
 
-    _actions: list[t.Any]
     _mutually_exclusive_groups: t.ClassVar[list[t.Any]] = []
 
     django_command: TyperCommand
@@ -2471,20 +3133,34 @@ def option_strings(self) -> list[str]:
     subcommand: str
 
     def __init__(self, django_command: TyperCommand, prog_name, subcommand):
-        self._actions = []
         self.django_command = django_command
         self.prog_name = prog_name
         self.subcommand = subcommand
-        self.tree = self.django_command.command_tree
-        self.tree.context.info_name = f"{self.prog_name} {self.subcommand}"
 
-        def populate_params(node: CommandNode) -> None:
-            for param in node.click_command.params:
-                self._actions.append(self.Action(param))
-            for child in node.children.values():
-                populate_params(child)
+    @cached_property
+    def tree(self) -> CommandNode:
+        """
+        The root node of the command tree, only built when helps are printed.
+        """
+        tree = self.django_command.command_tree
+        tree.context.info_name = f"{self.prog_name} {self.subcommand}"
+        return tree
 
-        populate_params(self.tree)
+    @cached_property
+    def _actions(self) -> list[t.Any]:
+        """
+        call_command uses the actions to map keyword arguments to parameters. They are
+        only collected when needed because lazy commands without a manifest must be
+        imported to know their parameters. No contexts are made - the parameters are
+        read off of the compiled command tree.
+        """
+        self.django_command._load_plugins()
+        return [
+            self.Action(param)
+            for param in t.cast(
+                DjangoTyperMixin, get_typer_command(self.django_command.typer_app)
+            )._tree_params
+        ]
 
     def print_help(self, *command_path: str):
         """
@@ -2511,7 +3187,8 @@ def parse_args(self, args=None, namespace=None) -> _ParsedArgs:
             (this is ignored for TyperCommands but is required by the django
             base class)
         """
-        with self.django_command:
+        with self.django_command, self.django_command.timer.phase("parse"):
+            self.django_command._load_plugins(list(args or []))
             cmd = get_typer_command(self.django_command.typer_app)
             with cmd.make_context(
                 info_name=f"{self.prog_name} {self.subcommand}",
@@ -2717,6 +3394,44 @@ def command2(self, option: t.Optional[str] = None):
     print_result: bool = True
     """Turn on/off automatic write to stdout of results returned by command"""
 
+    stream_results: bool = False
+    """
+    Stream iterator results, like those of generators, to stdout as they are produced
+    instead of returning them, see :meth:`stream_result`.
+    """
+
+    stream_querysets: bool = False
+    """
+    Stream :class:`~django.db.models.query.QuerySet` results from
+    :meth:`~django.db.models.query.QuerySet.iterator` instead of evaluating them all at
+    once, see :meth:`stream_result`.
+    """
+
+    stream_chunk_size: int = 2000
+    """
+    The number of result items to write and flush to stdout at a time when results are
+    streamed, also the chunk size queryset results are fetched with.
+    """
+
+    result_format: str | None = None
+    """
+    The format to write results in if ``--format`` is not given, see
+    :mod:`django_typer.serializers`. If None results are written as text.
+    """
+
+    result_format_option: bool = False
+    """Add the common ``--format`` option that selects the format results are written in"""
+
+    timer: Timer
+    """
+    Records the time spent in each phase of the command, see
+    :mod:`django_typer.timings`.
+    """
+
+    _invokers: dict[t.Any, t.Callable[..., t.Any]]
+    _event_loop: asyncio.AbstractEventLoop | None = None
+    _executing: bool = False
+
     _handle: t.Callable[..., t.Any]
     _traceback: bool = False
     _help_kwarg: str | None = Default(None)
@@ -2879,6 +3594,7 @@ def collect(self, ...):
         def make_finalizer(func: t.Callable[P2, R2]) -> t.Callable[P2, R2]:
             setattr(cls, func.__name__, func)
             cls.typer_app.info.result_callback = Finalizer(_strip_static(func))
+            cls.typer_app.invalidate()
             return func
 
         return make_finalizer
@@ -3123,6 +3839,35 @@ def _name(self) -> str:
         """The name of the django command"""
         return self.typer_app.info.name or self.__module__.rsplit(".", maxsplit=1)[-1]
 
+    def _invoker(
+        self, node: TyperFunction | Finalizer | t.Callable[..., t.Any]
+    ) -> t.Callable[..., t.Any]:
+        """
+        Get the callable that directly invokes the function of the given command, group
+        or finalizer bound to this command instance. Whether the function is a method
+        and the keyword arguments it accepts are resolved on first use and the
+        invoker is cached on this instance, so repeated direct calls do not pay for
+        them again.
+
+        :param node: The command or group info, finalizer or function to invoke.
+        :return: The invoker.
+        """
+        # group callbacks may be replaced, so group invokers are keyed on them
+        key = (
+            getattr(node.registered_callback, "callback", node.info.callback)
+            if isinstance(node, Typer)
+            else node
+        )
+        try:
+            return self._invokers[key]
+        except KeyError:
+            invoker = self._invokers[key] = (
+                node.bind(self)
+                if isinstance(node, Finalizer)
+                else _get_direct_function(self, node)
+            )
+            return invoker
+
     def __enter__(self):
         _command_context.__dict__.setdefault("stack", []).append(self)
         return self
@@ -3166,9 +3911,12 @@ def __init__(
         **kwargs: t.Any,
     ):
         assert self.typer_app.info.name
-        _load_command_plugins(self.typer_app.info.name)
-        _add_common_initializer(self)
-        _resolve_help(self)
+        self.timer = Timer()
+        self._invokers = {}
+        self._load_plugins(())
+        with self.timer.phase("common_initializer"):
+            _add_common_initializer(self)
+            _resolve_help(self)
 
         self.force_color = force_color
         self.no_color = no_color
@@ -3205,8 +3953,56 @@ def get_subcommand(self, *command_path: str) -> CommandNode:
         :return: the command node at the given path
         :raises LookupError: if no group or command exists at the given path
         """
+        self._load_plugins(command_path)
         return self.command_tree.get_command(*command_path)
 
+    def _load_plugins(
+        self, args: t.Sequence[str] | None = None, complete: bool = False
+    ) -> None:
+        """
+        Load the :ref:`plugins <plugins>` of this command that define or override the
+        groups and commands named on the given command line. Plugins without a manifest
+        are always loaded.
+
+        :param args: the command line after the command name, if not given all
+            plugins are loaded
+        :param complete: True if the command line is being completed, plugins that
+            define commands the next argument may complete to are also loaded
+        """
+        name = t.cast(str, self.typer_app.info.name)
+        tokens = set(args or [])
+
+        def descended(parent: list[str]) -> bool:
+            # does the command line name a group or command below the parent?
+            cmd: t.Any = get_typer_command(self.typer_app)
+            for part in parent:
+                cmd = getattr(cmd, "commands", {}).get(part, None)
+            children = set(getattr(cmd, "commands", {}))
+            for paths in _plugin_paths(name).values():
+                children.update(
+                    path.split()[-1]
+                    for path in paths or []
+                    if path.split()[:-1] == parent
+                )
+            return bool(children & tokens)
+
+        def needed(paths: list[str]) -> bool:
+            for path in paths:
+                parts = path.split()
+                if set(parts) <= tokens or (
+                    complete and set(parts[:-1]) <= tokens and not descended(parts[:-1])
+                ):
+                    return True
+            return False
+
+        with self.timer.phase("plugins"):
+            if _load_command_plugins(
+                name,
+                needed if args is not None else None,
+                snapshot=lambda: _tree_snapshot(self.typer_app),
+            ):
+                self.typer_app.invalidate()
+
     def __init_subclass__(cls, **_):
         """Avoid passing typer arguments up the subclass init chain"""
         return super().__init_subclass__()
@@ -3223,7 +4019,7 @@ def create_parser(  # pyright: ignore[reportIncompatibleMethodOverride]
         :param prog_name: the name of the manage script that invoked the command
         :param subcommand: the name of the django command
         """
-        with self:
+        with self, self.timer.phase("create_parser"):
             if getattr(self, "_called_from_command_line", False):
                 script = get_usage_script(prog_name)
                 if isinstance(script, Path):
@@ -3245,6 +4041,7 @@ def print_help(self, prog_name: str, subcommand: str, *cmd_path: str):
             typer/click have different helps for each subgroup or subcommand.
         """
         with self:
+            self._load_plugins()
             self.create_parser(prog_name, subcommand).print_help(*cmd_path)
 
     def __getattr__(self, name: str) -> t.Any:
@@ -3253,14 +4050,15 @@ def __getattr__(self, name: str) -> t.Any:
         and return that command or group if the attribute name matches the command/group
         function OR its registered CLI name.
         """
-        init = getattr(
-            self.typer_app.registered_callback,
-            "callback",
-            self.typer_app.info.callback,
-        )
+        app = type(self).typer_app  # the app itself, not a BoundProxy
+        init = getattr(app.registered_callback, "callback", app.info.callback)
         if init and init and name == init.__name__:
             return BoundProxy(self, init)
-        found = _bfs_match(self.typer_app, name)
+        found = _bfs_match(app, name)
+        if not found and not name.startswith("_") and app.info.name in _command_plugins:
+            # the command or group may be defined by a plugin that is not loaded
+            self._load_plugins()
+            found = _bfs_match(app, name)
         if found:
             return BoundProxy(self, found)
         raise AttributeError(
@@ -3330,25 +4128,152 @@ def _run(self, *args, **options):
             resolves to.
         :return: t.Any object returned by the Typer app
         """
-        with self:
-            result = self.typer_app(
-                args=args,
-                standalone_mode=False,
-                supplied_params=options,
-                django_command=self,
-                complete_var=None,
-                prog_name=f"{sys.argv[0]} {self.typer_app.info.name}",
-            )
-            if not self.is_compound_command and isinstance(
-                self.typer_app.info.result_callback, Finalizer
-            ):
-                # result callbacks are not called on singular commands by click/typer
-                #  we do that here to keep our interface consistent
-                result = self.typer_app.info.result_callback(
-                    result, **options, _command=self
+        try:
+            with self, self.timer.phase("invoke"):
+                result = self.typer_app(
+                    args=args,
+                    standalone_mode=False,
+                    supplied_params=options,
+                    django_command=self,
+                    complete_var=None,
+                    prog_name=f"{sys.argv[0]} {self.typer_app.info.name}",
                 )
-            self.stdout.disable = not self.print_result
+                if not self.is_compound_command and isinstance(
+                    self.typer_app.info.result_callback, Finalizer
+                ):
+                    # result callbacks are not called on singular commands by
+                    # click/typer we do that here to keep our interface consistent
+                    result = self.typer_app.info.result_callback(
+                        result, **options, _command=self
+                    )
+                self.stdout.disable = not self.print_result
+            result_format = options.get("result_format", None) or self.result_format
+            if self._executing and self.print_result and result_format:
+                self.serialize_result(result, result_format)
+                return None
+            if (
+                self._executing
+                and self.print_result
+                and not self.output_transaction
+                and (
+                    (self.stream_results and isinstance(result, Iterator))
+                    or (self.stream_querysets and isinstance(result, QuerySet))
+                )
+            ):
+                # write the items as they are produced instead of letting execute()
+                # write the result all at once
+                self.stream_result(result)
+                return None
             return result
+        finally:
+            self._close_event_loop()
+
+    def stream_result(self, result: t.Iterable[t.Any]):
+        """
+        Write the items of a result to stdout, one per line, as they are produced.
+        Items are formatted with :meth:`format_item` and written and flushed
+        :attr:`stream_chunk_size` items at a time, so only one chunk of the result is
+        held in memory at once. :class:`~django.db.models.query.QuerySet` results are
+        fetched with :meth:`~django.db.models.query.QuerySet.iterator`.
+
+        When a command run from the command line or with
+        :func:`~django.core.management.call_command` returns an iterator (e.g. a
+        generator) and :attr:`stream_results` is set, or a
+        :class:`~django.db.models.query.QuerySet` and :attr:`stream_querysets` is set,
+        the result is streamed this way and None is returned in its place.
+
+        :param result: The iterable result to write.
+        """
+        if isinstance(result, QuerySet):
+            result = result.iterator(chunk_size=self.stream_chunk_size)
+        chunk: list[str] = []
+        for item in result:
+            chunk.append(self.format_item(item))
+            if len(chunk) >= self.stream_chunk_size:
+                self.stdout.write("\n".join(chunk))
+                self.stdout.flush()
+                chunk.clear()
+        if chunk:
+            self.stdout.write("\n".join(chunk))
+            self.stdout.flush()
+
+    def serialize_result(self, result: t.Any, result_format: str):
+        """
+        Write a result to stdout in the given format using the
+        :class:`~django_typer.serializers.ResultSerializer` registered for it. Iterable
+        results are written an item at a time and the stream is flushed every
+        :attr:`stream_chunk_size` items. :class:`~django.db.models.query.QuerySet`
+        results are fetched with :meth:`~django.db.models.query.QuerySet.iterator`.
+
+        Results are serialized this way instead of being written as text when
+        ``--format`` is given or :attr:`result_format` is set, and None is returned in
+        their place.
+
+        :param result: The result to write.
+        :param result_format: The name of the format to write the result in.
+        :raises CommandError: If the format is unknown or needs a binary stdout that
+            is not available.
+        """
+        from ..serializers import serializers
+
+        serializer_class = serializers.get(result_format, None)
+        if serializer_class is None:
+            raise CommandError(f"Unknown result format: {result_format}")
+        stream = self.stdout._out
+        if serializer_class.binary:
+            stream = getattr(stream, "buffer", None)
+            if stream is None:
+                raise CommandError(
+                    f"The {result_format} format must be written to a binary stream."
+                )
+            self.stdout.flush()
+        if isinstance(result, QuerySet):
+            result = result.iterator(chunk_size=self.stream_chunk_size)
+        elif result is None:
+            result = ()
+        elif isinstance(result, (str, bytes, dict, Model)) or not isinstance(
+            result, t.Iterable
+        ):
+            result = (result,)
+        serializer = serializer_class(stream)
+        for count, item in enumerate(result, start=1):
+            serializer.write(item)
+            if not count % self.stream_chunk_size:
+                stream.flush()
+        serializer.close()
+
+    def format_item(self, item: t.Any) -> str:
+        """
+        Format an item of a streamed result for output, see :meth:`stream_result`.
+        Override this method to change how items are written.
+
+        :param item: The result item.
+        :return: The string to write for the item, a newline is added.
+        """
+        return str(item)
+
+    def run_async(self, awaitable: t.Awaitable[R2]) -> R2:
+        """
+        Run the awaitable to completion on the event loop of the current invocation of
+        this command. Async command, group, initializer and finalizer functions are run
+        this way, so all of the async functions of an invocation share one event loop.
+        The loop is created when it is first needed and closed when the invocation
+        finishes.
+
+        :param awaitable: The awaitable to run.
+        :return: The result of the awaitable.
+        """
+        if self._event_loop is None or self._event_loop.is_closed():
+            self._event_loop = asyncio.new_event_loop()
+        return self._event_loop.run_until_complete(awaitable)
+
+    def _close_event_loop(self):
+        loop, self._event_loop = self._event_loop, None
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
 
     def run_from_argv(self, argv):
         """
@@ -3387,8 +4312,9 @@ def execute(self, *args, **options):
             self.force_color = options["force_color"]
         if options.get("skip_checks", None) is not None:
             self.skip_checks = options["skip_checks"]
+        executing, self._executing = self._executing, True
         try:
-            with self:
+            with self, self.timer.phase("output"):
                 # base class requires force_color, no_color and skip_checks to be
                 # present - we allow them to be suppressed
                 return super().execute(
@@ -3401,9 +4327,34 @@ def execute(self, *args, **options):
                     },
                 )
         finally:
+            self._executing = executing
             self.no_color = no_color
             self.force_color = force_color
             self.skip_checks = skip_checks
+            self.report_timings(show=bool(options.get("timings", False)))
+
+    def check(self, *args, **kwargs):
+        """
+        Wrap the :meth:`~django.core.management.BaseCommand.check` method to time the
+        system checks as the ``checks`` phase.
+        """
+        with self.timer.phase("checks"):
+            return super().check(*args, **kwargs)
+
+    def report_timings(self, show: bool = False):
+        """
+        Send the :data:`~django_typer.timings.timings_recorded` signal with the phase
+        timings recorded by :attr:`timer` and reset the timer. Override this method to
+        change how timings are reported.
+
+        :param show: print the timings to stderr, True if ``--timings`` was
+            given
+        """
+        timings = self.timer.as_dict(command=self._name)
+        timings_recorded.send(sender=self.__class__, command=self, timings=timings)
+        if show:
+            self.stderr.write(self.timer.render(), style_func=lambda msg: msg)
+        self.timer.reset()
 
     def echo(self, message: t.Any | None = None, nl: bool = True, err: bool = False):
         """
@@ -17,6 +17,13 @@
 :class:`~django_typer.management.TyperCommand`. To promote compatibility with other
 management command libraries or custom completion logic, a fallback completion function
 can also be specified.
+
+Because every ``<tab>`` press runs ``shellcompletion complete`` in a fresh process, the
+cost of bootstrapping Django_ is paid on each completion. Completion scripts installed
+with ``--daemon`` will instead ask a warm
+:func:`~django_typer.management.commands.shellcompletion.Command.serve` process for
+completions over a per-user unix socket and fall back to spawning the process if no
+daemon is available.
 """
 
 import contextlib
@@ -35,16 +42,23 @@
     CompletionItem,
     split_arg_string,  # pyright: ignore[reportPrivateImportUsage]
 )
-from django.core.management import CommandError, ManagementUtility
+from django.conf import settings
+from django.core.management import CommandError, ManagementUtility, get_commands
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 from shellingham import ShellDetectionFailure
 from typer import Argument, Option
-from typer.main import get_command as get_typer_command
 
+from django_typer import daemon
 from django_typer.completers import these_strings
 from django_typer.completers.path import import_paths
-from django_typer.management import TyperCommand, command, get_command, initialize
+from django_typer.management import (
+    TyperCommand,
+    command,
+    get_command,
+    get_typer_command,
+    initialize,
+)
 from django_typer.shells import _completers
 from django_typer.types import COMMON_PANEL
 from django_typer.utils import detect_shell, get_usage_script, get_win_shell
@@ -336,6 +350,32 @@ def install(
                 ),
             ),
         ] = True,
+        use_daemon: t.Annotated[
+            bool,
+            Option(
+                "--daemon",
+                help=t.cast(
+                    str,
+                    _(
+                        "Answer completions from a warm background process when one "
+                        "is available."
+                    ),
+                ),
+            ),
+        ] = False,
+        static: t.Annotated[
+            bool,
+            Option(
+                "--static",
+                help=t.cast(
+                    str,
+                    _(
+                        "Embed the completions that do not change at runtime in the "
+                        "installed script."
+                    ),
+                ),
+            ),
+        ] = False,
     ) -> list[Path] | None:
         """
         Install autocompletion for the given shell. If the shell is not specified, it
@@ -348,8 +388,25 @@ def install(
             :width: 85
             :convert-png: latex
 
+        If ``--daemon`` is given, the installed script will first try to get
+        completions from a warm :func:`serve` process, starting one in the background
+        if none is running, and fall back to running ``complete`` directly.
+
+        If ``--static`` is given, command names, subcommand names, option flags and
+        fixed option choices are collected from the command tree at install time and
+        embedded in the script. These are completed without starting Python at all,
+        only parameters with completion callbacks (e.g. model or path completers) will
+        run the ``complete`` command. The script must be reinstalled when commands
+        change.
+
         Returns the list of edited and/or created paths or None if no edits were made.
         """
+        if use_daemon and not daemon.supported:
+            raise CommandError(
+                f"The completion daemon is not supported on {platform.system()}."
+            )
+        if static and not self.shell_class.supports_static:
+            raise CommandError(f"Static completion is not supported for {self.shell}.")
         self.fallback = fallback  # type: ignore[assignment]
         self.manage_script = manage_script  # type: ignore[assignment]
         if isinstance(self.manage_script, Path):
@@ -376,6 +433,8 @@ def install(
             template=template,
             color=not self.no_color or self.force_color,
             color_default=self.color_default,
+            daemon=use_daemon,
+            static=static,
         ).install(prompt=prompt)
         if install_paths:
             self.stdout.write(
@@ -521,6 +580,11 @@ def get_completion() -> str:
                     # fall through to fallback
 
                 if isinstance(cmd, TyperCommand):
+                    # only load the plugins that define what is being completed
+                    cmd._load_plugins(
+                        args[cmd_idx + 1 : None if command.endswith(" ") else -1],
+                        complete=True,
+                    )
                     # this will exit out so no return is needed here
                     return self.shell_class(
                         cli=get_typer_command(cmd.typer_app),
@@ -558,3 +622,153 @@ def strip_color(text: str) -> str:
         finally:
             os.environ.clear()
             os.environ.update(env)
+
+    @command(
+        help=t.cast(
+            str, _("Answer completion requests from a warm process over a socket.")
+        )
+    )
+    def serve(
+        self,
+        socket: t.Annotated[
+            str | None,
+            Option(
+                help=t.cast(
+                    str,
+                    _(
+                        "The path of the unix socket to listen on. Defaults to the "
+                        "per-user socket for the manage script."
+                    ),
+                ),
+            ),
+        ] = None,
+        idle_timeout: t.Annotated[
+            float,
+            Option(
+                help=t.cast(
+                    str,
+                    _("Exit after this many seconds without a request, 0 to never."),
+                ),
+            ),
+        ] = 600,
+    ):
+        """
+        Run a long lived completion daemon. The app registry, command classes and their
+        compiled click trees are loaded once and kept warm between requests. Requests
+        are ``complete`` invocations forwarded by the thin client in
+        :mod:`django_typer.daemon`. Scripts installed with ``install --daemon`` will
+        start this process automatically, so it is rarely necessary to run it directly.
+
+        The daemon exits when it has been idle for ``--idle-timeout`` seconds or when
+        the settings file or any loaded management command module changes on disk.
+        Requests that would need different settings or python paths are refused and
+        the client will fall back to running the completion in a fresh process.
+
+        .. typer:: django_typer.management.commands.shellcompletion.Command:typer_app:serve
+            :prog: django-admin shellcompletion serve
+            :width: 80
+            :convert-png: latex
+        """
+        if not daemon.supported:
+            raise CommandError(
+                f"The completion daemon is not supported on {platform.system()}."
+            )
+        path = Path(socket) if socket else daemon.socket_path(sys.argv[0])
+
+        # warm up every command we might be asked to complete
+        for name in get_commands():
+            try:
+                cmd = get_command(name)
+                if isinstance(cmd, TyperCommand):
+                    get_typer_command(cmd.typer_app)
+            except (CommandError, ImportError, NotImplementedError):
+                # let the command fail when it is completed, not here
+                continue
+
+        watched = _watched_files()
+
+        def handle(request: dict[str, t.Any]) -> dict[str, t.Any]:
+            if any(_mtime(pth) != mtime for pth, mtime in watched.items()):
+                return {"fallback": True, "shutdown": True}
+            argv = list(request.get("argv", None) or [])
+            env = dict(request.get("env", None) or os.environ)
+            if not argv or any(
+                arg.startswith(("--settings", "--pythonpath")) for arg in argv
+            ):
+                return {"fallback": True}
+            if env.get("DJANGO_SETTINGS_MODULE", settings.SETTINGS_MODULE) != (
+                settings.SETTINGS_MODULE
+            ):
+                return {"fallback": True}
+            return self._run_request(argv, env, request.get("cwd", None))
+
+        daemon.serve(path, handle, idle_timeout=idle_timeout)
+
+    def _run_request(
+        self, argv: list[str], env: dict[str, str], cwd: str | None
+    ) -> dict[str, t.Any]:
+        """
+        Run a shellcompletion command line in this process with the requesting
+        client's environment and working directory.
+        """
+        from django.db import close_old_connections
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        status = 0
+        prev_cwd = os.getcwd()
+        prev_env = os.environ.copy()
+        try:
+            if cwd:
+                os.chdir(cwd)
+            os.environ.clear()
+            os.environ.update(env)
+            cmd = get_command(argv[0], stdout=stdout, stderr=stderr)
+            if not isinstance(cmd, Command):
+                return {"fallback": True}
+            cmd._called_from_command_line = True
+            options = vars(cmd.create_parser(sys.argv[0], argv[0]).parse_args(argv[1:]))
+            cmd.execute(*options.pop("args", ()), **options)
+        except SystemExit as exc:
+            status = exc.code if isinstance(exc.code, int) else int(bool(exc.code))
+        except CommandError as exc:
+            stderr.write(f"{exc.__class__.__name__}: {exc}")
+            status = exc.returncode
+        finally:
+            os.chdir(prev_cwd)
+            os.environ.clear()
+            os.environ.update(prev_env)
+            close_old_connections()
+        return {
+            "status": status,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _watched_files() -> dict[Path, int | None]:
+    """
+    Collect the modification times of the settings file, loaded management modules and
+    the command directories of installed apps. If any of these change the completion
+    daemon must be restarted.
+    """
+    from django.apps import apps
+
+    paths = []
+    if module := sys.modules.get(settings.SETTINGS_MODULE, None):
+        paths.append(getattr(module, "__file__", None))
+    for name, module in list(sys.modules.items()):
+        if ".management." in name:
+            paths.append(getattr(module, "__file__", None))
+    for app in apps.get_app_configs():
+        paths.append(os.path.join(app.path, "management", "commands"))
+    return {
+        Path(pth): _mtime(Path(pth)) for pth in paths if pth and os.path.exists(pth)
+    }
@@ -0,0 +1,250 @@
+"""
+The typer_batch command runs many management command invocations in one process, so
+that Django_ is only bootstrapped once. Each line of the input is one invocation, either
+a command line:
+
+.. code-block:: text
+
+    closepoll 1 2 3
+    closepoll --delete 4
+
+or a json object with an ``argv`` list and an optional ``env`` mapping of environment
+variables to set (or unset if null) while the invocation runs:
+
+.. code-block:: text
+
+    {"argv": ["closepoll", "1"], "env": {"POLL_NOTIFY": "0"}}
+
+Each invocation is parsed and dispatched exactly as it would be from the command line and
+a json line is written to stdout for each of them with the line number, the argument
+vector, the exit status and the captured stdout and stderr of the invocation. Failed
+invocations do not stop the batch, but the batch exits with status 1 if any of them
+failed.
+
+.. typer:: django_typer.management.commands.typer_batch.Command:typer_app
+    :prog: django-admin typer_batch
+    :width: 80
+    :convert-png: latex
+"""
+
+import contextlib
+import io
+import json
+import os
+import shlex
+import sys
+import traceback
+import typing as t
+from importlib import import_module
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import BaseCommand, CommandError, get_commands
+from django.core.management.base import SystemCheckError
+from django.db import close_old_connections, connections
+from django.utils.translation import gettext_lazy as _
+from typer import Argument, Option
+
+from django_typer.management import TyperCommand
+
+
+def _parse_line(line: str) -> tuple[list[str], dict[str, str | None]]:
+    """
+    Parse an input line into an argument vector and environment variables.
+
+    :param line: The input line, a command line or a json object with ``argv`` and
+        ``env`` keys.
+    :return: A 2-tuple of the argument vector and the environment variables.
+    :raises ValueError: If the line is not a valid command line or json.
+    :raises TypeError: If the json does not describe an invocation.
+    """
+    if not line.startswith("{"):
+        return shlex.split(line), {}
+    invocation = json.loads(line)
+    argv = invocation.get("argv", None)
+    env = invocation.get("env", None) or {}
+    if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+        raise TypeError("argv must be a list of strings.")
+    if not isinstance(env, dict):
+        raise TypeError("env must be an object.")
+    return argv, {
+        str(key): None if val is None else str(val) for key, val in env.items()
+    }
+
+
+@contextlib.contextmanager
+def _environment(env: dict[str, str | None]) -> t.Iterator[None]:
+    """
+    Set (or unset if None) the given environment variables for the duration of the
+    block.
+    """
+    previous = {key: os.environ.get(key, None) for key in env}
+    try:
+        for key, val in env.items():
+            if val is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = val
+        yield
+    finally:
+        for key, val in previous.items():
+            if val is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = val
+
+
+class Command(TyperCommand):
+    """
+    Run management commands, one per line of the input, in this process and report
+    the exit status and output of each of them as json lines.
+    """
+
+    help = t.cast(str, _("Run many management command invocations in one process."))
+
+    requires_system_checks = ()
+    requires_migrations_checks = False
+
+    # never mutated - matches BaseCommand's declaration in django-stubs, which
+    # is not a ClassVar
+    suppressed_base_arguments = {  # noqa: RUF012
+        "version",
+        "verbosity",
+    }
+
+    reuse_connections: bool = True
+    prog_name: str = "manage.py"
+
+    def handle(
+        self,
+        invocations: t.Annotated[
+            str,
+            Argument(
+                help=t.cast(
+                    str,
+                    _("The file to read invocations from, - reads from stdin."),
+                ),
+            ),
+        ] = "-",
+        reuse_connections: t.Annotated[
+            bool,
+            Option(
+                help=t.cast(
+                    str,
+                    _(
+                        "Keep database connections open between invocations. "
+                        "Connections that are broken or older than CONN_MAX_AGE "
+                        "are still closed."
+                    ),
+                ),
+            ),
+        ] = True,
+    ):
+        self.reuse_connections = reuse_connections
+        self.prog_name = Path(sys.argv[0]).name or self.prog_name
+        failed = 0
+        with (
+            contextlib.nullcontext(sys.stdin)
+            if invocations == "-"
+            else open(invocations, encoding="utf-8")
+        ) as lines:
+            for number, line in enumerate(lines, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                result = self.invoke(number, line)
+                failed += bool(result["status"])
+                self.stdout.write(json.dumps(result), ending="\n")
+                self.stdout.flush()
+        if failed:
+            raise CommandError(
+                t.cast(str, _("{failed} invocation(s) failed.")).format(failed=failed)
+            )
+
+    def invoke(self, number: int, line: str) -> dict[str, t.Any]:
+        """
+        Run the invocation on the given input line.
+
+        :param number: The line number of the invocation.
+        :param line: The input line.
+        :return: The json serializable result of the invocation.
+        """
+        stdout, stderr = io.StringIO(), io.StringIO()
+        argv: list[str] = []
+        try:
+            argv, env = _parse_line(line)
+            if not argv:
+                raise ValueError("argv must name a command.")
+            with (
+                _environment(env),
+                contextlib.redirect_stdout(stdout),
+                contextlib.redirect_stderr(stderr),
+            ):
+                status = self.run(argv, stdout, stderr)
+        except (ValueError, TypeError) as err:
+            stderr.write(f"Invalid invocation: {err}\n")
+            status = 2
+        return {
+            "line": number,
+            "argv": argv,
+            "status": status,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+    def run(self, argv: list[str], stdout: io.StringIO, stderr: io.StringIO) -> int:
+        """
+        Parse and dispatch a command line the way
+        :meth:`~django.core.management.BaseCommand.run_from_argv` does, except that
+        database connections are kept open if connections are reused.
+
+        :param argv: The argument vector, starting with the command name.
+        :param stdout: The stream to write the command's stdout to.
+        :param stderr: The stream to write the command's stderr to.
+        :return: The exit status of the invocation.
+        """
+        name, *args = argv
+        app_name = get_commands().get(name, None)
+        if app_name is None:
+            stderr.write(f"Unknown command: {name!r}\n")
+            return 1
+        status = 0
+        try:
+            # a fresh instance per invocation - commands capture the streams they
+            # write to when they are instantiated and nothing an invocation creates
+            # (e.g. contexts) outlives it
+            cmd = (
+                type(app_name)
+                if isinstance(app_name, BaseCommand)
+                else import_module(f"{app_name}.management.commands.{name}").Command
+            )(stdout=stdout, stderr=stderr)
+            cmd._called_from_command_line = True
+            with cmd if isinstance(cmd, TyperCommand) else contextlib.nullcontext():
+                options = cmd.create_parser(self.prog_name, name).parse_args(args)
+                cmd_options = vars(options)
+                cmd.execute(*cmd_options.pop("args", ()), **cmd_options)
+        except CommandError as err:
+            if isinstance(err, SystemCheckError):
+                stderr.write(f"{err}\n")
+            else:
+                stderr.write(f"{err.__class__.__name__}: {err}\n")
+            status = err.returncode
+        except SystemExit as exit:
+            status = (
+                exit.code if isinstance(exit.code, int) else int(exit.code is not None)
+            )
+        except Exception:  # noqa: BLE001 - one failure must not stop the batch
+            traceback.print_exc(file=stderr)
+            status = 1
+        finally:
+            self._release_connections()
+        return status
+
+    def _release_connections(self):
+        try:
+            if self.reuse_connections:
+                close_old_connections()
+            else:
+                connections.close_all()
+        except ImproperlyConfigured:
+            pass
@@ -0,0 +1,292 @@
+"""
+Manifests cache facts about command implementations, like their parameters and help
+text, so that they can be known without importing the implementation. Manifests are
+stored as json files in a ``django-typer/manifests`` directory in the user's cache
+directory. Each manifest is keyed by the source file of the module it describes and is
+ignored once that file changes.
+
+Click parameters are stored as json schemas (see :func:`param_schema`) and rebuilt
+(see :func:`param_from_schema`) as plain click parameters that are good enough to
+render helps and complete command lines, but not to run commands.
+"""
+
+import enum
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import typing as t
+from importlib import import_module
+from pathlib import Path
+
+import click
+
+__all__ = [
+    "cache_dir",
+    "import_target",
+    "manifest_dir",
+    "param_from_schema",
+    "param_schema",
+    "read_manifest",
+    "source_key",
+    "target_module",
+    "write_json",
+    "write_manifest",
+]
+
+VERSION = 1
+
+_TYPES: dict[str, click.ParamType] = {
+    "integer": click.INT,
+    "float": click.FLOAT,
+    "boolean": click.BOOL,
+    "uuid": click.UUID,
+}
+
+
+def target_module(import_path: str) -> str:
+    """
+    Get the module of an import path.
+
+    :param import_path: The import path in ``module:attribute`` or
+        ``module.attribute`` form.
+    :return: The import path of the module.
+    """
+    if ":" in import_path:
+        return import_path.partition(":")[0]
+    return import_path.rpartition(".")[0]
+
+
+def import_target(import_path: str) -> t.Any:
+    """
+    Import the object at the given import path.
+
+    :param import_path: The path to import in ``module:attribute`` form, the attribute
+        may be dotted. ``module.attribute`` is also accepted.
+    :return: The imported object.
+    :raises ImportError: If the module or the attribute can not be found.
+    """
+    module = target_module(import_path)
+    attr = import_path[len(module) + 1 :]
+    obj = import_module(module)
+    try:
+        for part in attr.split("."):
+            obj = getattr(obj, part)
+    except AttributeError as err:
+        raise ImportError(f"{module} does not define {attr}") from err
+    return obj
+
+
+def _jsonable(value: t.Any) -> t.Any:
+    if isinstance(value, enum.Enum):
+        value = value.value
+    if isinstance(value, (list, tuple)):
+        items = [_jsonable(item) for item in value]
+        return None if None in items and None not in value else items
+    return value if isinstance(value, (str, int, float, bool, type(None))) else None
+
+
+def param_schema(param: click.Parameter, module: str | None = None) -> dict[str, t.Any]:
+    """
+    Get the json serializable schema of a click parameter.
+
+    :param param: The parameter.
+    :param module: The module the parameter belongs to. Custom completers are only
+        part of the schema if they are module level functions that do not live in this
+        module.
+    :return: The schema of the parameter.
+    """
+    info = param.to_info_dict()
+    schema = {
+        key: info.get(key, None)
+        for key in [
+            "name",
+            "param_type_name",
+            "opts",
+            "secondary_opts",
+            "required",
+            "nargs",
+            "multiple",
+            "is_flag",
+            "count",
+            "hidden",
+        ]
+    }
+    help = getattr(param, "help", None)
+    schema["help"] = str(help) if help is not None else None
+    schema["default"] = _jsonable(info.get("default", None))
+    schema["flag_value"] = _jsonable(info.get("flag_value", None))
+    schema["type"] = {"name": info["type"].get("name", None)}
+    if isinstance(param.type, click.Choice):
+        schema["type"]["choices"] = [
+            str(_jsonable(choice)) for choice in param.type.choices
+        ]
+        schema["type"]["case_sensitive"] = param.type.case_sensitive
+    elif isinstance(param.type, click.Path):
+        schema["type"]["file_okay"] = param.type.file_okay
+        schema["type"]["dir_okay"] = param.type.dir_okay
+    completer = getattr(param, "_custom_shell_complete", None)
+    schema["completer"] = (
+        f"{completer.__module__}:{completer.__qualname__}"
+        if inspect.isfunction(completer)
+        and "<" not in completer.__qualname__
+        and completer.__module__ != module
+        else None
+    )
+    return schema
+
+
+def _lazy_completer(import_path: str) -> t.Callable[..., t.Any]:
+    def complete(ctx: click.Context, param: click.Parameter, incomplete: str):
+        return import_target(import_path)(ctx, param, incomplete)
+
+    return complete
+
+
+def param_from_schema(schema: dict[str, t.Any]) -> click.Parameter:
+    """
+    Rebuild a click parameter from its schema.
+
+    :param schema: The schema returned by :func:`param_schema`.
+    :return: A click parameter.
+    """
+    typ = schema["type"]
+    if "choices" in typ:
+        param_type: click.ParamType = click.Choice(
+            typ["choices"], case_sensitive=typ["case_sensitive"]
+        )
+    elif "file_okay" in typ:
+        param_type = click.Path(file_okay=typ["file_okay"], dir_okay=typ["dir_okay"])
+    else:
+        param_type = _TYPES.get(typ["name"], click.STRING)
+    kwargs: dict[str, t.Any] = {
+        "required": schema["required"],
+        "nargs": schema["nargs"],
+        "shell_complete": (
+            _lazy_completer(schema["completer"]) if schema["completer"] else None
+        ),
+    }
+    if not schema["is_flag"] and not schema["count"]:
+        kwargs["type"] = param_type
+    if schema["param_type_name"] == "argument":
+        return click.Argument([schema["name"]], **kwargs)
+    secondary = schema["secondary_opts"]
+    return click.Option(
+        [
+            schema["name"],
+            *[f"{opt}/{sec}" for opt, sec in zip(schema["opts"], secondary)],
+            *schema["opts"][len(secondary) :],
+        ],
+        multiple=schema["multiple"],
+        is_flag=schema["is_flag"],
+        flag_value=schema["flag_value"] if schema["is_flag"] else None,
+        count=schema["count"],
+        hidden=schema["hidden"],
+        help=schema["help"],
+        default=schema["default"],
+        **kwargs,
+    )
+
+
+def cache_dir(name: str) -> Path:
+    """
+    Get a ``django-typer`` directory in the user's cache directory.
+
+    :param name: The name of the directory.
+    :return: The directory, it may not exist yet.
+    """
+    return (
+        Path(os.environ.get("XDG_CACHE_HOME", None) or Path.home() / ".cache")
+        / "django-typer"
+        / name
+    )
+
+
+def write_json(path: Path, data: t.Any) -> None:
+    """
+    Atomically replace the given file with the json serialization of the given data.
+    The file's directory is created, private to the user, if it does not exist.
+
+    :param path: The path of the file.
+    :param data: The json serializable data.
+    :raises OSError: If the file could not be written.
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent)
+    try:
+        with os.fdopen(fd, "w") as out:
+            json.dump(data, out)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def manifest_dir() -> Path:
+    """
+    Get the directory manifests are stored in.
+
+    :return: The manifest directory, it may not exist yet.
+    """
+    return cache_dir("manifests")
+
+
+def source_key(module: str) -> str | None:
+    """
+    Get a key that changes whenever the source of the given module changes, without
+    importing the module. Parent packages of the module are imported.
+
+    :param module: The import path of the module.
+    :return: The key, or None if the module has no source file or can not be found.
+    """
+    from importlib.util import find_spec
+
+    try:
+        spec = find_spec(module)
+        if not spec or not spec.origin:
+            return None
+        stat = os.stat(spec.origin)
+    except (ImportError, ValueError, OSError):
+        return None
+    return f"{VERSION}:{spec.origin}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _path(name: str) -> Path:
+    return manifest_dir() / f"{hashlib.sha256(name.encode()).hexdigest()}.json"
+
+
+def read_manifest(name: str, key: str | None) -> dict[str, t.Any] | None:
+    """
+    Read the named manifest.
+
+    :param name: The name of the manifest.
+    :param key: The key the manifest must have been written with.
+    :return: The manifest data or None if there is no manifest for the key.
+    """
+    if key is None:
+        return None
+    try:
+        manifest = json.loads(_path(name).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("key", None) != key:
+        return None
+    return manifest.get("data", None)
+
+
+def write_manifest(name: str, key: str | None, data: dict[str, t.Any]) -> None:
+    """
+    Write the named manifest. Failures to write are ignored.
+
+    :param name: The name of the manifest.
+    :param key: The key to write the manifest with, if None nothing is written.
+    :param data: The json serializable manifest data.
+    """
+    if key is None:
+        return
+    try:
+        write_json(_path(name), {"key": key, "data": data})
+    except OSError:
+        # a manifest we can not write is a manifest we do not have
+        return
@@ -1,11 +1,13 @@
 import typing as t
+from contextlib import contextmanager
 from datetime import date, datetime, time
 from enum import Enum
+from functools import wraps
 from uuid import UUID
 
-from click import Context, Parameter, ParamType
+from click import Context, Parameter, ParamType, get_current_context
 from django.core.management import CommandError
-from django.db import models
+from django.db import connections, models
 
 from django_typer.completers.model import ModelObjectCompleter
 
@@ -21,6 +23,75 @@ class ReturnType(Enum):
     """Return a queryset of model instances that match the field value."""
 
 
+_DEFERRED = "django_typer.deferred_lookups"
+
+
+class _Lookup:
+    """A model lookup that was deferred so it can be resolved in bulk."""
+
+    __slots__ = ("original", "parser", "value")
+
+    def __init__(self, parser: "ModelObjectParser", original: str, value: t.Any):
+        self.parser = parser
+        self.original = original
+        self.value = value
+
+
+@contextmanager
+def _bulk_lookups(ctx: Context) -> t.Iterator[None]:
+    """
+    Defer the model lookups of any :class:`ModelObjectParser` while the parameters of
+    the given context are parsed and resolve them once all of the values are known.
+    This turns one query per value of a multi-valued parameter into one query per
+    parameter.
+
+    :param ctx: The context whose parameters are being parsed.
+    """
+    ctx.meta[_DEFERRED] = parsers = {}
+    try:
+        yield
+    finally:
+        ctx.meta.pop(_DEFERRED, None)
+    for parser in parsers:
+        parser._resolve(ctx)
+
+
+def _resolve_lookups(ctx: Context, value: t.Any) -> t.Any:
+    """
+    Resolve the deferred lookups in the value of a parameter.
+
+    :param ctx: The context whose parameters are being parsed.
+    :param value: The parameter value, which may contain deferred lookups.
+    :return: The value with its lookups resolved.
+    """
+    values = value if isinstance(value, (list, tuple)) else [value]
+    for parser in dict.fromkeys(
+        lookup.parser for lookup in values if isinstance(lookup, _Lookup)
+    ):
+        value = parser._resolve_value(ctx, value)
+    return value
+
+
+def _resolve_before(callback: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+    """
+    Wrap a parameter callback so that any lookups deferred while its value was
+    converted are resolved before it is called. Click calls parameter callbacks while
+    the parameters are still being parsed, before :func:`_bulk_lookups` resolves them.
+
+    :param callback: The click parameter callback.
+    :return: The wrapped callback.
+    """
+    if getattr(callback, "_resolves_lookups", False):
+        return callback
+
+    @wraps(callback)
+    def resolve(ctx: Context, param: Parameter, value: t.Any) -> t.Any:
+        return callback(ctx, param, _resolve_lookups(ctx, value))
+
+    resolve._resolves_lookups = True  # type: ignore[attr-defined]
+    return resolve
+
+
 class ModelObjectParser(ParamType):
     """
     A parser that will turn strings into model object instances based on the
@@ -58,6 +129,10 @@ def handle(
     :param return_type: The model object parser can return types other than the model
         instance (default) - use the ReturnType enumeration to return other types
         from the parser including QuerySets or the primitive values of the model fields.
+    :param bulk: Fetch all of the model instances given to a parameter in as few
+        queries as possible instead of issuing one query per value. The on_error
+        handler is still invoked for each value that does not exist. Bulk lookups are
+        only made for case sensitive lookups that return model instances.
     """
 
     error_handler = t.Callable[[type[models.Model], str, Exception], None]
@@ -67,6 +142,7 @@ def handle(
     case_insensitive: bool = False
     on_error: error_handler | None = None
     return_type: ReturnType = ReturnType.MODEL_INSTANCE
+    bulk: bool = True
 
     _lookup: str = ""
     _field: models.Field
@@ -106,6 +182,7 @@ def __init__(
         case_insensitive: bool = case_insensitive,
         on_error: error_handler | None = on_error,
         return_type: ReturnType = return_type,
+        bulk: bool = bulk,
     ):
         from django.contrib.contenttypes.fields import GenericForeignKey
 
@@ -116,6 +193,7 @@ def __init__(
         self.on_error = on_error
         self.return_type = return_type
         self.case_insensitive = case_insensitive
+        self.bulk = bulk
         field = self.model_cls._meta.get_field(self.lookup_field)
         assert not isinstance(field, (models.ForeignObjectRel, GenericForeignKey)), (
             f"{field.__class__.__name__} is not a supported lookup field."
@@ -131,7 +209,9 @@ def convert(self, value: t.Any, param: Parameter | None, ctx: Context | None):
         already a model instance of the expected type the value will
         be returned. Otherwise the value will be treated as a value to query
         against the lookup_field. If no model object is found the error
-        handler is invoked if one was provided.
+        handler is invoked if one was provided. When parsing the parameters of a
+        :class:`~django_typer.management.TyperCommand` and bulk lookups are enabled,
+        the query is deferred until all of the values of the parameter are known.
 
         :param value: The value to parse.
         :param param: The parameter that the value is associated with.
@@ -168,6 +248,10 @@ def convert(self, value: t.Any, param: Parameter | None, ctx: Context | None):
                 )
             elif self.return_type is ReturnType.FIELD_VALUE:
                 return value
+            deferred = self._deferred()
+            if deferred is not None:
+                deferred[self] = None
+                return _Lookup(self, original, self._field.get_prep_value(value))
             return self.model_cls.objects.get(
                 **{f"{self.lookup_field}{self._lookup}": value}
             )
@@ -178,9 +262,108 @@ def convert(self, value: t.Any, param: Parameter | None, ctx: Context | None):
                 f"{original} is not a valid {self._field.__class__.__name__}"
             ) from err
         except self.model_cls.DoesNotExist as err:
-            if self.on_error:
-                return self.on_error(self.model_cls, original, err)
-            raise CommandError(
-                f"{self.model_cls.__name__}.{self.lookup_field}='{original}' does not "
-                "exist!"
-            ) from err
+            return self._does_not_exist(original, err)
+
+    def _does_not_exist(self, original: str, err: Exception) -> t.Any:
+        if self.on_error:
+            return self.on_error(self.model_cls, original, err)
+        raise CommandError(
+            f"{self.model_cls.__name__}.{self.lookup_field}='{original}' does not "
+            "exist!"
+        ) from err
+
+    def _deferred(self) -> dict["ModelObjectParser", None] | None:
+        """
+        Get the parsers with deferred lookups if lookups from this parser may be
+        deferred.
+        """
+        if (
+            not self.bulk
+            or self._lookup
+            or self.return_type is not ReturnType.MODEL_INSTANCE
+        ):
+            return None
+        ctx = get_current_context(silent=True)
+        return ctx.meta.get(_DEFERRED) if ctx else None
+
+    def _fetch(self, values: t.Sequence[t.Any]) -> dict[t.Any, list[models.Model]]:
+        """
+        Fetch the model instances matching the given field values, in chunks small
+        enough to stay under the database backend's query parameter limit.
+
+        :param values: The prepared field values to fetch.
+        :return: A mapping of field values to the model instances that have them.
+        """
+        query = self.model_cls.objects.all()
+        batch_size = connections[query.db].features.max_query_params or len(values)
+        found: dict[t.Any, list[models.Model]] = {}
+        for offset in range(0, len(values), batch_size):
+            for obj in query.filter(
+                **{f"{self.lookup_field}__in": values[offset : offset + batch_size]}
+            ):
+                found.setdefault(getattr(obj, self._field.attname), []).append(obj)
+        return found
+
+    def _resolve(self, ctx: Context):
+        """
+        Resolve the deferred lookups made by this parser for the parameters of the
+        given context.
+
+        :param ctx: The context whose parameters were parsed.
+        """
+        for name, value in list(ctx.params.items()):
+            ctx.params[name] = self._resolve_value(ctx, value)
+
+    def _resolve_value(self, ctx: Context, value: t.Any) -> t.Any:
+        """
+        Resolve the deferred lookups made by this parser in a parameter value.
+
+        :param ctx: The context whose parameters are being parsed.
+        :param value: The parameter value.
+        :return: The value with this parser's lookups resolved.
+        """
+        values = value if isinstance(value, (list, tuple)) else [value]
+        lookups = [
+            lookup
+            for lookup in values
+            if isinstance(lookup, _Lookup) and lookup.parser is self
+        ]
+        if not lookups:
+            return value
+        try:
+            keys = list(dict.fromkeys(lookup.value for lookup in lookups))
+            found = self._fetch(keys)
+            # the database may match values that do not compare equal in python
+            # (e.g. case insensitive collations) - fall back to get() for these
+            exact = not (found.keys() - set(keys))
+            resolved = [
+                self._resolve_lookup(lookup, found, exact)
+                if isinstance(lookup, _Lookup) and lookup.parser is self
+                else lookup
+                for lookup in values
+            ]
+        except Exception:
+            if not ctx.resilient_parsing:
+                raise
+            return None
+        return type(value)(resolved) if values is value else resolved[0]
+
+    def _resolve_lookup(
+        self, lookup: _Lookup, found: dict[t.Any, list[models.Model]], exact: bool
+    ) -> t.Any:
+        objects = found.get(lookup.value, [])
+        try:
+            if not objects and not exact:
+                return self.model_cls.objects.get(**{self.lookup_field: lookup.value})
+            if not objects:
+                raise self.model_cls.DoesNotExist(
+                    f"{self.model_cls._meta.object_name} matching query does not exist."
+                )
+        except self.model_cls.DoesNotExist as err:
+            return self._does_not_exist(lookup.original, err)
+        if len(objects) > 1:
+            raise self.model_cls.MultipleObjectsReturned(
+                f"get() returned more than one {self.model_cls._meta.object_name} -- "
+                f"it returned {len(objects)}!"
+            )
+        return objects[0]
@@ -0,0 +1,359 @@
+"""
+A forking warm runner for management commands. Scripts that invoke many short lived
+management commands pay the cost of bootstrapping Django_ and building every command
+class on each invocation. The runner pays this cost once:
+
+.. code-block:: bash
+
+    # preload the project in the background
+    django-typer-serve --settings mysite.settings --pythonpath /path/to/mysite &
+
+    # run commands through the warm process
+    DJANGO_SETTINGS_MODULE=mysite.settings django-typer-run closepoll 1 2 3
+
+``django-typer-serve`` imports the settings, populates the app registry and loads every
+management command class. It then forks a child process per request. The child adopts
+the client's argument vector, environment, working directory and standard stream file
+descriptors before running the command, so output, prompts, pipes and exit codes behave
+exactly as if the command had been run directly.
+
+``django-typer-run`` is the thin client. It only imports from the standard library. If
+no runner is listening for the requested settings, or if the request can not be served
+warm (e.g. it passes ``--settings`` or ``--pythonpath``), the client replaces itself with
+a cold ``python -m django`` process. Once a child has started running the command the
+client never falls back. If the child dies before it reports an exit status the client
+exits with status 1 instead of running the command again. ``SIGINT`` and ``SIGTERM``
+received by the client are forwarded to the child.
+
+.. note::
+
+    The runner requires a unix platform. Settings are imported once, code changes are
+    not picked up until the runner is restarted.
+"""
+
+import hashlib
+import json
+import os
+import signal
+import socket
+import sys
+import traceback
+import typing as t
+from pathlib import Path
+
+from django_typer.daemon import socket_dir
+
+__all__ = ["main", "serve", "serve_main", "socket_path", "supported"]
+
+supported = hasattr(os, "fork") and hasattr(socket, "send_fds")
+"""
+True if the warm runner is supported on this platform.
+"""
+
+_FORWARDED = ("--settings", "--pythonpath")
+_STDIO = (0, 1, 2)
+
+
+def socket_path(settings: str) -> Path:
+    """
+    Get the default socket path of the runner for the given settings module.
+
+    :param settings: the import path of the settings module
+    :return: the path to the unix socket
+    """
+    digest = hashlib.sha256(f"serve\0{settings}".encode()).hexdigest()[:16]
+    return socket_dir() / f"serve-{digest}.sock"
+
+
+def _send(conn: socket.socket, message: dict[str, t.Any]) -> None:
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _recv(conn: socket.socket) -> tuple[dict[str, t.Any], list[int]]:
+    _, fds, _, _ = socket.recv_fds(conn, 1, len(_STDIO))
+    chunks = []
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+    return json.loads(b"".join(chunks) or b"{}"), fds
+
+
+def _preload() -> None:
+    """
+    Load every management command class and compile the click commands of the
+    :class:`~django_typer.management.TyperCommand` classes.
+    """
+    from django.core.management import CommandError, get_commands, load_command_class
+
+    from django_typer.management import TyperCommand, get_typer_command
+
+    for name, app_name in get_commands().items():
+        try:
+            cmd = load_command_class(app_name, name)
+            if isinstance(cmd, TyperCommand):
+                get_typer_command(cmd.typer_app)
+        except (CommandError, ImportError, NotImplementedError):
+            # let the command fail when it is run, not here
+            continue
+
+
+def _run(conn: socket.socket) -> t.NoReturn:
+    """
+    Run a request in a forked child process. The child adopts the client's streams,
+    environment and working directory and reports the command's exit status back to
+    the client before exiting with it.
+    """
+    from django.conf import settings
+    from django.core.management import ManagementUtility
+    from django.db import connections
+
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    status = 1
+    try:
+        request, fds = _recv(conn)
+        argv = list(request.get("argv", None) or [])
+        env = dict(request.get("env", None) or {})
+        if (
+            len(fds) != len(_STDIO)
+            or any(arg.startswith(_FORWARDED) for arg in argv)
+            or env.get("DJANGO_SETTINGS_MODULE", settings.SETTINGS_MODULE)
+            != settings.SETTINGS_MODULE
+        ):
+            _send(conn, {"fallback": True})
+            os._exit(0)
+
+        for std, fd in zip(_STDIO, fds):
+            os.dup2(fd, std)
+            os.close(fd)
+        for stream in (sys.stdout, sys.stderr):
+            if hasattr(stream, "reconfigure"):
+                stream.reconfigure(line_buffering=stream.isatty())
+        os.environ.clear()
+        os.environ.update(env)
+        os.chdir(request.get("cwd", None) or os.getcwd())
+
+        sys.argv = [request.get("prog", None) or "django-admin", *argv]
+        # the command is handed off - the client must not run it again from here on
+        _send(conn, {"pid": os.getpid()})
+        try:
+            ManagementUtility(sys.argv).execute()
+            status = 0
+        except KeyboardInterrupt:
+            status = 128 + signal.SIGINT
+        except SystemExit as err:
+            if err.code is None or isinstance(err.code, int):
+                status = err.code or 0
+            else:
+                sys.stderr.write(f"{err.code}\n")
+        except Exception:  # noqa: BLE001 - the child must always report back
+            traceback.print_exc()
+        finally:
+            connections.close_all()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        _send(conn, {"status": status})
+    finally:
+        os._exit(status)
+
+
+def _listening(path: Path) -> bool:
+    """
+    :return: True if a runner is listening on the given socket.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(1)
+        try:
+            conn.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(path: Path, idle_timeout: float | None = None) -> bool:
+    """
+    Preload Django_ and answer requests on the given socket by forking a child process
+    per request. Django_ must already be configured. Database connections are closed
+    before each fork so no connection is ever shared between processes.
+
+    :param path: the path of the unix socket to listen on
+    :param idle_timeout: shutdown after this many seconds without a request, if None
+        or 0 wait forever
+    :return: False if another runner was already listening on the socket, True
+        otherwise
+    """
+    from django.db import connections
+
+    if _listening(path):
+        return False
+    path.unlink(missing_ok=True)
+
+    _preload()
+    connections.close_all()
+
+    # children report their own exit status to their clients - let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        # bind to a temporary name and move the socket into place once it is
+        # listening so that the socket path only ever names a usable socket
+        pending = path.with_suffix(f".{os.getpid()}")
+        pending.unlink(missing_ok=True)
+        umask = os.umask(0o177)
+        try:
+            sock.bind(str(pending))
+        finally:
+            os.umask(umask)
+        try:
+            sock.listen()
+            os.replace(pending, path)
+        except BaseException:
+            pending.unlink(missing_ok=True)
+            raise
+        sock.settimeout(idle_timeout or None)
+        try:
+            while True:
+                try:
+                    conn, _ = sock.accept()
+                except TimeoutError:
+                    return True
+                with conn:
+                    conn.settimeout(None)
+                    connections.close_all()
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    if os.fork() == 0:
+                        sock.close()
+                        _run(conn)
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def serve_main(argv: list[str] | None = None) -> int:
+    """
+    The ``django-typer-serve`` entry point.
+
+    :param argv: the command line arguments
+    :return: the exit code
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="django-typer-serve",
+        description="Preload a Django project and run management commands warm.",
+    )
+    parser.add_argument(
+        "--settings",
+        default=os.environ.get("DJANGO_SETTINGS_MODULE", None),
+        help="The settings module to preload, defaults to DJANGO_SETTINGS_MODULE.",
+    )
+    parser.add_argument("--pythonpath", help="A directory to add to the Python path.")
+    parser.add_argument("--socket", help="The path of the unix socket to listen on.")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=0,
+        help="Shutdown after this many seconds without a request.",
+    )
+    args = parser.parse_args(argv)
+    if not supported:
+        parser.error("The warm runner is not supported on this platform.")
+    if not args.settings:
+        parser.error("--settings or DJANGO_SETTINGS_MODULE is required.")
+    if args.pythonpath:
+        sys.path.insert(0, args.pythonpath)
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+
+    import django
+
+    django.setup()
+    path = Path(args.socket) if args.socket else socket_path(args.settings)
+    if not serve(path, idle_timeout=args.idle_timeout):
+        sys.stderr.write(
+            f"django-typer-serve: a runner is already listening on {path}\n"
+        )
+        return 1
+    return 0
+
+
+def _cold(argv: list[str]) -> t.NoReturn:
+    os.execv(sys.executable, [sys.executable, "-m", "django", *argv])
+
+
+def _forward_signals(pid: int) -> dict[int, t.Any]:
+    """
+    Forward the interrupt and termination signals this process receives to the child
+    running the command.
+
+    :param pid: the process id of the child
+    :return: the replaced signal handlers
+    """
+
+    def forward(signum: int, _frame: t.Any) -> None:
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    return {
+        signum: signal.signal(signum, forward)
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    The ``django-typer-run`` entry point. Run the management command given on the
+    command line through the warm runner for ``DJANGO_SETTINGS_MODULE`` or fall back to
+    running it cold. The command is only run cold if the runner could not be reached
+    or refused the request before it started running the command.
+
+    :param argv: the management command line, optionally preceded by
+        ``--socket <path>``
+    :return: the exit code of the management command
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    path = None
+    if argv[:1] == ["--socket"] and len(argv) > 1:
+        path, argv = Path(argv[1]), argv[2:]
+    settings = os.environ.get("DJANGO_SETTINGS_MODULE", None)
+    if not supported or not argv or not (path or settings):
+        _cold(argv)
+    response: dict[str, t.Any] = {}
+    handlers: dict[int, t.Any] = {}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(path or socket_path(t.cast(str, settings))))
+            socket.send_fds(conn, [b"\0"], list(_STDIO))
+            conn.sendall(
+                json.dumps(
+                    {
+                        "argv": argv,
+                        "env": dict(os.environ),
+                        "cwd": os.getcwd(),
+                        "prog": "django-typer-run",
+                    }
+                ).encode()
+            )
+            conn.shutdown(socket.SHUT_WR)
+            buffer = b""
+            while chunk := conn.recv(65536):
+                buffer += chunk
+                *messages, buffer = buffer.split(b"\n")
+                for message in messages:
+                    response.update(json.loads(message))
+                    if "pid" in response and not handlers:
+                        handlers = _forward_signals(response["pid"])
+    except (OSError, ValueError):
+        pass
+    finally:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+    if response.get("fallback") or "pid" not in response:
+        # the command was never started
+        _cold(argv)
+    if "status" not in response:
+        sys.stderr.write("django-typer-run: the command exited without a status.\n")
+        return 1
+    return int(response["status"])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
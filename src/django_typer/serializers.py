@@ -0,0 +1,231 @@
+"""
+Result serializers write the results of commands in machine readable formats. Commands
+opt into the common ``--format`` option by setting
+:attr:`~django_typer.management.TyperCommand.result_format_option`, or always write
+their results in a format by setting
+:attr:`~django_typer.management.TyperCommand.result_format`.
+
+The following formats are provided:
+
+- **jsonl**: `JSON Lines <https://jsonlines.org>`_, one json value per result item,
+  see :class:`JSONLinesSerializer`.
+- **csv**: One row per result item with a header row if the items are mappings or
+  model instances, see :class:`CSVSerializer`.
+- **msgpack**: A stream of `MessagePack <https://msgpack.org>`_ objects, one per result
+  item, see :class:`MessagePackSerializer`. This format requires the msgpack_ package.
+
+Results that are iterables (lists, tuples, sets, iterators and querysets) are written
+one item at a time, anything else is written as a single item. Model instances are
+written as a mapping of their concrete field attribute names to their values and
+querysets are read with :meth:`~django.db.models.query.QuerySet.iterator` so neither
+the result nor its serialized form is ever held in memory all at once.
+
+Additional formats may be added by subclassing :class:`ResultSerializer` and passing
+the class to :func:`register_serializer`.
+"""
+
+import base64
+import csv
+import json
+import typing as t
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+from django.core.management import CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model
+from django.db.models.fields.files import FieldFile
+
+__all__ = [
+    "CSVSerializer",
+    "JSONLinesSerializer",
+    "MessagePackSerializer",
+    "ResultSerializer",
+    "model_data",
+    "register_serializer",
+    "serializers",
+]
+
+
+def _field_value(value: t.Any) -> t.Any:
+    if isinstance(value, FieldFile):
+        return value.name or None
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    return value
+
+
+def model_data(obj: Model) -> dict[str, t.Any]:
+    """
+    :param obj: The model instance.
+    :return: A mapping of the instance's concrete field attribute names to their values.
+        Files are given by their names and binary data as bytes.
+    """
+    return {
+        field.attname: _field_value(getattr(obj, field.attname))
+        for field in obj._meta.concrete_fields
+    }
+
+
+def _data(item: t.Any) -> t.Any:
+    if isinstance(item, Model):
+        return model_data(item)
+    if isinstance(item, tuple):
+        return list(item)
+    return item
+
+
+class ResultSerializer:
+    """
+    The base class for result serializers. A serializer is created for each result
+    that is written, :meth:`write` is called with each item of the result and
+    :meth:`close` is called once all of the items have been written.
+
+    :param stream: The stream to write to, a binary stream if :attr:`binary` is True,
+        otherwise a text stream.
+    """
+
+    name: str = ""
+    """The name the format is selected by."""
+
+    binary: bool = False
+    """True if the serializer writes bytes, False if it writes text."""
+
+    stream: t.IO[t.Any]
+
+    def __init__(self, stream: t.IO[t.Any]):
+        self.stream = stream
+
+    def write(self, item: t.Any):
+        """
+        Write an item of the result to the stream.
+
+        :param item: The result item.
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        """
+        Finish writing the result.
+        """
+        self.stream.flush()
+
+
+class _ResultEncoder(DjangoJSONEncoder):
+    def default(self, o: t.Any) -> t.Any:
+        if isinstance(o, (bytes, memoryview)):
+            return base64.b64encode(o).decode("ascii")
+        if isinstance(o, (set, frozenset)):
+            return list(o)
+        return super().default(o)
+
+
+class JSONLinesSerializer(ResultSerializer):
+    """
+    Write each item as a json value on its own line. Values json does not support are
+    encoded with :class:`~django.core.serializers.json.DjangoJSONEncoder`, binary data
+    is base64 encoded.
+    """
+
+    name = "jsonl"
+
+    encoder: json.JSONEncoder
+
+    def __init__(self, stream: t.IO[str]):
+        super().__init__(stream)
+        self.encoder = _ResultEncoder(ensure_ascii=False)
+
+    def write(self, item: t.Any):
+        self.stream.write(self.encoder.encode(_data(item)))
+        self.stream.write("\n")
+
+
+class CSVSerializer(ResultSerializer):
+    """
+    Write each item as a csv row. If the first item is a mapping or model instance a
+    header row of its keys is written first and the values of each item are written in
+    that order. Sequences are written as rows of their elements and anything else as a
+    row with one column.
+    """
+
+    name = "csv"
+
+    writer: t.Any
+    fields: list[str] | None = None
+
+    def __init__(self, stream: t.IO[str]):
+        super().__init__(stream)
+        self.writer = csv.writer(stream)
+
+    def write(self, item: t.Any):
+        item = _data(item)
+        if isinstance(item, dict):
+            if self.fields is None:
+                self.fields = list(item.keys())
+                self.writer.writerow(self.fields)
+            self.writer.writerow([item.get(field, None) for field in self.fields])
+        elif isinstance(item, (list, set, frozenset)):
+            self.writer.writerow(item)
+        else:
+            self.writer.writerow([item])
+
+
+def _msgpack_default(obj: t.Any) -> t.Any:
+    if isinstance(obj, Model):
+        return model_data(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, UUID)):
+        return str(obj)
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+class MessagePackSerializer(ResultSerializer):
+    """
+    Write each item as a MessagePack object. Dates and times are written as iso
+    format strings, decimals and UUIDs as strings and durations as seconds. Requires
+    the msgpack_ package.
+    """
+
+    name = "msgpack"
+    binary = True
+
+    packer: t.Any
+
+    def __init__(self, stream: t.IO[bytes]):
+        try:
+            import msgpack
+        except ImportError as err:
+            raise CommandError(
+                "The msgpack format requires the msgpack package: pip install msgpack"
+            ) from err
+        super().__init__(stream)
+        self.packer = msgpack.Packer(default=_msgpack_default)
+
+    def write(self, item: t.Any):
+        self.stream.write(self.packer.pack(_data(item)))
+
+
+serializers: dict[str, type[ResultSerializer]] = {}
+"""The registered result serializers, keyed by the name of their format."""
+
+
+def register_serializer(cls: type[ResultSerializer]) -> type[ResultSerializer]:
+    """
+    Register a result serializer so its format can be selected with ``--format``.
+
+    :param cls: The serializer class, registered by its :attr:`~ResultSerializer.name`.
+    :return: The serializer class.
+    """
+    serializers[cls.name] = cls
+    return cls
+
+
+register_serializer(JSONLinesSerializer)
+register_serializer(CSVSerializer)
+register_serializer(MessagePackSerializer)
@@ -7,17 +7,26 @@
 from importlib.resources import files
 from pathlib import Path
 
+import click
 from click.core import Command as ClickCommand
-from click.shell_completion import CompletionItem, ShellComplete, add_completion_class
+from click.shell_completion import (
+    CompletionItem,
+    ShellComplete,
+    add_completion_class,
+)
+from django.core.management import CommandError, get_commands
 from django.template import Context, Engine
 from django.template.backends.django import Template as DjangoTemplate
 from django.template.base import Template as BaseTemplate
 from django.template.loader import TemplateDoesNotExist, get_template
 from django.utils.translation import gettext as _
 
+from django_typer.completers import deadline
+
 __all__ = ["DjangoTyperShellCompleter", "register_completion_class"]
 
 if t.TYPE_CHECKING:  # pragma: no cover
+    from django_typer.management import CommandNode
     from django_typer.management.commands.shellcompletion import (
         Command as ShellCompletion,
     )
@@ -42,6 +51,10 @@ class with
     :param command_args: The command arguments to complete
     :param template: The name of the shell completion script template
     :param color: Allow or disallow color and formatting in the completion output
+    :param daemon: Try to fetch completions from a warm completion daemon before
+        running the completion command directly
+    :param static: Embed a table of the static completions in the completion script
+        so they can be resolved without running the completion command
     """
 
     template: str
@@ -72,6 +85,25 @@ class with
 
     color_default: bool = True
 
+    daemon: bool = False
+    """
+    Render the completion script so that it first asks the completion daemon for
+    completions.
+    """
+
+    supports_static: bool = False
+    """
+    Can the shell's completion script resolve static completions without running the
+    completion command? Deriving classes that set this must implement
+    :meth:`format_static_table`.
+    """
+
+    static: bool = False
+    """
+    Render the completion script with a table of the completions that do not change
+    at runtime.
+    """
+
     def __init__(
         self,
         cli: ClickCommand | None = None,
@@ -84,6 +116,8 @@ def __init__(
         template: str | None = None,
         color: bool | None = None,
         color_default: bool = color_default,
+        daemon: bool = daemon,
+        static: bool = static,
         **kwargs,
     ):
         # we don't always need the initialization parameters during completion
@@ -99,6 +133,8 @@ def __init__(
         if color is not None:
             self.color = color
         self.color_default = color_default
+        self.daemon = daemon
+        self.static = static
 
         self.console_buffer = io.StringIO()
         try:
@@ -142,7 +178,16 @@ def get_completions(self, args: list[str], incomplete: str) -> list[CompletionIt
         """
         if self.command.fallback:
             return self.command.fallback(args, incomplete)
-        return super().get_completions(args[1:], incomplete)
+        return self._get_completions(args[1:], incomplete)
+
+    def _get_completions(
+        self, args: list[str], incomplete: str
+    ) -> list[CompletionItem]:
+        # the completions click would produce for a typer command, bypassing our
+        # fallback and command name handling. The completion deadline starts before
+        # the command line is resolved.
+        with deadline():
+            return super().get_completions(args, incomplete)
 
     def get_completion_args(self) -> tuple[list[str], str]:
         """
@@ -184,6 +229,11 @@ def source_vars(self) -> dict[str, t.Any]:  # pyright: ignore[reportIncompatible
         * **fallback**: the fallback option to pass to ``shellcompletion complete``
         * **is_installed**: whether or not the manage script is a command on the path
         * **shell**: the name of the shell
+        * **daemon**: whether or not to try the completion daemon first, see
+          :mod:`django_typer.daemon`
+        * **static**: the shell source that declares the table of static completions
+          (see :meth:`static_table`) or an empty string if static completion is not
+          enabled
         """
         return {
             **super().source_vars(),
@@ -201,8 +251,162 @@ def source_vars(self) -> dict[str, t.Any]:  # pyright: ignore[reportIncompatible
             else "",
             "is_installed": self.is_installed,
             "shell": self.name,
+            "daemon": self.daemon,
+            "static": self.format_static_table(self.static_table())
+            if self.static
+            else "",
         }
 
+    def static_table(self) -> dict[str, str]:
+        """
+        Walk the command tree of every management command and collect all of the
+        completions that can be determined ahead of time - command names, subcommand
+        names, option flags and the choices of options that are not completed by a
+        callback (e.g. :class:`click.Choice` or
+        :func:`~django_typer.completers.these_strings` given a fixed sequence).
+
+        The table is a flat string mapping so it can be easily expressed in any shell.
+        Command paths are the space separated command and subcommand names.
+
+        * ``n:<path>``: ``s`` if subcommand names are completed statically, ``o`` if
+          options are (a command without positional arguments) or ``d`` if the command
+          must be completed dynamically
+        * ``f:<path>\\t<flag>``: ``<kind>:<parameter name>`` where kind is ``o`` for
+          flags, ``v`` for options that take a single value and ``x`` for anything
+          else, upper case if the option may be given multiple times
+        * ``l:<path>``, ``o:<path>``, ``c:<path>\\t<flag>``: newline separated
+          subcommand names, option flags and option choices
+        * ``<list key>\\t<value>``: the formatted completion for the value
+
+        Anything that is not in the table is completed by the completion command as
+        usual.
+
+        :return: the table of static completions
+        """
+        from django_typer.management import TyperCommand, get_command
+        from django_typer.management.commands.shellcompletion import (
+            django_autocomplete,
+        )
+
+        table: dict[str, str] = {}
+        # custom fallbacks may complete command names differently
+        table["n:"] = (
+            "s"
+            if self.command.fallback in [None, django_autocomplete]
+            and self._add_static_list(
+                table,
+                "l:",
+                [CompletionItem(name) for name in sorted([*get_commands(), "help"])],
+            )
+            else "d"
+        )
+        for name in get_commands():
+            try:
+                cmd = get_command(name)
+            except (CommandError, ImportError, NotImplementedError):
+                continue
+            if isinstance(cmd, TyperCommand):
+                tree = cmd.command_tree
+                type(self)(
+                    cli=tree.click_command,
+                    ctx_args={"django_command": cmd},
+                    prog_name="",
+                    complete_var="",
+                    command=self.command,
+                    color=self.color,
+                    color_default=self.color_default,
+                )._add_static_node(table, tree, [name])
+        return table
+
+    def _add_static_node(
+        self,
+        table: dict[str, str],
+        node: "CommandNode",
+        path: list[str],
+    ) -> None:
+        key = " ".join(path)
+        cmd = node.click_command
+        params = cmd.get_params(node.context)
+        table[f"n:{key}"] = "d"
+        if any(isinstance(param, click.Argument) for param in params):
+            return
+        table[f"n:{key}"] = "o"
+        if isinstance(cmd, click.Group):
+            table[f"n:{key}"] = (
+                "s"
+                if self._add_static_list(
+                    table, f"l:{key}", self._get_completions(path[1:], "")
+                )
+                else "d"
+            )
+        self._add_static_list(table, f"o:{key}", self._get_completions(path[1:], "-"))
+        for param in params:
+            if not isinstance(param, click.Option):
+                continue
+            kind = (
+                "o"
+                if param.is_flag or param.count
+                else "v"
+                if param.nargs == 1 and not param._flag_needs_value
+                else "x"
+            )
+            meta = f"{kind.upper() if param.multiple else kind}:{param.name}"
+            complete = param._custom_shell_complete
+            static = (
+                kind == "v"
+                and not param.envvar
+                and (
+                    getattr(complete, "static", False)
+                    if complete
+                    else isinstance(param.type, click.Choice)
+                    and param.type.case_sensitive
+                )
+            )
+            for flag in [*param.opts, *param.secondary_opts]:
+                table[f"f:{key}\t{flag}"] = meta
+                if static:
+                    self._add_static_list(
+                        table,
+                        f"c:{key}\t{flag}",
+                        self._get_completions([*path[1:], flag], ""),
+                    )
+
+        for name, child in node.children.items():
+            if getattr(cmd, "chain", False):
+                # sibling commands are valid after any chained command
+                table[f"n:{key} {name}"] = "d"
+            else:
+                self._add_static_node(table, child, [*path, name])
+
+    def _add_static_list(
+        self, table: dict[str, str], key: str, items: list[CompletionItem]
+    ) -> bool:
+        """
+        Add a list of completions to the static table. Lists that are empty or contain
+        values that can not be expressed in the table are not added.
+        """
+        values = [str(item.value) for item in items]
+        if not values or any(
+            not value or set(value) & {"\n", "\t"} for value in values
+        ):
+            return False
+        table[key] = "\n".join(values)
+        for value, item in zip(values, items):
+            table[f"{key}\t{value}"] = self.format_completion(item)
+        return True
+
+    def format_static_table(self, table: dict[str, str]) -> str:
+        """
+        Deriving classes that support static completion must implement this method to
+        render the table returned by :meth:`static_table` as shell source.
+
+        :param table: the static completion table
+        :return: the shell source that declares the table
+        """
+        raise NotImplementedError(
+            f"Static completion is not supported for {self.name}."
+        )
+
     @cached_property
     def is_installed(self) -> bool:
         """
@@ -1,3 +1,4 @@
+import shlex
 import typing as t
 from functools import cached_property
 from pathlib import Path
@@ -41,6 +42,12 @@ class BashComplete(DjangoTyperShellCompleter):
     by default.
     """
 
+    supports_static = True
+    """
+    The static completion table is a global associative array, which requires bash 4.2
+    or higher. On older versions the completion command is always used.
+    """
+
     def get_user_profile(self) -> Path:
         """
         Get .bashrc it is always located in the user's home directory.
@@ -78,8 +85,11 @@ def source_vars(self) -> dict[str, t.Any]:
         version = self._check_version()
         if version and version >= (4, 4):
             complete_opts = "-o nosort"
+        context = super().source_vars()
+        if not version or version < (4, 2):
+            context["static"] = ""
         return {
-            **super().source_vars(),
+            **context,
             "complete_opts": complete_opts,
             "bash_version": version,
             "use_compopt": version and version >= (4, 4),
@@ -88,6 +98,12 @@ def source_vars(self) -> dict[str, t.Any]:
     def format_completion(self, item: CompletionItem) -> str:
         return f"{item.type},{item.value}"
 
+    def format_static_table(self, table: dict[str, str]) -> str:
+        return "\n".join(
+            f"    [{shlex.quote(key)}]={shlex.quote(value)}"
+            for key, value in table.items()
+        )
+
     def install(self, prompt: bool = True) -> list[Path]:
         assert self.prog_name
         edited = []
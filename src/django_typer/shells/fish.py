@@ -37,6 +37,11 @@ class FishComplete(DjangoTyperShellCompleter):
     Fish does not support ansi control codes.
     """
 
+    supports_static = True
+    """
+    The fish completer supports static completion tables.
+    """
+
     def get_user_profile(self) -> Path:
         """
         Get the user's fish config file. It is located in the user's home directory by
@@ -61,6 +66,21 @@ def format_completion(self, item: CompletionItem) -> str:
             )
         return f"{item.type},{self.process_rich_text(item.value)}"
 
+    def format_static_table(self, table: dict[str, str]) -> str:
+        """
+        Fish does not have associative arrays, so the table is rendered as two lists
+        of keys and values.
+        """
+
+        def quote(value: str) -> str:
+            return "'{}'".format(value.replace("\\", "\\\\").replace("'", "\\'"))
+
+        return "\n".join(
+            f"set -g _{self.func_name}_{name} \\\n"
+            + " \\\n".join(f"    {quote(item)}" for item in items)
+            for name, items in [("keys", table.keys()), ("values", table.values())]
+        )
+
     def install(self, prompt: bool = True) -> list[Path]:
         assert self.prog_name
         script = self.install_dir / f"{self.prog_name}.fish"
@@ -1,3 +1,4 @@
+import re
 import subprocess  # nosec B404
 from pathlib import Path
 
@@ -37,6 +38,11 @@ class PowerShellComplete(DjangoTyperShellCompleter):
     disable them by default.
     """
 
+    supports_static = True
+    """
+    The PowerShell completer supports static completion tables.
+    """
+
     def format_completion(self, item: CompletionItem) -> str:
         return ":::".join(
             [
@@ -51,6 +57,17 @@ def format_completion(self, item: CompletionItem) -> str:
             ]
         )
 
+    def format_static_table(self, table: dict[str, str]) -> str:
+        def quote(value: str) -> str:
+            # powershell also treats typographic single quotes as quotes
+            return "'{}'".format(
+                re.sub("(['\u2018\u2019\u201a\u201b])", r"\1\1", value)
+            )
+
+        return "\n".join(
+            f"    $table[{quote(key)}] = {quote(value)}" for key, value in table.items()
+        )
+
     def set_execution_policy(self) -> None:
         subprocess.run(  # nosec B603
             [
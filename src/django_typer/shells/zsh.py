@@ -1,4 +1,5 @@
 import os
+import shlex
 from functools import cached_property
 from pathlib import Path
 
@@ -44,6 +45,11 @@ class ZshComplete(DjangoTyperShellCompleter):
     by default.
     """
 
+    supports_static = True
+    """
+    The zsh completer supports static completion tables.
+    """
+
     def get_user_profile(self) -> Path:
         """
         Get the user's .zshrc file. It is located in the user's home directory by
@@ -64,6 +70,12 @@ def format_completion(self, item: CompletionItem) -> str:
         hlp = self.process_rich_text(item.help.replace("\n", " ")) if item.help else "_"
         return f"{item.type}\n{self.process_rich_text(item.value)}\n{hlp}"
 
+    def format_static_table(self, table: dict[str, str]) -> str:
+        return "\n".join(
+            f"        {shlex.quote(key)} {shlex.quote(value)}"
+            for key, value in table.items()
+        )
+
     def install(self, prompt: bool = True) -> list[Path]:
         assert self.prog_name
         zshrc = self.get_user_profile()
@@ -1,3 +1,69 @@
+{% if static %}
+# static completions generated by shellcompletion install --static
+declare -gA _{{ complete_func }}_table=(
+{{ static|safe }}
+)
+
+_{{ complete_func }}_static_list() {
+    # add the completions from table list $1 that start with $2 to response, skipping
+    # options of command $3 for the parameters in $4 that have already been given
+    local value meta
+    [[ -n ${_{{ complete_func }}_table[$1]+x} ]] || return 1
+    while IFS= read -r value; do
+        [[ $value == "$2"* ]] || continue
+        meta=${_{{ complete_func }}_table["f:$3"$'\t'"$value"]}
+        [[ -n $4 && $meta == [ov]:* && $4 == *" ${meta#*:} "* ]] && continue
+        response+=("${_{{ complete_func }}_table["$1"$'\t'"$value"]}")
+    done <<< "${_{{ complete_func }}_table[$1]}"
+    return 0
+}
+
+_{{ complete_func }}_static() {
+    # complete from the static table, returns 1 if the completion command must be run
+    local cmdpath="" opt="" seen=" " meta word i
+    (( COMP_POINT == ${#COMP_LINE} )) || return 1
+    [[ $COMP_LINE == *[^[:alnum:][:space:]_./,+@%=-]* ]] && return 1
+    for ((i=1; i<COMP_CWORD; i++)); do
+        word=${COMP_WORDS[i]}
+        if [[ -n $opt ]]; then
+            opt=""
+        elif [[ $word == -* ]]; then
+            meta=${_{{ complete_func }}_table["f:$cmdpath"$'\t'"$word"]}
+            case $meta in
+                [vV]:*)
+                    opt=$word
+                    # completions may depend on previous values
+                    [[ $seen == *" ${meta#*:} "* ]] && opt="-"
+                    ;;
+                [oO]:*) ;;
+                *) return 1 ;;
+            esac
+            seen+="${meta#*:} "
+        else
+            word=${cmdpath:+$cmdpath }$word
+            [[ -n ${_{{ complete_func }}_table["n:$word"]+x} ]] || return 1
+            cmdpath=$word
+            seen=" "
+        fi
+    done
+    local incomplete=${COMP_WORDS[COMP_CWORD]}
+    local node=${_{{ complete_func }}_table["n:$cmdpath"]}
+    if [[ -n $opt ]]; then
+        [[ $opt != "-" && $incomplete != -* ]] || return 1
+        _{{ complete_func }}_static_list "c:$cmdpath"$'\t'"$opt" "$incomplete"
+    elif [[ $incomplete == -* ]]; then
+        [[ $node == [so] && $incomplete != *=* ]] || return 1
+        _{{ complete_func }}_static_list "o:$cmdpath" "$incomplete" "$cmdpath" "$seen"
+    elif [[ $node == s ]]; then
+        _{{ complete_func }}_static_list "l:$cmdpath" "$incomplete"
+    elif [[ $node == o ]]; then
+        [[ -n $incomplete ]] ||
+            _{{ complete_func }}_static_list "o:$cmdpath" "" "$cmdpath" "$seen"
+    else
+        return 1
+    fi
+}
+{% endif %}
 {{ complete_func }}() {
     local IFS=$'
 '
@@ -31,9 +97,20 @@
     done
 
     response=()
+    {% if static %}
+    _{{ complete_func }}_static ||
+    {% endif %}
     while IFS= read -r line; do
         response+=("$line")
     done < <(
+        {% if daemon %}
+        TYPER_USE_RICH=0 \
+        "{{ python }}" -m django_typer.daemon --manage "$1" -- {{ django_command }} --shell bash \
+            ${settings_option:+${settings_option}} \
+            ${pythonpath_option:+${pythonpath_option}} \
+            {{ color }} complete {{ fallback }} \
+            "${COMP_WORDS[*]}" "$COMP_POINT" 2>/dev/null ||
+        {% endif %}
         TYPER_USE_RICH=0 \
         $1 {{ django_command }} --shell bash \
             ${settings_option:+${settings_option}} \
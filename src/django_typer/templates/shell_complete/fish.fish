@@ -1,3 +1,91 @@
+{% if static %}
+# static completions generated by shellcompletion install --static
+{{ static|safe }}
+
+function _{{ complete_func }}_static_get
+    # print the table value for the key
+    set -l i (contains -i -- $argv[1] $_{{ complete_func }}_keys)
+    or return 1
+    printf '%s\n' $_{{ complete_func }}_values[$i]
+end
+
+function _{{ complete_func }}_static_list --argument-names key incomplete cmdpath seen
+    # print the completions from table list $key that start with $incomplete, skipping
+    # options of command $cmdpath for the parameters in $seen that have been given
+    set -l values (_{{ complete_func }}_static_get $key)
+    or return 1
+    for value in $values
+        string match -q -- "$incomplete*" $value
+        or continue
+        set -l meta (_{{ complete_func }}_static_get "f:$cmdpath"\t"$value")
+        if test -n "$seen"; and string match -qr '^[ov]:' -- "$meta"
+            and string match -q -- "* "(string sub -s 3 -- $meta)" *" "$seen"
+            continue
+        end
+        _{{ complete_func }}_static_get "$key"\t"$value"
+    end
+end
+
+function _{{ complete_func }}_static
+    # complete from the static table, returns 1 if the completion command must be run
+    set -l cmd (commandline -cp | string collect)
+    set -l full (commandline -p | string collect)
+    test "$cmd" = "$full"
+    or return 1
+    string match -qr -- '[^\w\s./,+@%=-]' "$cmd"
+    and return 1
+    set -l words (commandline -opc)
+    set -e words[1]
+    set -l cmdpath ""
+    set -l opt ""
+    set -l seen " "
+    for word in $words
+        if test -n "$opt"
+            set opt ""
+        else if string match -q -- '-*' $word
+            set -l meta (_{{ complete_func }}_static_get "f:$cmdpath"\t"$word")
+            or return 1
+            set -l param (string sub -s 3 -- $meta)
+            if string match -qr '^[vV]:' -- $meta
+                set opt $word
+                # completions may depend on previous values
+                string match -q -- "* $param *" "$seen"
+                and set opt "-"
+            else if not string match -qr '^[oO]:' -- $meta
+                return 1
+            end
+            set seen "$seen$param "
+        else
+            set -l child $word
+            test -n "$cmdpath"
+            and set child "$cmdpath $word"
+            _{{ complete_func }}_static_get "n:$child" >/dev/null
+            or return 1
+            set cmdpath $child
+            set seen " "
+        end
+    end
+    set -l incomplete (commandline -ct)
+    set -l node (_{{ complete_func }}_static_get "n:$cmdpath")
+    if test -n "$opt"
+        test "$opt" != "-"; and not string match -q -- '-*' "$incomplete"
+        or return 1
+        _{{ complete_func }}_static_list "c:$cmdpath"\t"$opt" "$incomplete" "$cmdpath" ""
+    else if string match -q -- '-*' "$incomplete"
+        string match -qr '^[so]$' -- "$node"; and not string match -q -- '*=*' "$incomplete"
+        or return 1
+        _{{ complete_func }}_static_list "o:$cmdpath" "$incomplete" "$cmdpath" "$seen"
+    else if test "$node" = s
+        _{{ complete_func }}_static_list "l:$cmdpath" "$incomplete" "$cmdpath" ""
+    else if test "$node" = o
+        test -n "$incomplete"
+        or _{{ complete_func }}_static_list "o:$cmdpath" "" "$cmdpath" "$seen"
+    else
+        return 1
+    end
+end
+{% endif %}
+
 function __fish_{{prog_name}}_complete
 
     set cmd (commandline)
@@ -26,7 +114,10 @@ function __fish_{{prog_name}}_complete
     # BEFORE `complete` on the command line.
     set completeCmd {{ django_command }} --shell fish $settingsOption $pythonPathOption {{ color }} complete {{ fallback }} "$cmd" "$cursor"
 
-    set results (env TYPER_USE_RICH=0 {{ manage_script_name }} $completeCmd)
+    {% if static %}
+    set results (_{{ complete_func }}_static)
+    or {% endif %}{% if daemon %}set results (env TYPER_USE_RICH=0 "{{ python }}" -m django_typer.daemon --manage {{ manage_script_name }} -- $completeCmd 2>/dev/null)
+    or {% endif %}set results (env TYPER_USE_RICH=0 {{ manage_script_name }} $completeCmd)
 
     for completion in $results;
         set -l metadata (string split "," $completion);
@@ -1,5 +1,82 @@
 Import-Module PSReadLine
 Set-PSReadLineKeyHandler -Chord Tab -Function MenuComplete
+{% if static %}
+# static completions generated by shellcompletion install --static
+$global:{{ complete_func }}_table = & {
+    $table = [System.Collections.Hashtable]::new([System.StringComparer]::Ordinal)
+{{ static|safe }}
+    , $table
+}
+
+function {{ complete_func }}_static_list([string]$key, [string]$incomplete, [string]$cmdpath, [string]$seen, $out) {
+    # add the completions from table list $key that start with $incomplete to $out,
+    # skipping options of command $cmdpath for the parameters in $seen
+    $table = $global:{{ complete_func }}_table
+    if (-not $table.ContainsKey($key)) { return $false }
+    foreach ($value in $table[$key] -split "`n") {
+        if (-not $value.StartsWith($incomplete, [System.StringComparison]::Ordinal)) { continue }
+        $meta = $table["f:$cmdpath`t$value"]
+        if ($seen -and $meta -cmatch '^[ov]:' -and $seen.Contains(" $($meta.Substring(2)) ")) { continue }
+        $out.Add($table["$key`t$value"])
+    }
+    return $true
+}
+
+function {{ complete_func }}_static([string]$commandText, $out) {
+    # complete from the static table, returns false if the completion command must be run
+    if ($commandText -match "[^\w\s./,+@%=-]") { return $false }
+    $words = @($commandText -split '\s+' | Where-Object { $_ })
+    $incomplete = ""
+    if ($commandText -notmatch '\s$') {
+        $incomplete = $words[-1]
+        $words = @($words | Select-Object -First ($words.Count - 1))
+    }
+    $table = $global:{{ complete_func }}_table
+    $cmdpath = ""
+    $opt = ""
+    $seen = " "
+    for ($i = 1; $i -lt $words.Count; $i++) {
+        $word = $words[$i]
+        if ($opt) {
+            $opt = ""
+        } elseif ($word.StartsWith("-")) {
+            $meta = $table["f:$cmdpath`t$word"]
+            if ($null -eq $meta) { return $false }
+            $param = $meta.Substring(2)
+            if ($meta -cmatch '^[vV]:') {
+                $opt = $word
+                # completions may depend on previous values
+                if ($seen.Contains(" $param ")) { $opt = "-" }
+            } elseif ($meta -cnotmatch '^[oO]:') {
+                return $false
+            }
+            $seen += "$param "
+        } else {
+            if ($cmdpath) { $word = "$cmdpath $word" }
+            if (-not $table.ContainsKey("n:$word")) { return $false }
+            $cmdpath = $word
+            $seen = " "
+        }
+    }
+    $node = $table["n:$cmdpath"]
+    if ($opt) {
+        if ($opt -eq "-" -or $incomplete.StartsWith("-")) { return $false }
+        return {{ complete_func }}_static_list "c:$cmdpath`t$opt" $incomplete $cmdpath "" $out
+    }
+    if ($incomplete.StartsWith("-")) {
+        if ($node -cnotmatch '^[so]$' -or $incomplete.Contains("=")) { return $false }
+        return {{ complete_func }}_static_list "o:$cmdpath" $incomplete $cmdpath $seen $out
+    }
+    if ($node -ceq "s") {
+        return {{ complete_func }}_static_list "l:$cmdpath" $incomplete $cmdpath "" $out
+    }
+    if ($node -ceq "o") {
+        if ($incomplete) { return $true }
+        return {{ complete_func }}_static_list "o:$cmdpath" "" $cmdpath $seen $out
+    }
+    return $false
+}
+{% endif %}
 $scriptblock = {
     param($wordToComplete, $commandAst, $cursorPosition)
     
@@ -20,6 +97,13 @@ $scriptblock = {
         $pythonPathOption = "--pythonpath=$($matches[1])"
     }
 
+    {% if static %}
+    $static = [System.Collections.Generic.List[string]]::new()
+    if ($cursorPosition -ge $commandAst.Extent.EndOffset -and
+        ({{ complete_func }}_static $commandText $static)) {
+        $results = $static
+    } else {
+    {% endif %}
     $arguments = @("{{ django_command }}") +
     @($settingsOption) +
     @($pythonPathOption) +
@@ -30,11 +114,21 @@ $scriptblock = {
     $had = Test-Path Env:\TYPER_USE_RICH
     $env:TYPER_USE_RICH = '0'
     try {
+        {% if daemon %}
+        $results = & "{{ python }}" -m django_typer.daemon --manage {{ manage_script_name }} -- @arguments 2>$null
+        if ($LASTEXITCODE -ne 0) {
+            $results = & {{ manage_script_name }} @arguments 2>&1
+        }
+        {% else %}
         $results = & {{ manage_script_name }} @arguments 2>&1
+        {% endif %}
     }
     finally {
         if ($had) { $env:TYPER_USE_RICH = $old } else { Remove-Item Env:\TYPER_USE_RICH -ErrorAction SilentlyContinue }
     }
+    {% if static %}
+    }
+    {% endif %}
 
     if ($results.Count -eq 0) {
         # avoid default path completion
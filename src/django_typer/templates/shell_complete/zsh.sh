@@ -1,4 +1,77 @@
 #compdef {{ manage_script_name }}
+{% if static %}
+# static completions generated by shellcompletion install --static
+if (( ! ${+_{{ complete_func }}_table} )); then
+    typeset -gA _{{ complete_func }}_table
+    _{{ complete_func }}_table=(
+{{ static|safe }}
+    )
+fi
+
+_{{ complete_func }}_static_list() {
+    # add the completions from table list $1 that start with $2 to response, skipping
+    # options of command $3 for the parameters in $4 that have already been given
+    local value meta key
+    (( ${+_{{ complete_func }}_table[$1]} )) || return 1
+    for value in "${(@f)_{{ complete_func }}_table[$1]}"; do
+        [[ $value == "$2"* ]] || continue
+        key="f:$3"$'\t'"$value"
+        meta=${_{{ complete_func }}_table[$key]}
+        [[ -n $4 && $meta == [ov]:* && $4 == *" ${meta#*:} "* ]] && continue
+        key="$1"$'\t'"$value"
+        response+=("${(@f)_{{ complete_func }}_table[$key]}")
+    done
+    return 0
+}
+
+_{{ complete_func }}_static() {
+    # complete from the static table, returns 1 if the completion command must be run
+    # $1 is the index of the first word after the manage script
+    local cmdpath="" opt="" seen=" " meta word key i
+    (( CURRENT == ${#words} )) && [[ -z $SUFFIX ]] || return 1
+    [[ "${words[*]}" == *[^[:alnum:][:space:]_./,+@%=-]* ]] && return 1
+    for ((i=$1; i<CURRENT; i++)); do
+        word=${words[i]}
+        if [[ -n $opt ]]; then
+            opt=""
+        elif [[ $word == -* ]]; then
+            key="f:$cmdpath"$'\t'"$word"
+            meta=${_{{ complete_func }}_table[$key]}
+            case $meta in
+                [vV]:*)
+                    opt=$word
+                    # completions may depend on previous values
+                    [[ $seen == *" ${meta#*:} "* ]] && opt="-"
+                    ;;
+                [oO]:*) ;;
+                *) return 1 ;;
+            esac
+            seen+="${meta#*:} "
+        else
+            word=${cmdpath:+$cmdpath }$word
+            (( ${+_{{ complete_func }}_table[n:$word]} )) || return 1
+            cmdpath=$word
+            seen=" "
+        fi
+    done
+    local incomplete=${words[CURRENT]}
+    local node=${_{{ complete_func }}_table[n:$cmdpath]}
+    if [[ -n $opt ]]; then
+        [[ $opt != "-" && $incomplete != -* ]] || return 1
+        _{{ complete_func }}_static_list "c:$cmdpath"$'\t'"$opt" "$incomplete"
+    elif [[ $incomplete == -* ]]; then
+        [[ $node == [so] && $incomplete != *=* ]] || return 1
+        _{{ complete_func }}_static_list "o:$cmdpath" "$incomplete" "$cmdpath" "$seen"
+    elif [[ $node == s ]]; then
+        _{{ complete_func }}_static_list "l:$cmdpath" "$incomplete"
+    elif [[ $node == o ]]; then
+        [[ -n $incomplete ]] ||
+            _{{ complete_func }}_static_list "o:$cmdpath" "" "$cmdpath" "$seen"
+    else
+        return 1
+    fi
+}
+{% endif %}
 
 {{ complete_func }}() {
     local -a completions
@@ -39,9 +112,27 @@
       esac
     done
 
+    {% if static %}
+    local first=2
+    [[ $manage == *" "* ]] && first=3
+    if ! _{{ complete_func }}_static $first; then
+    {% endif %}
+    {% if daemon %}
+    response=("${(@f)$(TYPER_USE_RICH=0 "{{ python }}" -m django_typer.daemon --manage "${manage}" -- \
+        {{ django_command }} --shell zsh \
+        ${settings_option:+${settings_option}} ${pythonpath_option:+${pythonpath_option}} \
+        {{ color }} complete {{ fallback }} "${words[*]}" "$CURSOR" 2>/dev/null || \
+        TYPER_USE_RICH=0 "${manage}" {{ django_command }} --shell zsh \
+        ${settings_option:+${settings_option}} ${pythonpath_option:+${pythonpath_option}} \
+        {{ color }} complete {{ fallback }} "${words[*]}" "$CURSOR")}")
+    {% else %}
     response=("${(@f)$(TYPER_USE_RICH=0 "${manage}" {{ django_command }} --shell zsh \
         ${settings_option:+${settings_option}} ${pythonpath_option:+${pythonpath_option}} \
         {{ color }} complete {{ fallback }} "${words[*]}" "$CURSOR")}")
+    {% endif %}
+    {% if static %}
+    fi
+    {% endif %}
 
     for type key descr in ${response}; do
         if [[ "$type" == "dir" ]]; then
@@ -0,0 +1,158 @@
+"""
+Per-phase timing instrumentation for :class:`~django_typer.management.TyperCommand`
+execution. Every command instance has a :class:`Timer` that records how long each
+phase of a run takes:
+
+============================ ==========================================================
+Phase                        Time spent
+============================ ==========================================================
+``plugins``                  loading command extension plugins
+``common_initializer``       adding the common options initializer and resolving help
+``create_parser``            building the :class:`~django_typer.management.TyperParser`
+``checks``                   running system checks
+``parse``                    splitting the command line into parameter values
+``convert``                  converting and validating parameter values
+``invoke``                   click and Typer_ dispatch not accounted for elsewhere
+``callbacks``                running the command, group and initializer functions
+``finalize``                 running finalizers
+``output``                   printing the result and other execute() overhead
+============================ ==========================================================
+
+Phase times are exclusive. Time spent in a phase nested inside another phase is only
+counted towards the inner phase, so the phase times add up to the total time. Phases
+of chained subcommands that run concurrently are timed on each of their threads, so
+their times may add up to more than the wall clock time.
+
+Pass ``--timings`` to print a breakdown to stderr once the command has run.
+Whether or not ``--timings`` is given, the :data:`timings_recorded` signal is
+sent with the timings as a structured dictionary so they can be shipped to a metrics
+backend:
+
+.. code-block:: python
+
+    from django.dispatch import receiver
+    from django_typer.timings import timings_recorded
+
+    @receiver(timings_recorded)
+    def ship_timings(sender, command, timings, **kwargs):
+        statsd.timing(f"commands.{timings['command']}", timings["total"] * 1000)
+"""
+
+import typing as t
+from contextlib import contextmanager
+from threading import Lock, local
+from time import perf_counter
+
+from django.dispatch import Signal
+
+__all__ = ["Timer", "timings_recorded"]
+
+timings_recorded = Signal()
+"""
+Sent after a :class:`~django_typer.management.TyperCommand` is executed with
+``command`` (the command instance) and ``timings`` (the dictionary returned by
+:meth:`Timer.as_dict`) keyword arguments. The sender is the command class.
+"""
+
+
+class Timer:
+    """
+    Accumulate exclusive wall clock times of named phases.
+    """
+
+    phases: dict[str, float]
+    """
+    The accumulated exclusive seconds of each phase in the order the phases were
+    first entered.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self._local = local()
+        self._lock = Lock()
+
+    @property
+    def _stack(self) -> list[list[float]]:
+        # phases nest per thread
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    @contextmanager
+    def phase(self, name: str) -> t.Iterator[None]:
+        """
+        A context manager that times the enclosed block as the given phase. Time spent
+        in phases nested inside the block is not counted towards this phase.
+
+        :param name: The name of the phase.
+        """
+        # [start, seconds spent in nested phases]
+        frame = [perf_counter(), 0.0]
+        stack = self._stack
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            elapsed = perf_counter() - frame[0]
+            with self._lock:
+                self.phases[name] = self.phases.get(name, 0.0) + elapsed - frame[1]
+            if stack:
+                stack[-1][1] += elapsed
+
+    def timed(self, name: str, func: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        """
+        Wrap a callable so that each call is timed as the given phase.
+
+        :param name: The name of the phase.
+        :param func: The callable to time.
+        :return: The wrapped callable.
+        """
+
+        def timed(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+
+        return timed
+
+    @property
+    def total(self) -> float:
+        """
+        The total seconds spent in all phases.
+        """
+        return sum(self.phases.values())
+
+    def reset(self) -> None:
+        """
+        Forget all recorded phase times.
+        """
+        self.phases.clear()
+
+    def as_dict(self, **extra: t.Any) -> dict[str, t.Any]:
+        """
+        Get the recorded timings as a structured, json serializable dictionary.
+
+        :param extra: Additional entries to include in the dictionary.
+        :return: A dictionary with ``phases`` (seconds per phase) and ``total``
+            entries.
+        """
+        return {**extra, "phases": dict(self.phases), "total": self.total}
+
+    def render(self) -> str:
+        """
+        Render the recorded timings as a human readable table.
+
+        :return: The table string.
+        """
+        total = self.total
+        width = max((len(name) for name in self.phases), default=0)
+        width = max(width, len("total"))
+        lines = [
+            f"{name:<{width}}  {seconds * 1000:>10.3f} ms  "
+            f"{(seconds / total * 100) if total else 0:>5.1f}%"
+            for name, seconds in self.phases.items()
+        ]
+        lines.append(f"{'total':<{width}}  {total * 1000:>10.3f} ms")
+        return "\n".join(lines)
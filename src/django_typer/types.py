@@ -6,6 +6,8 @@
 from pathlib import Path
 from typing import Annotated, cast
 
+from click import BadParameter
+from click.shell_completion import CompletionItem
 from django.core.management import CommandError
 from django.utils.translation import gettext_lazy as _
 from typer import Option
@@ -47,6 +49,30 @@ def set_force_color(context, _, value):
     return value
 
 
+def validate_result_format(context, param, value):
+    """
+    Check that the given result format has a registered serializer.
+    """
+    from .serializers import serializers
+
+    if value is not None and value not in serializers:
+        raise BadParameter(
+            cast(str, _("{format} is not one of: {formats}")).format(
+                format=value, formats=", ".join(serializers)
+            )
+        )
+    return value
+
+
+def complete_result_format(context, param, incomplete):
+    """
+    Complete the names of the registered result formats.
+    """
+    from .serializers import serializers
+
+    return [CompletionItem(name) for name in serializers if name.startswith(incomplete)]
+
+
 def show_locals(context, param, _):
     from click.core import ParameterSource
 
@@ -264,3 +290,41 @@ def handle(self, verbosity: Verbosity = 1):
 The :option:`--skip-checks` option is included by default and behaves the same as on
 :class:`~django.core.management.BaseCommand` use it to skip system checks.
 """
+
+
+Timings = Annotated[
+    bool,
+    Option(
+        "--timings",
+        help=cast(str, _("Print how long each phase of the command took.")),
+        rich_help_panel=COMMON_PANEL,
+        show_default=False,
+    ),
+]
+"""
+The type hint for the ``--timings`` option.
+
+The ``--timings`` option is included by default, use it to print a breakdown of
+the time spent in each phase of the command's execution to stderr. See
+:mod:`django_typer.timings`.
+"""
+
+
+ResultFormat = Annotated[
+    str | None,
+    Option(
+        "--format",
+        help=cast(str, _("Write the result in this format.")),
+        callback=validate_result_format,
+        shell_complete=complete_result_format,
+        rich_help_panel=COMMON_PANEL,
+        show_default=False,
+    ),
+]
+"""
+The type hint for the ``--format`` option.
+
+The ``--format`` option is only included on commands that set
+:attr:`~django_typer.management.TyperCommand.result_format_option`, use it to select the
+format results are written in. See :mod:`django_typer.serializers`.
+"""
@@ -12,10 +12,12 @@
 from pathlib import Path
 from threading import local
 from types import MethodType, ModuleType
+from weakref import WeakKeyDictionary
 
 from django.db.models import Model
 from django.db.models.query import QuerySet
 
+from .completers.cache import CompletionCache
 from .completers.model import ModelObjectCompleter
 from .config import traceback_config
 from .parsers.model import ModelObjectParser, ReturnType
@@ -129,8 +131,15 @@ def with_typehint(baseclass: type[T]) -> type[T]:
 
 _command_plugins: dict[str, list[ModuleType]] = {}
 
+# plugin module -> the command paths it defines or True to record them when it loads
+_plugin_manifests: dict[str, list[str] | bool] = {}
 
-def register_command_plugins(package: ModuleType, commands: list[str] | None = None):
+
+def register_command_plugins(
+    package: ModuleType,
+    commands: list[str] | None = None,
+    manifest: dict[str, list[str]] | bool | None = None,
+):
     """
     Register a command plugin for the given command within the given package.
 
@@ -150,10 +159,29 @@ def ready(self):
 
                 register_command_plugins(plugins)
 
+    By default plugins are imported when the command is first instantiated. If a
+    manifest of the groups and commands the plugins define is given, the plugins are
+    only imported when the command line reaches one of them:
+
+    .. code-block:: python
+
+        register_command_plugins(
+            plugins, manifest={"backup": ["environment", "database", "media sync"]}
+        )
+
+    Command paths are the space separated names of the groups and the command, the
+    empty path refers to the root command. Pass ``manifest=True`` to have the
+    manifest recorded in the user's cache directory the first time the plugins are
+    imported. Only use manifests for plugins that do nothing more than add or override
+    groups and commands. Plugins that do not change the command tree (e.g. hook
+    implementations) are always imported when the command is instantiated.
 
     :param package: The package the command extension module resides in
     :param commands: The names of the commands/modules, if not provided, all modules
         in the package will be registered as plugins
+    :param manifest: A mapping of command names to the command paths their plugin
+        module defines or overrides, or True to record the command paths when the
+        plugins are first imported.
     """
     import pkgutil
 
@@ -165,31 +193,123 @@ def ready(self):
         _command_plugins.setdefault(command, [])
         if package not in _command_plugins[command]:
             _command_plugins[command].append(package)
+        if manifest is True or (manifest and command in manifest):
+            _plugin_manifests[f"{package.__name__}.{command}"] = (
+                True if manifest is True else list(manifest[command])  # type: ignore
+            )
+
 
+def _plugin_paths(command: str) -> dict[str, list[str] | None]:
+    """
+    Get the command paths defined by each of the plugins for the given command that
+    have not been loaded yet.
 
-def _load_command_plugins(command: str) -> int:
+    :param command: The name of the command
+    :return: A mapping of plugin module names to the command paths they define, in
+        load order. The paths are None if they are not known.
+    """
+    from .manifest import read_manifest, source_key
+
+    paths: dict[str, list[str] | None] = {}
+    for pkg in reversed(_command_plugins.get(command, [])):
+        module = f"{pkg.__name__}.{command}"
+        declared = _plugin_manifests.get(module, None)
+        if declared is True:
+            declared = (
+                read_manifest(f"plugin:{module}", source_key(module)) or {}
+            ).get("paths", None)
+        paths[module] = t.cast(list[str] | None, declared)
+    return paths
+
+
+def _load_command_plugins(
+    command: str,
+    needed: t.Callable[[list[str]], bool] | None = None,
+    snapshot: t.Callable[[], dict[str, t.Any]] | None = None,
+) -> int:
     """
     Load any plugins for the given command by loading the registered
     modules in registration order.
 
     :param command: The name of the command
+    :param needed: If given, plugins with known command paths are only loaded if this
+        returns True for their paths. Plugins that define the same paths or parents of
+        the paths of a loaded plugin are loaded along with it.
+    :param snapshot: A function that returns a mapping of the command paths in the
+        command tree to values that change when the path is redefined. Used to record
+        the command paths of plugins registered with ``manifest=True``.
     :return: The number of plugins loaded.
     """
     plugins = _command_plugins.get(command, [])
-    if plugins:
-        import importlib
-
-        for ext_pkg in reversed(plugins):
-            try:
-                importlib.import_module(f"{ext_pkg.__name__}.{command}")
-            except (ImportError, ModuleNotFoundError) as err:
-                raise ValueError(
-                    f"No extension module was found for command {command} in "
-                    f"{ext_pkg.__path__}."
-                ) from err
-        # we only want to do this once
-        del _command_plugins[command]
-    return len(plugins)
+    if not plugins:
+        return 0
+
+    import importlib
+
+    from .manifest import source_key, write_manifest
+
+    paths = _plugin_paths(command)
+    load = {
+        module
+        for module, defined in paths.items()
+        if needed is None or not defined or "" in defined or needed(defined)
+    }
+
+    def related(path: str, other: str) -> bool:
+        return path == other or other.startswith(f"{path} ")
+
+    while True:
+        related_plugins = {
+            module
+            for module, defined in paths.items()
+            if module not in load
+            and any(
+                related(path, other)
+                for path in defined or []
+                for loading in load
+                for other in paths[loading] or []
+            )
+        }
+        if not related_plugins:
+            break
+        load |= related_plugins
+
+    for ext_pkg in reversed(list(plugins)):
+        module = f"{ext_pkg.__name__}.{command}"
+        if module not in load:
+            continue
+        record = (
+            snapshot
+            if snapshot and _plugin_manifests.get(module, None) is True
+            else None
+        )
+        before = record() if record else {}
+        try:
+            importlib.import_module(module)
+        except (ImportError, ModuleNotFoundError) as err:
+            raise ValueError(
+                f"No extension module was found for command {command} in "
+                f"{ext_pkg.__path__}."
+            ) from err
+        if record and paths[module] is None:
+            after = record()
+            write_manifest(
+                f"plugin:{module}",
+                source_key(module),
+                {
+                    "paths": sorted(
+                        path
+                        for path in {*before, *after}
+                        if before.get(path, None) != after.get(path, None)
+                    )
+                },
+            )
+        # we only want to do this once, plugins may load each other
+        if ext_pkg in plugins:
+            plugins.remove(ext_pkg)
+    if not plugins:
+        _command_plugins.pop(command, None)
+    return len(load)
 
 
 def _check_call_frame(frame_name: str, look_back=1) -> bool:
@@ -213,6 +333,53 @@ def _check_call_frame(frame_name: str, look_back=1) -> bool:
 called_from_command_definition = partial(_check_call_frame, "Command")
 
 
+class _SignatureInfo(t.NamedTuple):
+    params: tuple[str, ...]
+    """The names of the function's parameters in order."""
+
+    var_kwargs: bool
+    """True if the function accepts variable keyword arguments."""
+
+    self_first: bool
+    """True if the function's first parameter is named self."""
+
+
+_SIGNATURE_CACHE_SIZE = 1024
+
+# inspect.signature() is expensive and the helpers below are called on every command
+# and finalizer invocation - functions are weakly referenced so they may still be
+# collected and the oldest entries are evicted once the cache is full
+_signatures: WeakKeyDictionary[t.Callable[..., t.Any], _SignatureInfo] = (
+    WeakKeyDictionary()
+)
+
+
+def _signature_info(func: t.Callable[..., t.Any]) -> _SignatureInfo:
+    """
+    Get the signature facts of the given function from the shared signature cache.
+
+    :param func: The function to inspect.
+    :return: The signature facts of the function.
+    """
+    try:
+        return _signatures[func]
+    except (KeyError, TypeError):  # TypeError: not weakly referenceable
+        pass
+    params = list(inspect.signature(func).parameters.values())
+    info = _SignatureInfo(
+        params=tuple(param.name for param in params),
+        var_kwargs=bool(params) and params[-1].kind is inspect.Parameter.VAR_KEYWORD,
+        self_first=bool(params) and params[0].name == "self",
+    )
+    try:
+        if len(_signatures) >= _SIGNATURE_CACHE_SIZE:
+            del _signatures[next(iter(_signatures))]
+        _signatures[func] = info
+    except (TypeError, KeyError):
+        pass
+    return info
+
+
 def is_method(
     func_or_params: t.Callable[..., t.Any] | list[str] | None,
 ) -> bool | None:
@@ -230,13 +397,11 @@ def is_method(
     func_or_params = getattr(func_or_params, "__func__", func_or_params)
     ##############
     if func_or_params:
-        params = (
-            list(inspect.signature(func_or_params).parameters)
-            if callable(func_or_params)
-            else func_or_params
-        )
-        if params:
-            return params[0] == "self"
+        if not callable(func_or_params):
+            return func_or_params[0] == "self"
+        signature = _signature_info(func_or_params)
+        if signature.params:
+            return signature.self_first
         return isinstance(func_or_params, MethodType)
     return None
 
@@ -245,9 +410,7 @@ def accepts_var_kwargs(func: t.Callable[..., t.Any]) -> bool:
     """
     Determines if the given function accepts variable keyword arguments.
     """
-    for param in reversed(list(inspect.signature(func).parameters.values())):
-        return param.kind is inspect.Parameter.VAR_KEYWORD
-    return False
+    return _signature_info(func).var_kwargs
 
 
 def accepted_kwargs(
@@ -256,10 +419,10 @@ def accepted_kwargs(
     """
     Return the named keyword arguments that are accepted by the given function.
     """
-    if accepts_var_kwargs(func):
+    info = _signature_info(func)
+    if info.var_kwargs:
         return kwargs
-    param_names = set(inspect.signature(func).parameters.keys())
-    return {k: v for k, v in kwargs.items() if k in param_names}
+    return {k: v for k, v in kwargs.items() if k in info.params}
 
 
 def get_win_shell() -> str:
@@ -440,6 +603,9 @@ def model_parser_completer(
     on_error: ModelObjectParser.error_handler | None = ModelObjectParser.on_error,
     order_by: str | t.Sequence[str] | None = None,
     return_type: ReturnType = ModelObjectParser.return_type,
+    bulk: bool = ModelObjectParser.bulk,
+    cache: CompletionCache | None = ModelObjectCompleter.cache,
+    prefix_ranges: bool = ModelObjectCompleter.prefix_ranges,
 ) -> dict[str, t.Any]:
     """
     A factory function that returns a dictionary that can be used to specify
@@ -477,6 +643,12 @@ def handle(
         to produce a matching object - by default a CommandError will be raised
     :param return_type: An enumeration switch to return either a model instance,
         queryset or model field value type.
+    :param bulk: whether to fetch all of the objects given to a multi-valued
+        parameter in as few queries as possible, True by default
+    :param cache: a :class:`~django_typer.completers.cache.CompletionCache` to store
+        completion results in, by default results are not cached
+    :param prefix_ranges: whether to bound text completion queries by range predicates
+        so they can use an index, False by default
     """
     return {
         "parser": ModelObjectParser(
@@ -485,6 +657,7 @@ def handle(
             case_insensitive=case_insensitive,
             on_error=on_error,
             return_type=return_type,
+            bulk=bulk,
         ),
         "shell_complete": ModelObjectCompleter(
             model_or_qry,
@@ -495,6 +668,8 @@ def handle(
             limit=limit,
             distinct=distinct,
             order_by=order_by,
+            cache=cache,
+            prefix_ranges=prefix_ranges,
         ),
     }
 
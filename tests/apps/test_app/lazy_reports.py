@@ -0,0 +1,45 @@
+"""
+Command functions for the lazy command. This module must only be imported when one of
+its commands is invoked or its help is requested.
+"""
+
+import typing as t
+from enum import Enum
+from pathlib import Path
+
+from typer import Argument, Option
+
+from django_typer.completers.path import paths
+
+
+class Format(str, Enum):
+    csv = "csv"
+    json = "json"
+
+
+def export(
+    destination: t.Annotated[Path, Argument(help="Where to write the report.")],
+    format: t.Annotated[
+        Format, Option("--format", "-f", help="The report format.")
+    ] = Format.csv,
+    template: t.Annotated[
+        t.Optional[str], Option(help="A report template.", shell_complete=paths)
+    ] = None,
+    overwrite: bool = False,
+):
+    """
+    Export the report.
+    """
+    return {
+        "destination": str(destination),
+        "format": format.value,
+        "template": template,
+        "overwrite": overwrite,
+    }
+
+
+def summary(self, limit: int = 10):
+    """
+    Summarize the report.
+    """
+    return f"{self.__class__.__name__}: {limit}"
@@ -0,0 +1,38 @@
+import asyncio
+
+from django_typer.management import TyperCommand, command, finalize, initialize
+
+
+class Command(TyperCommand, chain=True, max_workers=3):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loops = set()
+        self.fetching = 0
+        self.most_fetching = 0
+
+    @initialize()
+    async def init(self):
+        self.loops.add(asyncio.get_running_loop())
+
+    @finalize()
+    async def collect(self, results: list[str]):
+        self.loops.add(asyncio.get_running_loop())
+        return ", ".join(results)
+
+    @command(independent=True)
+    async def fetch(self, name: str, seconds: float = 0.3):
+        self.loops.add(asyncio.get_running_loop())
+        self.fetching += 1
+        self.most_fetching = max(self.most_fetching, self.fetching)
+        await asyncio.sleep(seconds)
+        self.fetching -= 1
+        return name
+
+    @command()
+    async def step(self, name: str):
+        self.loops.add(asyncio.get_running_loop())
+        return name
+
+    @command(independent=True)
+    def sync(self, name: str):
+        return name
@@ -0,0 +1,39 @@
+import asyncio
+import time
+import typing as t
+
+from click.shell_completion import CompletionItem
+from typer import Option
+
+from django_typer.completers import chain
+from django_typer.management import TyperCommand
+
+
+async def fast(ctx, param, incomplete):
+    await asyncio.sleep(0)
+    return [CompletionItem("fast")]
+
+
+async def slow(ctx, param, incomplete):
+    await asyncio.sleep(5)
+    return [CompletionItem("slow")]
+
+
+def blocking(ctx, param, incomplete):
+    time.sleep(5)
+    return [CompletionItem("blocking")]
+
+
+def sync(ctx, param, incomplete):
+    return ["sync"]
+
+
+class Command(TyperCommand):
+    def handle(
+        self,
+        single: t.Annotated[str, Option(shell_complete=fast)] = "",
+        merged: t.Annotated[
+            str, Option(shell_complete=chain(slow, fast, blocking, sync))
+        ] = "",
+    ):
+        return single or merged
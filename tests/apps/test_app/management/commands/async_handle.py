@@ -0,0 +1,14 @@
+import asyncio
+
+from django_typer.management import TyperCommand, finalize
+
+
+class Command(TyperCommand):
+    async def handle(self, name: str):
+        await asyncio.sleep(0)
+        return name
+
+    @finalize()
+    async def upper(self, result: str):
+        await asyncio.sleep(0)
+        return result.upper()
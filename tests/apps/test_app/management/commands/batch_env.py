@@ -0,0 +1,8 @@
+import os
+
+from django_typer.management import TyperCommand
+
+
+class Command(TyperCommand):
+    def handle(self, variable: str):
+        return os.environ.get(variable, "<unset>")
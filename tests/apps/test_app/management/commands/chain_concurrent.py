@@ -0,0 +1,44 @@
+import threading
+import time
+
+from django.core.management import CommandError
+from django.db import connections
+
+from django_typer.management import TyperCommand, command, finalize
+from django_typer.utils import get_current_command
+
+
+class Command(TyperCommand, chain=True, max_workers=3):
+    # waits given --meet block until the barrier's parties are all waiting
+    barrier: threading.Barrier | None = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.finished = []
+        self.connections = []
+
+    @finalize()
+    def collect(self, results: list[str]):
+        return ", ".join(results)
+
+    @command(independent=True)
+    def wait(self, name: str, seconds: float = 0.3, meet: bool = False):
+        assert get_current_command() is self
+        assert threading.current_thread() is not threading.main_thread()
+        connections["default"].ensure_connection()
+        self.connections.append(connections["default"])
+        if meet:
+            assert self.barrier
+            self.barrier.wait()
+        time.sleep(seconds)
+        self.finished.append(name)
+        return name
+
+    @command()
+    def step(self, name: str):
+        assert threading.current_thread() is threading.main_thread()
+        return f"{name}({','.join(sorted(self.finished))})"
+
+    @command(independent=True)
+    def fail(self):
+        raise CommandError("failed")
@@ -0,0 +1,16 @@
+import typing as t
+
+from typer import Option
+
+from django_typer.management import TyperCommand
+
+
+def fail(ctx, param, incomplete):
+    raise ValueError("completer failed")
+
+
+class Command(TyperCommand):
+    help = "Test completers that raise."
+
+    def handle(self, value: t.Annotated[str, Option(shell_complete=fail)] = ""):
+        return value
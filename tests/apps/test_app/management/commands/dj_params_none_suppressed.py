@@ -6,6 +6,8 @@
 class Command(TyperCommand):
     help = "Test that django parameter suppression works as expected"
 
+    result_format_option = True
+
     suppressed_base_arguments = []
 
     def handle(self, ctx: TyperContext):
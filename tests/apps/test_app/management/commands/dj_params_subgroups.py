@@ -13,6 +13,8 @@
 class Command(TyperCommand):
     help = "Test that django parameter suppression works as expected"
 
+    result_format_option = True
+
     suppressed_base_arguments = {"verbosity", "skip_checks", "traceback"}
 
     tb: bool
@@ -0,0 +1,20 @@
+from django_typer.management import TyperCommand, command, group
+
+
+class Command(TyperCommand):
+    help = "Test lazily imported subcommands."
+
+    @command()
+    def status(self):
+        return "ok"
+
+    @group()
+    def reports(self):
+        """
+        Reports that are expensive to import.
+        """
+
+    reports.lazy_command("tests.apps.test_app.lazy_reports:export")
+    reports.lazy_command(
+        "tests.apps.test_app.lazy_reports:summary", name="sum", help="Summarize."
+    )
@@ -0,0 +1,28 @@
+import typing as t
+
+from typer import Argument
+
+from django_typer.management import TyperCommand
+from django_typer.utils import model_parser_completer
+from tests.apps.test_app.models import ShellCompleteTester
+
+received = []
+
+
+def check(value):
+    received.append([type(obj) for obj in value])
+    return value
+
+
+class Command(TyperCommand):
+    def handle(
+        self,
+        objects: t.Annotated[
+            t.List[ShellCompleteTester],
+            Argument(
+                callback=check,
+                **model_parser_completer(ShellCompleteTester, "char_field"),
+            ),
+        ],
+    ):
+        return ",".join(obj.char_field for obj in objects)
@@ -0,0 +1,27 @@
+import os
+import signal
+import time
+from pathlib import Path
+
+from django_typer.management import TyperCommand, command
+
+
+class Command(TyperCommand):
+    help = "Test warm runner behavior when the command is killed or interrupted."
+
+    @command()
+    def die(self, marker: Path):
+        with marker.open("a") as out:
+            out.write(f"{os.getpid()}\n")
+        os.kill(os.getpid(), signal.SIGKILL)
+
+    @command()
+    def wait(self, marker: Path):
+        try:
+            with marker.open("a") as out:
+                out.write(f"{os.getpid()}\n")
+            time.sleep(30)
+        except KeyboardInterrupt:
+            with marker.open("a") as out:
+                out.write("interrupted\n")
+            raise
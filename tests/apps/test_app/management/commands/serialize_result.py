@@ -0,0 +1,29 @@
+from datetime import date
+
+from django_typer.management import TyperCommand, command
+from tests.apps.test_app.models import ShellCompleteTester
+
+
+class Command(TyperCommand):
+    result_format_option = True
+    stream_results = True
+    stream_chunk_size = 2
+
+    @command()
+    def objects(self):
+        return ShellCompleteTester.objects.order_by("pk")
+
+    @command()
+    def values(self):
+        return ShellCompleteTester.objects.order_by("pk").values(
+            "char_field", "float_field"
+        )
+
+    @command()
+    def rows(self):
+        yield ("a", 1)
+        yield ("b", 2)
+
+    @command()
+    def single(self):
+        return {"key": "value", "when": date(2026, 1, 2)}
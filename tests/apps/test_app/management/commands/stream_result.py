@@ -0,0 +1,31 @@
+import typing as t
+
+from typer import Option
+
+from django_typer.management import TyperCommand, command
+from tests.apps.test_app.models import ShellCompleteTester
+
+
+class Command(TyperCommand):
+    stream_results = True
+    stream_querysets = True
+    stream_chunk_size = 2
+
+    @command()
+    def lines(self, count: int = 5):
+        for idx in range(count):
+            written = getattr(self.stdout._out, "getvalue", None)
+            if written and idx and not idx % self.stream_chunk_size:
+                # previous chunks were written before this item was produced
+                assert written().count("\n") == idx
+            yield f"line {idx}"
+
+    @command()
+    def objects(self, field: t.Annotated[str, Option()] = "char_field"):
+        self.field = field
+        return ShellCompleteTester.objects.order_by("pk")
+
+    def format_item(self, item):
+        if isinstance(item, ShellCompleteTester):
+            return getattr(item, self.field)
+        return super().format_item(item)
@@ -0,0 +1,17 @@
+from tests.apps.test_app.management.commands.lazy import Command as Lazy
+
+
+@Lazy.command()
+def audit(self):
+    """
+    Audit the reports.
+    """
+    return "audited"
+
+
+@Lazy.reports.command()
+def purge(self):
+    """
+    Purge the reports.
+    """
+    return "purged"
@@ -0,0 +1,56 @@
+import asyncio
+from time import perf_counter
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from django_typer.management import get_command
+from tests.utils import run_command
+
+
+class AsyncTests(TestCase):
+    def test_async_chain(self):
+        """
+        Async initializers, subcommands and finalizers of an invocation share one
+        event loop, independent async subcommands are gathered and the loop is closed
+        when the invocation finishes.
+        """
+        cmd = get_command("async_chain")
+        result = call_command(
+            cmd, "fetch", "a", "fetch", "b", "sync", "c", "fetch", "d", "step", "e"
+        )
+        self.assertEqual(result, "a, b, c, d, e")
+        # all of the independent fetches were awaited at the same time
+        self.assertEqual(cmd.most_fetching, 3)
+        self.assertEqual(len(cmd.loops), 1)
+        self.assertTrue(cmd.loops.pop().is_closed())
+
+    def test_direct_calls_return_awaitables(self):
+        cmd = get_command("async_chain")
+        self.assertEqual(asyncio.run(cmd.fetch("a", seconds=0)), "a")
+        self.assertEqual(asyncio.run(cmd.collect(["a", "b"])), "a, b")
+
+    def test_async_handle(self):
+        self.assertEqual(call_command("async_handle", "name"), "NAME")
+        self.assertEqual(run_command("async_handle", "name")[0].strip(), "NAME")
+        self.assertEqual(asyncio.run(get_command("async_handle")("name")), "name")
+
+
+class AsyncCompleterTests(TestCase):
+    @override_settings(DT_COMPLETION_DEADLINE=0.3)
+    def test_async_completers(self):
+        """
+        Async completers are driven by the shell completer and chain() runs its
+        completers concurrently, dropping those that miss the deadline.
+        """
+        shellcompletion = get_command("shellcompletion")
+        shellcompletion.init(shell="zsh")
+        self.assertIn("fast", shellcompletion.complete("async_completion --single "))
+
+        start = perf_counter()
+        result = shellcompletion.complete("async_completion --merged ")
+        self.assertLess(perf_counter() - start, 2)
+        self.assertIn("fast", result)
+        self.assertIn("sync", result)
+        self.assertNotIn("slow", result)
+        self.assertNotIn("blocking", result)
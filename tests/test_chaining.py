@@ -1,7 +1,8 @@
 import contextlib
+import threading
 from io import StringIO
 
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
 from django.test import TestCase
 
 from django_typer.management import get_command
@@ -38,3 +39,36 @@ def test_command_chaining(self):
         chain = get_command("chain")
         self.assertEqual(chain.command1(option="one"), "one")
         self.assertEqual(chain.command2(option="two"), "two")
+
+    def test_concurrent_chaining(self):
+        """
+        Independent subcommands overlap, dependent subcommands wait for everything
+        before them and the results come back in command line order.
+        """
+        cmd = get_command("chain_concurrent")
+        # the barrier breaks if a, b and c do not all run at the same time
+        cmd.barrier = threading.Barrier(3, timeout=10)
+        result = call_command(
+            cmd,
+            "wait",
+            "--meet",
+            "a",
+            "wait",
+            "--meet",
+            "b",
+            "wait",
+            "--meet",
+            "c",
+            "step",
+            "d",
+            "wait",
+            "e",
+        )
+        self.assertFalse(cmd.barrier.broken)
+        self.assertEqual(result, "a, b, c, d(a,b,c), e")
+        self.assertEqual(len(cmd.connections), 4)
+        self.assertTrue(all(conn.connection is None for conn in cmd.connections))
+
+    def test_concurrent_chaining_error(self):
+        with self.assertRaisesMessage(CommandError, "failed"):
+            call_command("chain_concurrent", "wait", "a", "fail", "step", "b")
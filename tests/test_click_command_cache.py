@@ -0,0 +1,136 @@
+from django_typer.management import (
+    TyperCommand,
+    command,
+    get_command,
+    get_typer_command,
+    group,
+)
+
+
+def test_click_command_cached():
+    class Command(TyperCommand):
+        @TyperCommand.command()
+        def cmd1(self):
+            pass
+
+    app = Command.typer_app
+    compiled = get_typer_command(app)
+    assert get_typer_command(app) is compiled
+
+    @Command.command()
+    def cmd2(self):
+        pass
+
+    assert get_typer_command(app) is not compiled
+    compiled = get_typer_command(app)
+    assert set(compiled.commands) == {"cmd1", "cmd2"}
+
+    @Command.callback()
+    def init(self):
+        pass
+
+    assert get_typer_command(app) is not compiled
+    compiled = get_typer_command(app)
+
+    @Command.group()
+    def grp(self):
+        pass
+
+    assert get_typer_command(app) is not compiled
+    compiled = get_typer_command(app)
+    assert "grp" in compiled.commands
+
+    # modifying a subgroup must invalidate the root command
+    @grp.command()
+    def sub(self):
+        pass
+
+    assert get_typer_command(app) is not compiled
+    assert "sub" in get_typer_command(app).commands["grp"].commands
+
+    @Command.finalize()
+    def final(self, results):
+        return results
+
+    compiled = get_typer_command(app)
+    assert compiled.result_callback
+    assert get_typer_command(app) is compiled
+
+
+def test_click_command_cache_inheritance():
+    class Parent(TyperCommand):
+        @group()
+        def grp(self):
+            pass
+
+        @grp.command()
+        def cmd(self):
+            pass
+
+    parent = get_typer_command(Parent.typer_app)
+
+    class Child(Parent):
+        @command()
+        def cmd2(self):
+            pass
+
+    # inherited groups are copied and must not share the parent's click command
+    child = get_typer_command(Child.typer_app)
+    assert child is not parent
+    assert set(child.commands) == {"grp", "cmd2"}
+    assert child.commands["grp"] is not parent.commands["grp"]
+    assert get_typer_command(Parent.typer_app) is parent
+    assert set(parent.commands) == {"grp"}
+
+
+def test_click_command_shared_by_instances():
+    cmd1 = get_command("shellcompletion")
+    cmd2 = get_command("shellcompletion")
+    assert get_typer_command(cmd1.typer_app) is get_typer_command(cmd2.typer_app)
+
+
+def test_name_index():
+    class Command(TyperCommand):
+        @group()
+        def grp(self):
+            pass
+
+        @grp.group()
+        def sub(self):
+            pass
+
+    @Command.sub.command(name="leaf")
+    def leaf1(self):
+        return "leaf1"
+
+    assert Command.leaf.callback is leaf1
+    assert Command().leaf() == "leaf1"
+    assert Command.typer_app._bfs_index["leaf"] is Command.leaf
+
+    # modifying a descendant discards the indexes of all of its ancestors
+    @Command.sub.command(name="leaf")
+    def leaf2(self):
+        return "leaf2"
+
+    assert Command.typer_app._bfs_index is None
+    assert Command.leaf.callback is leaf2
+    assert Command().leaf() == "leaf2"
+    assert Command.grp.sub is Command.sub
+    assert Command.sub.leaf.callback is leaf1
+
+
+def test_parser_actions_do_not_build_contexts():
+    from unittest import mock
+
+    cmd = get_command("groups")
+    with mock.patch("django_typer.management.CommandNode") as command_node:
+        parser = cmd.create_parser("./manage.py", "groups")
+        dests = {action.dest for action in parser._actions}
+        command_node.assert_not_called()
+    assert {"message", "precision", "begin", "sep"} <= dests
+    assert parser._actions is parser._actions
+    # actions are collected once per compiled command tree
+    assert (
+        cmd.create_parser("./manage.py", "groups")._actions[0].param
+        is parser._actions[0].param
+    )
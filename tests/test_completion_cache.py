@@ -0,0 +1,189 @@
+import os
+import time
+from datetime import timedelta
+
+import click
+from django.test import TestCase, override_settings
+
+from django_typer.completers.cache import DjangoCompletionCache, FileCompletionCache
+from django_typer.completers.model import ModelObjectCompleter, text_query
+from tests.apps.test_app.models import ShellCompleteTester
+
+
+class CompletionCacheTests:
+    def get_cache(self, **kwargs):
+        raise NotImplementedError()
+
+    def setUp(self):
+        super().setUp()
+        for value in ["alpha", "alpine", "beta"]:
+            ShellCompleteTester.objects.create(char_field=value)
+        self.ctx = click.Context(click.Command("complete"))
+        self.param = click.Argument(["obj"])
+
+    def complete(self, completer, incomplete):
+        return [item.value for item in completer(self.ctx, self.param, incomplete)]
+
+    def test_cached_completions(self):
+        completer = ModelObjectCompleter(
+            ShellCompleteTester, "char_field", cache=self.get_cache()
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(self.complete(completer, "al"), ["alpha", "alpine"])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.complete(completer, "al"), ["alpha", "alpine"])
+
+        # the prefix and the limit are part of the key
+        with self.assertNumQueries(1):
+            self.assertEqual(self.complete(completer, "b"), ["beta"])
+        completer.limit = 1
+        with self.assertNumQueries(1):
+            self.assertEqual(self.complete(completer, "al"), ["alpha"])
+        completer.limit = 50
+
+        # saves and deletes invalidate the table
+        ShellCompleteTester.objects.create(char_field="alps")
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.complete(completer, "al"), ["alpha", "alpine", "alps"]
+            )
+        ShellCompleteTester.objects.filter(char_field="alpine").delete()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.complete(completer, "al"), ["alpha", "alps"])
+
+    def test_callable_object_query_not_cached(self):
+        class StartsWith:
+            def __call__(self, **kwargs):
+                return text_query(**kwargs)
+
+        completer = ModelObjectCompleter(
+            ShellCompleteTester,
+            "char_field",
+            query=StartsWith(),
+            cache=self.get_cache(),
+        )
+        for _ in range(2):
+            with self.assertNumQueries(1):
+                self.assertEqual(self.complete(completer, "al"), ["alpha", "alpine"])
+
+    def test_cache_timeout(self):
+        completer = ModelObjectCompleter(
+            ShellCompleteTester, "char_field", cache=self.get_cache(timeout=0.1)
+        )
+        self.complete(completer, "al")
+        time.sleep(0.2)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.complete(completer, "al"), ["alpha", "alpine"])
+
+    def test_cached_bounds(self):
+        cache = self.get_cache()
+        ShellCompleteTester.objects.create(duration_field=timedelta(days=12, hours=1))
+        ShellCompleteTester.objects.create(duration_field=-timedelta(days=3))
+        completer = ModelObjectCompleter(ShellCompleteTester, "duration_field")
+        completer.cache = cache
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                completer.bounds(completer.queryset, "duration_field"),
+                (-timedelta(days=3), timedelta(days=12, hours=1)),
+            )
+        # a new process would only have the shared cache
+        completer._bounds.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                completer.bounds(completer.queryset, "duration_field"),
+                (-timedelta(days=3), timedelta(days=12, hours=1)),
+            )
+
+
+class FileCompletionCacheSizeTests(TestCase):
+    def test_max_entries(self):
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = FileCompletionCache(directory=directory, max_entries=8)
+            cache.set("version:table", "stamp", None)
+            cache.set("expired", "value", -1)
+            for idx in range(8):
+                cache.set(f"key{idx}", idx, 60 + idx)
+            # making room removes expired entries and then those closest to expiring
+            self.assertEqual(len(os.listdir(directory)), 7)
+            self.assertIsNone(cache.get("expired"))
+            self.assertEqual(cache.get("version:table"), "stamp")
+            self.assertEqual(
+                [cache.get(f"key{idx}") for idx in range(8)],
+                [None, None, 2, 3, 4, 5, 6, 7],
+            )
+            for idx in range(20):
+                cache.set(f"more{idx}", idx, 60)
+            self.assertLessEqual(len(os.listdir(directory)), 8)
+            self.assertEqual(cache.get("version:table"), "stamp")
+
+
+class CompletionBoundsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.objs = [ShellCompleteTester.objects.create() for _ in range(3)]
+        self.ctx = click.Context(click.Command("complete"))
+        self.param = click.Argument(["obj"])
+
+    def complete(self, completer, incomplete):
+        return [item.value for item in completer(self.ctx, self.param, incomplete)]
+
+    def test_bounds_memoized(self):
+        completer = ModelObjectCompleter(ShellCompleteTester, "id")
+        pk = str(self.objs[0].pk)
+        with self.assertNumQueries(2):
+            self.assertIn(pk, self.complete(completer, pk[0]))
+        with self.assertNumQueries(1):
+            self.assertIn(pk, self.complete(completer, pk[0]))
+
+        # saves forget the bounds
+        obj = ShellCompleteTester.objects.create()
+        with self.assertNumQueries(2):
+            self.assertIn(str(obj.pk), self.complete(completer, str(obj.pk)))
+
+        completer.bounds_timeout = 0
+        completer._bounds.clear()
+        with self.assertNumQueries(2):
+            self.complete(completer, pk[0])
+        with self.assertNumQueries(2):
+            self.complete(completer, pk[0])
+
+    def test_impossible_ranges_pruned(self):
+        completer = ModelObjectCompleter(ShellCompleteTester, "id")
+        top = max(obj.pk for obj in self.objs)
+        completer.bounds(completer.queryset, "id")
+        # no ids are large enough or negative - the database is never queried
+        with self.assertNumQueries(0):
+            self.assertEqual(self.complete(completer, str(top + 1)), [])
+            self.assertEqual(self.complete(completer, "-1"), [])
+
+    def test_empty_table(self):
+        ShellCompleteTester.objects.all().delete()
+        completer = ModelObjectCompleter(ShellCompleteTester, "duration_field")
+        with self.assertNumQueries(1):
+            self.assertEqual(self.complete(completer, "1"), [])
+        completer = ModelObjectCompleter(ShellCompleteTester, "float_field")
+        with self.assertNumQueries(1):
+            self.assertEqual(self.complete(completer, "1"), [])
+
+
+class FileCompletionCacheTests(CompletionCacheTests, TestCase):
+    def get_cache(self, **kwargs):
+        import shutil
+        import tempfile
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        return FileCompletionCache(directory=directory, **kwargs)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class DjangoCompletionCacheTests(CompletionCacheTests, TestCase):
+    def get_cache(self, **kwargs):
+        from django.core.cache import cache
+
+        cache.clear()
+        return DjangoCompletionCache(**kwargs)
@@ -0,0 +1,209 @@
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from django_typer import daemon
+from django_typer.management import get_command
+from django_typer.management.commands.shellcompletion import Command as ShellCompletion
+from tests.utils import manage_py, run_command
+
+pytestmark = pytest.mark.skipif(
+    not daemon.supported, reason="Unix sockets are not supported on this platform."
+)
+
+MANAGE = f"{sys.executable} {manage_py}"
+SETTINGS_FILE = manage_py.parent / "tests" / "settings" / "base.py"
+
+
+@contextmanager
+def touched(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    try:
+        yield
+    finally:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    rt_dir = tmp_path / "rt"
+    rt_dir.mkdir(mode=0o700)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(rt_dir))
+    return rt_dir
+
+
+def start_daemon(socket, idle_timeout=30):
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            str(manage_py),
+            "shellcompletion",
+            "--shell",
+            "zsh",
+            "serve",
+            "--socket",
+            str(socket),
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        cwd=manage_py.parent,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    for _ in range(200):
+        if socket.exists():
+            break
+        time.sleep(0.05)
+    assert socket.exists()
+    return proc
+
+
+def complete(command, *args, capsys):
+    code = daemon.main(
+        [
+            *args,
+            "--manage",
+            MANAGE,
+            "--",
+            "shellcompletion",
+            "--shell",
+            "zsh",
+            "complete",
+            command,
+        ]
+    )
+    return code, capsys.readouterr().out
+
+
+def test_daemon_matches_direct_completion(runtime_dir, capsys):
+    socket = daemon.socket_path(MANAGE)
+    proc = start_daemon(socket)
+    try:
+        for command in [
+            "./manage.py shellcompl",
+            "./manage.py shellcompletion --",
+            "./manage.py completion --app ",
+        ]:
+            code, output = complete(command, capsys=capsys)
+            assert code == 0
+            assert output.strip() == (
+                run_command(
+                    "shellcompletion",
+                    "--shell",
+                    "zsh",
+                    "complete",
+                    command,
+                    parse_json=False,
+                )[0].strip()
+            )
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def test_daemon_completer_error(runtime_dir, capsys):
+    socket = daemon.socket_path(MANAGE)
+    proc = start_daemon(socket)
+    try:
+        code, output = complete(
+            "./manage.py completer_error --value ", "--no-start", capsys=capsys
+        )
+        assert code == daemon.FALLBACK
+        assert not output
+
+        # the daemon survives to answer the next request
+        assert proc.poll() is None
+        code, output = complete("./manage.py shellcompl", capsys=capsys)
+        assert code == 0
+        assert "shellcompletion" in output
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def test_daemon_refuses_settings(runtime_dir, capsys):
+    code = daemon.main(
+        [
+            "--manage",
+            MANAGE,
+            "--",
+            "shellcompletion",
+            "--settings",
+            "tests.settings.examples",
+            "complete",
+            "./manage.py shellcompl",
+        ]
+    )
+    assert code == daemon.FALLBACK
+    assert not capsys.readouterr().out
+    assert not daemon.socket_path(MANAGE).exists()
+
+
+def test_daemon_spawn(runtime_dir, capsys):
+    socket = daemon.socket_path(MANAGE)
+    assert not socket.exists()
+    code, output = complete("./manage.py shellcompl", capsys=capsys)
+    assert code == daemon.FALLBACK
+    assert not output
+
+    for _ in range(200):
+        if socket.exists():
+            break
+        time.sleep(0.05)
+    assert socket.exists()
+    assert not socket.with_suffix(".lock").exists()
+
+    code, output = complete("./manage.py shellcompl", capsys=capsys)
+    assert code == 0
+    assert "shellcompletion" in output
+
+    # changing the settings file shuts the daemon down
+    with touched(SETTINGS_FILE):
+        code, output = complete("./manage.py shellcompl", "--no-start", capsys=capsys)
+    assert code == daemon.FALLBACK
+    assert not output
+    assert not socket.exists()
+
+
+def test_daemon_stale_shutdown(runtime_dir, capsys):
+    socket = daemon.socket_path(MANAGE)
+    proc = start_daemon(socket)
+    try:
+        with touched(
+            manage_py.parent / "tests/apps/test_app/management/commands/basic.py"
+        ):
+            code, output = complete(
+                "./manage.py shellcompl", "--no-start", capsys=capsys
+            )
+        assert code == daemon.FALLBACK
+        assert not output
+        assert proc.wait(timeout=30) == 0
+        assert not socket.exists()
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait()
+
+
+def test_daemon_idle_timeout(runtime_dir):
+    socket = daemon.socket_path(MANAGE)
+    proc = start_daemon(socket, idle_timeout=0.5)
+    assert proc.wait(timeout=30) == 0
+    assert not socket.exists()
+
+
+@pytest.mark.parametrize("shell", ["bash", "zsh", "fish", "pwsh"])
+def test_daemon_install_script(shell):
+    shellcompletion = get_command("shellcompletion", ShellCompletion)
+    shellcompletion.init(shell=shell)
+    completer = shellcompletion.shell_class(
+        prog_name="manage.py", command=shellcompletion, daemon=True
+    )
+    assert "-m django_typer.daemon" in completer.source()
+    completer.daemon = False
+    assert "django_typer.daemon" not in completer.source()
@@ -31,6 +31,7 @@
 │ --no-color                 Don't colorize the command output.                │
 │ --force-color              Force colorization of the command output.         │
 │ --skip-checks              Skip system checks.                               │
+│ --timings                  Print how long each phase of the command took.    │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 """
 
@@ -56,6 +57,7 @@
   --no-color         Don't colorize the command output.
   --force-color      Force colorization of the command output.
   --skip-checks      Skip system checks.
+  --timings          Print how long each phase of the command took.
   --help             Show this message and exit.
 """
 
@@ -75,6 +77,7 @@
   --no-color         Don't colorize the command output.
   --force-color      Force colorization of the command output.
   --skip-checks      Skip system checks.
+  --timings          Print how long each phase of the command took.
   --help             Show this message and exit.
 
 Commands:
@@ -127,6 +130,7 @@
 │ --no-color                 Don't colorize the command output.                │
 │ --force-color              Force colorization of the command output.         │
 │ --skip-checks              Skip system checks.                               │
+│ --timings                  Print how long each phase of the command took.    │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 ╭─ Commands ───────────────────────────────────────────────────────────────────╮
 │ create   Create an object.                                                   │
@@ -181,6 +185,7 @@
 │ --no-color                 Don't colorize the command output.                │
 │ --force-color              Force colorization of the command output.         │
 │ --skip-checks              Skip system checks.                               │
+│ --timings                  Print how long each phase of the command took.    │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 ╭─ Commands ───────────────────────────────────────────────────────────────────╮
 │ math   Do some math at the given precision.                                  │
@@ -203,6 +208,7 @@
   --no-color         Don't colorize the command output.
   --force-color      Force colorization of the command output.
   --skip-checks      Skip system checks.
+  --timings          Print how long each phase of the command took.
   --help             Show this message and exit.
 
 Commands:
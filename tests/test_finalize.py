@@ -10,26 +10,33 @@
 
 class TestFinalize(TestCase):
     def test_finalize_multi_kwargs_run(
-        self, command="finalize_multi_kwargs", show_locals=rich_installed
+        self, command="finalize_multi_kwargs", show_locals=rich_installed, timings=True
     ):
+        def expected(finalized):
+            return finalized[:-1] + ", 'timings': False}" if timings else finalized
+
         stdout, _, _ = run_command(command, "cmd1")
         self.assertEqual(
             stdout.strip(),
-            "finalized: ['cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False, 'show_locals': None}"
-            if show_locals
-            else "finalized: ['cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False}",
+            expected(
+                "finalized: ['cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False, 'show_locals': None}"
+                if show_locals
+                else "finalized: ['cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False}"
+            ),
         )
         stdout, _, _ = run_command(command, "cmd2", "3", "cmd1")
         self.assertEqual(
             stdout.strip(),
-            "finalized: ['cmd2 3', 'cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False, 'show_locals': None}"
-            if show_locals
-            else "finalized: ['cmd2 3', 'cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False}",
+            expected(
+                "finalized: ['cmd2 3', 'cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False, 'show_locals': None}"
+                if show_locals
+                else "finalized: ['cmd2 3', 'cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False}"
+            ),
         )
 
     def test_finalize_multi_named_param_run(self):
         self.test_finalize_multi_kwargs_run(
-            command="finalize_multi_named_param", show_locals=True
+            command="finalize_multi_named_param", show_locals=True, timings=False
         )
 
     def test_finalize_no_params_run(self):
@@ -46,17 +53,22 @@ def test_finalize_no_params_run(self):
         )
 
     def test_finalize_multi_kwargs_call(
-        self, command="finalize_multi_kwargs", show_locals=rich_installed
+        self, command="finalize_multi_kwargs", show_locals=rich_installed, timings=True
     ):
+        def expected(finalized):
+            return finalized[:-1] + ", 'timings': False}" if timings else finalized
+
         # todo - excluded common options should not appear?
         call_command(command, "cmd1")
         with contextlib.redirect_stdout(StringIO()) as out:
             call_command(command, "cmd1")
             self.assertEqual(
                 out.getvalue().strip(),
-                "finalized: ['cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False, 'show_locals': None}"
-                if show_locals
-                else "finalized: ['cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False}",
+                expected(
+                    "finalized: ['cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False, 'show_locals': None}"
+                    if show_locals
+                    else "finalized: ['cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False}"
+                ),
             )
 
             out.truncate(0)
@@ -65,9 +77,11 @@ def test_finalize_multi_kwargs_call(
             call_command(command, "cmd2", "5", "cmd1")
             self.assertEqual(
                 out.getvalue().strip(),
-                "finalized: ['cmd2 5', 'cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False, 'show_locals': None}"
-                if show_locals
-                else "finalized: ['cmd2 5', 'cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False}",
+                expected(
+                    "finalized: ['cmd2 5', 'cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False, 'show_locals': None}"
+                    if show_locals
+                    else "finalized: ['cmd2 5', 'cmd1 1'] | {'force_color': False, 'no_color': False, 'traceback': False}"
+                ),
             )
 
             out.truncate(0)
@@ -84,14 +98,16 @@ def test_finalize_multi_kwargs_call(
             )
             self.assertEqual(
                 out.getvalue().strip(),
-                "finalized: ['cmd2 3', 'cmd1 2'] | {'force_color': False, 'no_color': False, 'traceback': True, 'show_locals': None}"
-                if show_locals
-                else "finalized: ['cmd2 3', 'cmd1 2'] | {'force_color': False, 'no_color': False, 'traceback': True}",
+                expected(
+                    "finalized: ['cmd2 3', 'cmd1 2'] | {'force_color': False, 'no_color': False, 'traceback': True, 'show_locals': None}"
+                    if show_locals
+                    else "finalized: ['cmd2 3', 'cmd1 2'] | {'force_color': False, 'no_color': False, 'traceback': True}"
+                ),
             )
 
     def test_finalize_multi_named_param_call(self):
         self.test_finalize_multi_kwargs_call(
-            command="finalize_multi_named_param", show_locals=True
+            command="finalize_multi_named_param", show_locals=True, timings=False
         )
 
     def test_finalize_multi_no_params(self):
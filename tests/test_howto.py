@@ -58,6 +58,7 @@ class TestGroupsHowto(TestCase):
 │ --no-color                 Don't colorize the command output.                │
 │ --force-color              Force colorization of the command output.         │
 │ --skip-checks              Skip system checks.                               │
+│ --timings                  Print how long each phase of the command took.    │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 ╭─ Commands ───────────────────────────────────────────────────────────────────╮
 │ group1                                                                       │
@@ -182,6 +183,8 @@ class TestDefaultOptionsHowto(TestCase):
 │ --force-color                                 Force colorization of the      │
 │                                               command output.                │
 │ --skip-checks                                 Skip system checks.            │
+│ --timings                                     Print how long each phase of   │
+│                                               the command took.              │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 """
 
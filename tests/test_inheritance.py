@@ -90,3 +90,32 @@ def test_diamond_inheritance_run(self):
         stdout, _, retcode = run_command("inheritance1", "g", "gb")
         self.assertEqual(retcode, 0)
         self.assertTrue("inheritance1::g::gb()" in stdout)
+
+    def test_inherited_groups_copy_on_write(self):
+        from django_typer.management import get_command
+
+        def groups(app):
+            return {
+                grp.typer_instance.info.name: grp.typer_instance
+                for grp in app.registered_groups
+            }
+
+        base = groups(get_command("inheritance2_1").typer_app.proxied)
+        derived = groups(get_command("inheritance3").typer_app.proxied)
+        self.assertIsNot(base["g"], derived["g"])
+        self.assertIs(
+            derived["g"].parent, get_command("inheritance3").typer_app.proxied
+        )
+        # command infos are shared until they are replaced
+        for base_cmd, derived_cmd in zip(
+            base["g"].registered_commands, derived["g"].registered_commands
+        ):
+            self.assertIs(base_cmd, derived_cmd)
+
+        # modifying the inherited group does not modify the base group
+        parent = groups(get_command("inheritance2_2").typer_app.proxied)["g2"]
+        self.assertEqual(
+            [cmd.callback.__name__ for cmd in derived["g2"].registered_commands],
+            ["g2a"],
+        )
+        self.assertEqual(parent.registered_commands, [])
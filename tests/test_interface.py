@@ -62,6 +62,7 @@ def compare_defaults(
     def test_typer_command_interface_matches(self):
         dt_params = set(get_named_arguments(Typer.command))
         typer_params = set(get_named_arguments(typer.Typer.command))
+        dt_params.remove("independent")
 
         self.assertFalse(dt_params.symmetric_difference(typer_params))
         self.assertEqual(
@@ -72,6 +73,7 @@ def test_typer_command_interface_matches(self):
     def test_typer_callback_interface_matches(self):
         dt_params = set(get_named_arguments(Typer.callback))
         typer_params = set(get_named_arguments(typer.Typer.callback))
+        dt_params.remove("max_workers")
 
         self.assertFalse(dt_params.symmetric_difference(typer_params))
         self.assertEqual(
@@ -82,6 +84,7 @@ def test_typer_callback_interface_matches(self):
     def test_typer_initialize_interface_matches(self):
         dt_params = set(get_named_arguments(Typer.initialize))
         typer_params = set(get_named_arguments(typer.Typer.callback))
+        dt_params.remove("max_workers")
 
         self.assertFalse(dt_params.symmetric_difference(typer_params))
         self.assertEqual(
@@ -106,6 +109,7 @@ def test_typer_init_interface_matches(self):
         typer_params = set(get_named_arguments(typer.Typer.__init__))
         dt_params.remove("django_command")
         dt_params.remove("parent")
+        dt_params.remove("max_workers")
         self.assertFalse(dt_params.symmetric_difference(typer_params))
         dt_params.remove("pretty_exceptions_show_locals")
         self.assertEqual(
@@ -261,13 +265,13 @@ def test_action_nargs(self):
         )
         multi_parser = get_command("multi").create_parser("./manage.py", "multi")
         self.assertEqual(
-            multi_parser._actions[8 if rich_installed else 7].param.name, "files"
+            multi_parser._actions[9 if rich_installed else 8].param.name, "files"
         )
-        self.assertEqual(multi_parser._actions[8 if rich_installed else 7].nargs, -1)
+        self.assertEqual(multi_parser._actions[9 if rich_installed else 8].nargs, -1)
         self.assertEqual(
-            multi_parser._actions[9 if rich_installed else 8].param.name, "flag1"
+            multi_parser._actions[10 if rich_installed else 9].param.name, "flag1"
         )
-        self.assertEqual(multi_parser._actions[9 if rich_installed else 8].nargs, 0)
+        self.assertEqual(multi_parser._actions[10 if rich_installed else 9].nargs, 0)
 
     def test_cmd_getattr(self):
         from django_typer.management import TyperCommand
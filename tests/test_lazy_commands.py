@@ -0,0 +1,117 @@
+import os
+import sys
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from django_typer.management import LazyCommand, get_command, get_typer_command
+from django_typer.management.commands.shellcompletion import (
+    DETECTED_SHELL,
+    Command as ShellCompletion,
+)
+from django_typer.manifest import manifest_dir
+
+TARGET = "tests.apps.test_app.lazy_reports"
+
+SHELL = {
+    "zsh": "zsh",
+    "bash": "bash",
+    "pwsh": "pwsh",
+    "powershell": "powershell",
+    "fish": "fish",
+}.get(DETECTED_SHELL, "bash")
+
+
+class LazyCommandTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache.name})
+        self.env.start()
+        self.forget()
+
+    def tearDown(self):
+        self.env.stop()
+        self.cache.cleanup()
+        self.forget()
+        super().tearDown()
+
+    def forget(self):
+        """Forget that the lazy commands were ever imported."""
+        sys.modules.pop(TARGET, None)
+        lazy = get_command("lazy")
+        for cmd in (
+            get_typer_command(lazy.typer_app).commands["reports"].commands.values()
+        ):
+            if isinstance(cmd, LazyCommand):
+                type(cmd)._resolved = None
+        lazy.typer_app.invalidate()
+
+    def help(self, *path):
+        stdout = StringIO()
+        get_command("lazy", stdout=stdout, no_color=True).print_help(
+            "./manage.py", "lazy", *path
+        )
+        return stdout.getvalue()
+
+    def complete(self, line):
+        shellcompletion = get_command("shellcompletion", ShellCompletion)
+        shellcompletion.init(shell=SHELL)
+        return shellcompletion.complete(line)
+
+    def test_help_and_completion_do_not_import(self):
+        self.assertIn("reports", self.help())
+        hlp = self.help("reports")
+        self.assertIn("export", hlp)
+        self.assertIn("Summarize.", hlp)
+        self.assertIn("sum", self.complete("lazy reports "))
+        self.assertNotIn(TARGET, sys.modules)
+        self.assertFalse(manifest_dir().exists())
+
+        # requesting the command help imports the command and writes the manifest
+        self.assertIn("Where to write the report.", self.help("reports", "export"))
+        self.assertIn(TARGET, sys.modules)
+        self.assertEqual(len(list(manifest_dir().iterdir())), 1)
+
+        # the manifest describes the command in new processes
+        self.forget()
+        hlp = self.help("reports")
+        self.assertIn("Export the report.", hlp)
+        completions = self.complete("lazy reports export --")
+        for option in ["--format", "--template", "--overwrite", "--no-overwrite"]:
+            self.assertIn(option, completions)
+        self.assertIn("json", self.complete("lazy reports export --format "))
+        self.assertIn(
+            "tests/apps/test_app",
+            self.complete("lazy reports export --template tests/apps/test_a"),
+        )
+        self.assertNotIn(TARGET, sys.modules)
+
+    def test_invoke(self):
+        self.help("reports", "export")
+        self.help("reports", "sum")
+        self.forget()
+        self.assertEqual(call_command("lazy", "status"), "ok")
+        self.assertNotIn(TARGET, sys.modules)
+        self.assertEqual(
+            call_command("lazy", "reports", "export", "out.csv", "-f", "json"),
+            {
+                "destination": "out.csv",
+                "format": "json",
+                "template": None,
+                "overwrite": False,
+            },
+        )
+        self.assertIn(TARGET, sys.modules)
+        self.assertEqual(call_command("lazy", "reports", "sum", limit=3), "Command: 3")
+        self.assertEqual(get_command("lazy", "reports", "sum")(limit=4), "Command: 4")
+
+    def test_stale_manifest(self):
+        self.help("reports", "export")
+        self.forget()
+        with mock.patch("django_typer.management.source_key", return_value="changed"):
+            self.assertNotIn("Export the report.", self.help("reports"))
+        self.assertNotIn(TARGET, sys.modules)
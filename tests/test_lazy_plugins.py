@@ -0,0 +1,94 @@
+import os
+import sys
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.test import TestCase
+
+from django_typer import utils
+from django_typer.management import get_command
+from django_typer.management.commands.shellcompletion import (
+    DETECTED_SHELL,
+    Command as ShellCompletion,
+)
+from tests.apps.test_app import plugins
+
+PLUGIN = "tests.apps.test_app.plugins.lazy"
+
+SHELL = {
+    "zsh": "zsh",
+    "bash": "bash",
+    "pwsh": "pwsh",
+    "powershell": "powershell",
+    "fish": "fish",
+}.get(DETECTED_SHELL, "bash")
+
+
+class LazyPluginTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache.name})
+        self.env.start()
+        sys.modules.pop(PLUGIN, None)
+
+    def tearDown(self):
+        utils._command_plugins.pop("lazy", None)
+        utils._plugin_manifests.pop(PLUGIN, None)
+        sys.modules.pop(PLUGIN, None)
+        self.env.stop()
+        self.cache.cleanup()
+        super().tearDown()
+
+    def complete(self, line):
+        shellcompletion = get_command("shellcompletion", ShellCompletion)
+        shellcompletion.init(shell=SHELL)
+        return shellcompletion.complete(line)
+
+    def run_argv(self, *args):
+        stdout = StringIO()
+        get_command("lazy", stdout=stdout).run_from_argv(["./manage.py", "lazy", *args])
+        return stdout.getvalue().strip()
+
+    def test_declared_manifest(self):
+        utils.register_command_plugins(
+            plugins, ["lazy"], manifest={"lazy": ["audit", "reports purge"]}
+        )
+        self.assertEqual(self.run_argv("status"), "ok")
+        self.assertNotIn("audit", self.complete("lazy status "))
+        self.assertNotIn("purge", self.complete("lazy reports export "))
+        self.assertNotIn(PLUGIN, sys.modules)
+
+        self.assertIn("purge", self.complete("lazy reports "))
+        self.assertIn(PLUGIN, sys.modules)
+        self.assertNotIn("lazy", utils._command_plugins)
+
+    def test_invoke_loads_plugin(self):
+        utils.register_command_plugins(
+            plugins, ["lazy"], manifest={"lazy": ["audit", "reports purge"]}
+        )
+        self.assertEqual(self.run_argv("audit"), "audited")
+        self.assertIn(PLUGIN, sys.modules)
+
+    def test_recorded_manifest(self):
+        # without a recorded manifest the plugin is loaded when the command is created
+        utils.register_command_plugins(plugins, ["lazy"], manifest=True)
+        get_command("lazy")
+        self.assertIn(PLUGIN, sys.modules)
+        self.assertNotIn("lazy", utils._command_plugins)
+
+        sys.modules.pop(PLUGIN)
+        utils.register_command_plugins(plugins, ["lazy"], manifest=True)
+        self.assertEqual(
+            utils._plugin_paths("lazy"), {PLUGIN: ["audit", "reports purge"]}
+        )
+        get_command("lazy")
+        self.assertNotIn(PLUGIN, sys.modules)
+        self.assertEqual(self.run_argv("reports", "purge"), "purged")
+        self.assertIn(PLUGIN, sys.modules)
+
+    def test_no_manifest(self):
+        utils.register_command_plugins(plugins, ["lazy"])
+        get_command("lazy")
+        self.assertIn(PLUGIN, sys.modules)
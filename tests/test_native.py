@@ -35,6 +35,7 @@
 │ --no-color                 Don't colorize the command output.                │
 │ --force-color              Force colorization of the command output.         │
 │ --skip-checks              Skip system checks.                               │
+│ --timings                  Print how long each phase of the command took.    │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 """
 
@@ -55,6 +56,7 @@
   --no-color         Don't colorize the command output.
   --force-color      Force colorization of the command output.
   --skip-checks      Skip system checks.
+  --timings          Print how long each phase of the command took.
   --help             Show this message and exit.
 """
 
@@ -91,6 +93,8 @@
 │ --force-color                                 Force colorization of the      │
 │                                               command output.                │
 │ --skip-checks                                 Skip system checks.            │
+│ --timings                                     Print how long each phase of   │
+│                                               the command took.              │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 ╭─ Commands ───────────────────────────────────────────────────────────────────╮
 │ grp1                                                                         │
@@ -382,6 +386,8 @@ class TestNativeGroupsWithSelf(TestNativeGroups):
 │                                              "/home/djangoprojects/myprojec… │
 │ --no-color                                   Don't colorize the command      │
 │                                              output.                         │
+│ --timings                                    Print how long each phase of    │
+│                                              the command took.               │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 """
 
@@ -403,6 +409,7 @@ class TestNativeGroupsWithSelf(TestNativeGroups):
   --pythonpath PATH          A directory to add to the Python path, e.g.
                              "/home/djangoprojects/myproject".
   --no-color                 Don't colorize the command output.
+  --timings                  Print how long each phase of the command took.
   --help                     Show this message and exit.
 """
 
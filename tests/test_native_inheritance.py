@@ -50,6 +50,8 @@ class TestNativeInheritanceGroupsWithSelf(test_native.TestNativeGroups):
 │                                             used.                            │
 │ --no-color                                  Don't colorize the command       │
 │                                             output.                          │
+│ --timings                                   Print how long each phase of the │
+│                                             command took.                    │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 ╭─ Commands ───────────────────────────────────────────────────────────────────╮
 │ grp1   Override GRP1 (initialize only)                                       │
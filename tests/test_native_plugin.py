@@ -34,6 +34,8 @@
 │                                             used.                            │
 │ --no-color                                  Don't colorize the command       │
 │                                             output.                          │
+│ --timings                                   Print how long each phase of the │
+│                                             command took.                    │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 ╭─ Commands ───────────────────────────────────────────────────────────────────╮
 │ grp1   Override GRP1 (initialize only)                                       │
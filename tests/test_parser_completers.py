@@ -22,6 +22,7 @@
 from django_typer.utils import with_typehint
 from django.db.models import Model
 from django.db.models import F
+from django.db.models import Q
 from django.db.models.functions import Cast
 from django.db.models import CharField
 from tests.apps.test_app.models import ShellCompleteTester, ChoicesShellCompleteTester
@@ -285,6 +286,52 @@ def test_model_object_parser_idempotency(self):
         parser = ModelObjectParser(Question)
         self.assertEqual(parser.convert(q1, None, None), q1)
 
+    def test_model_object_parser_bulk(self):
+        import click
+        from unittest import mock
+
+        from django_typer.parsers.model import ModelObjectParser, _bulk_lookups
+        from tests.apps.examples.polls.models import Question
+
+        polls = [
+            Question.objects.create(question_text=str(idx), pub_date=tz_utils.now())
+            for idx in range(5)
+        ]
+        missing = []
+        parser = ModelObjectParser(
+            Question,
+            on_error=lambda model_cls, value, exc: missing.append(value),
+        )
+        ids = [str(poll.id) for poll in polls]
+        values = [ids[0], "0", *ids[1:], ids[0], "-1"]
+        ctx = click.Context(click.Command("bulk"))
+        # 7 distinct values are fetched in chunks of 2
+        with (
+            ctx.scope(),
+            mock.patch.object(connection.features, "max_query_params", 2),
+            self.assertNumQueries(4),
+            _bulk_lookups(ctx),
+        ):
+            ctx.params["polls"] = tuple(
+                parser.convert(value, None, None) for value in values
+            )
+        self.assertEqual(
+            ctx.params["polls"], (polls[0], None, *polls[1:], polls[0], None)
+        )
+        self.assertEqual(missing, ["0", "-1"])
+
+    def test_model_object_parser_callback(self):
+        from tests.apps.test_app.management.commands import model_callback
+
+        for name in ["a", "b"]:
+            ShellCompleteTester.objects.create(char_field=name)
+        model_callback.received.clear()
+        self.assertEqual(call_command("model_callback", "a", "b"), "a,b")
+        # lookups are resolved before the callback is called
+        self.assertTrue(model_callback.received)
+        for received in model_callback.received:
+            self.assertEqual(received, [ShellCompleteTester, ShellCompleteTester])
+
     def test_app_label_parser_idempotency(self):
         from django_typer.parsers.apps import app_config
 
@@ -460,6 +507,115 @@ def test_char_field(self):
         with self.assertRaises(RuntimeError):
             call_command("model_fields", "test", "--ichar", "jane")
 
+    def test_char_field_prefix_ranges(self):
+        import click
+        from django.db import connection
+
+        from django_typer.completers.model import (
+            ModelObjectCompleter,
+            prefix_range,
+            text_query,
+        )
+
+        self.assertEqual(prefix_range("ja"), ("ja", "jb"))
+
+        # ranges are only applied when the collation is known to be binary
+        self.assertEqual(
+            text_query("ja", "char_field", prefix_ranges=True),
+            Q(char_field__startswith="ja"),
+        )
+        sql = str(
+            ShellCompleteTester.objects.filter(
+                text_query(
+                    "ja",
+                    "char_field",
+                    prefix_ranges=True,
+                    queryset=ShellCompleteTester.objects.all(),
+                )
+            ).query
+        )
+        if connection.vendor in {"sqlite", "postgresql"}:
+            self.assertIn(">=", sql)
+            self.assertEqual(
+                'COLLATE "C"' in sql, connection.vendor == "postgresql", sql
+            )
+        else:
+            self.assertNotIn(">=", sql)
+        self.assertEqual(prefix_range(f"j{chr(0x10FFFF)}"), (f"j{chr(0x10FFFF)}", "k"))
+        self.assertEqual(prefix_range(chr(0x10FFFF)), (chr(0x10FFFF), None))
+
+        ShellCompleteTester.objects.create(char_field="JAne")
+        ShellCompleteTester.objects.create(char_field="École")
+        ctx = click.Context(click.Command("complete"))
+        param = click.Argument(["obj"])
+        for case_insensitive, incomplete, expected in [
+            (False, "ja", {"jack", "jason"}),
+            (True, "Ja", {"Jack", "Jason", "Jane"}),
+            (True, "jo", {"jon", "john"}),
+            (False, "Éc", {"École"}),
+            (True, "Éc", {"École"}),
+        ]:
+            completer = ModelObjectCompleter(
+                ShellCompleteTester,
+                "char_field",
+                case_insensitive=case_insensitive,
+                prefix_ranges=True,
+            )
+            self.assertEqual(
+                {item.value for item in completer(ctx, param, incomplete)}, expected
+            )
+
+    def test_completer_index_check(self):
+        from django_typer.apps import check_completer_indexes
+        from django_typer.completers.model import ModelObjectCompleter
+
+        self.assertEqual(
+            ModelObjectCompleter(ShellCompleteTester, "char_field").check_index(), []
+        )
+        self.assertEqual(
+            ModelObjectCompleter(ShellCompleteTester, "id").check_index(), []
+        )
+        self.assertEqual(
+            [
+                msg.id
+                for msg in ModelObjectCompleter(
+                    ShellCompleteTester, "text_field"
+                ).check_index()
+            ],
+            ["django_typer.W002"],
+        )
+        self.assertEqual(
+            [
+                msg.id
+                for msg in ModelObjectCompleter(
+                    ShellCompleteTester, "char_field", case_insensitive=True
+                ).check_index()
+            ],
+            ["django_typer.W003"],
+        )
+        self.assertEqual(
+            [
+                msg.id
+                for msg in ModelObjectCompleter(
+                    ShellCompleteTester,
+                    "char_field",
+                    case_insensitive=True,
+                    prefix_ranges=True,
+                ).check_index()
+            ],
+            ["django_typer.W002"],
+        )
+
+        messages = {
+            msg.obj: msg.id
+            for msg in check_completer_indexes(
+                [apps.get_app_config("test_app")], databases=["default"]
+            )
+        }
+        self.assertEqual(messages["model_fields test ichar"], "django_typer.W003")
+        self.assertEqual(messages["model_fields test text"], "django_typer.W002")
+        self.assertNotIn("model_fields test char", messages)
+
     def test_file_field(self):
         completions = get_values(
             self.shellcompletion.complete("model_fields test --file ")
@@ -1903,7 +2059,7 @@ def test_pythonpath_completer(self):
         self.assertNotIn("src/django_typer/__init__.py", result)
 
         result = self.shellcompletion.complete(
-            "multi --pythonpath src/django_typer/man"
+            "multi --pythonpath src/django_typer/manag"
         )
         self.assertIn("src/django_typer/management/commands", result)
         self.assertNotIn("src/django_typer/examples", result)
@@ -1983,7 +2139,9 @@ def test_path_completer(self):
         self.assertIn("src/django_typer/locale", result)
         self.assertIn("src/django_typer/__init__.py", result)
 
-        result = self.shellcompletion.complete("completion --path src/django_typer/man")
+        result = self.shellcompletion.complete(
+            "completion --path src/django_typer/manag"
+        )
         self.assertIn("src/django_typer/management/__init__.py", result)
         self.assertIn("src/django_typer/management/commands", result)
         self.assertNotIn("src/django_typer/examples", result)
@@ -2015,6 +2173,95 @@ def test_path_completer(self):
         )
         self.assertNotIn("src/django_typer", result)
 
+    def test_path_completer_listing_cache(self):
+        import tempfile
+        from unittest import mock
+
+        from django_typer.completers import path
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for idx in range(5):
+                (Path(tmp) / f"file{idx}.txt").touch()
+            (Path(tmp) / "only" / "leaf").mkdir(parents=True)
+            (Path(tmp) / "only" / "leaf" / "a.txt").touch()
+
+            with mock.patch.object(path.os, "scandir", wraps=os.scandir) as scandir:
+                completions = path.paths(None, None, f"{tmp}/", max_results=3)
+                self.assertEqual(
+                    [item.value for item in completions[:3]],
+                    [f"{tmp}/{name}" for name, _ in path._listing(Path(tmp))][:3],
+                )
+                self.assertEqual(completions[3].value, f"{tmp}/")
+                self.assertEqual(completions[3].help, "3 more entries")
+
+                # single matches recurse into directories listed only once
+                completions = path.paths(None, None, f"{tmp}/o")
+                self.assertEqual(
+                    [item.value for item in completions], [f"{tmp}/only/leaf/a.txt"]
+                )
+                path.paths(None, None, f"{tmp}/o")
+                self.assertEqual(scandir.call_count, 3)
+
+                # listings of modified directories are not reused
+                (Path(tmp) / "file5.txt").touch()
+                os.utime(tmp, ns=(0, 0))
+                self.assertEqual(len(path.paths(None, None, f"{tmp}/f")), 6)
+                self.assertEqual(scandir.call_count, 4)
+
+    def test_import_path_module_index(self):
+        import pkgutil
+        import sys
+        import tempfile
+        import time
+        from unittest import mock
+
+        from django_typer.completers import path
+        from django_typer.manifest import manifest_dir
+
+        with (
+            tempfile.TemporaryDirectory() as cache,
+            tempfile.TemporaryDirectory() as tmp,
+            mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache}),
+            mock.patch.object(sys, "path", [tmp]),
+            mock.patch.dict(path._module_indexes, clear=True),
+        ):
+            for name in ["alpha", "beta", "betamax"]:
+                (Path(tmp) / f"{name}.py").touch()
+            (Path(tmp) / "pkg").mkdir()
+            (Path(tmp) / "pkg" / "__init__.py").touch()
+            (Path(tmp) / "pkg" / "mod.py").touch()
+
+            complete = lambda incomplete: [
+                item.value for item in path.import_paths(None, None, incomplete)
+            ]
+            self.assertEqual(complete("bet"), ["beta", "betamax"])
+            self.assertEqual(complete("p"), ["pkg.mod"])
+            self.assertEqual(len(list(manifest_dir().iterdir())), 1)
+
+            # indexes are reused - from memory or from the manifest
+            with mock.patch.object(
+                pkgutil, "iter_modules", wraps=pkgutil.iter_modules
+            ) as iter_modules:
+                path._module_indexes.clear()
+                self.assertEqual(complete("a"), ["alpha"])
+                self.assertEqual(complete("pkg."), ["pkg.mod"])
+                self.assertEqual(iter_modules.call_count, 0)
+
+                # indexes of modified directories are rebuilt
+                (Path(tmp) / "alphabet.py").touch()
+                os.utime(tmp, ns=(0, 0))
+                self.assertEqual(complete("a"), ["alpha", "alphabet"])
+                self.assertEqual(iter_modules.call_count, 1)
+
+                # new packages do not modify their parent, indexes expire instead
+                (Path(tmp) / "alps").mkdir()
+                (Path(tmp) / "alps" / "__init__.py").touch()
+                os.utime(tmp, ns=(0, 0))
+                self.assertEqual(complete("a"), ["alpha", "alphabet"])
+                later = time.time() + path.MODULE_INDEX_TTL + 1
+                with mock.patch.object(path, "time", return_value=later):
+                    self.assertEqual(complete("a"), ["alpha", "alphabet", "alps"])
+
     def test_mixed_divider_path_completer(self):
         shellcompletion = get_command("shellcompletion", ShellCompletion)
         shellcompletion.init(shell=SHELL)
@@ -2059,6 +2306,52 @@ def test_these_strings_completer(self):
         for s in ["str1", "str2", "ustr"]:
             self.assertIn(f"{s}", result)
 
+    def test_these_strings_matcher(self):
+        from unittest import mock
+
+        from django_typer.completers import chain, these_strings
+
+        def values(completer, incomplete):
+            return [item.value for item in completer(None, None, incomplete)]
+
+        skus = (f"SKU-{idx:05d}" for idx in reversed(range(1000)))
+        complete = these_strings(skus, allow_duplicates=True)
+        self.assertEqual(
+            values(complete, "SKU-0000"),
+            [f"SKU-0000{idx}" for idx in reversed(range(10))],
+        )
+        # generators are indexed once, so they complete more than once
+        self.assertEqual(values(complete, "SKU-00999"), ["SKU-00999"])
+        self.assertEqual(values(complete, "SKU-1"), [])
+
+        complete = these_strings(
+            [("Beta", "b"), "alpha", "ALPHABET", "gamma"],
+            allow_duplicates=True,
+            case_sensitive=False,
+            max_results=1,
+        )
+        self.assertEqual(values(complete, "alp"), ["alpha", "alp"])
+        self.assertEqual(complete(None, None, "alp")[1].help, "1 more entries")
+        self.assertEqual(complete(None, None, "b")[0].help, "b")
+
+        strings = mock.Mock(return_value=["one", "two", "three"])
+        complete = these_strings(strings, allow_duplicates=True, ttl=60)
+        self.assertEqual(values(complete, "t"), ["two", "three"])
+        self.assertEqual(values(complete, "o"), ["one"])
+        self.assertEqual(strings.call_count, 1)
+        complete = these_strings(strings, allow_duplicates=True)
+        self.assertEqual(values(complete, "t"), ["two", "three"])
+        self.assertEqual(values(complete, "tw"), ["two"])
+        self.assertEqual(strings.call_count, 3)
+
+        complete = chain(
+            these_strings(["a1", "a2"], allow_duplicates=True),
+            these_strings(["a2", "a3"], allow_duplicates=True),
+            allow_duplicates=True,
+            max_results=2,
+        )
+        self.assertEqual(values(complete, "a"), ["a1", "a2", "a"])
+
     def test_chain_and_commands_completer(self):
         result = self.shellcompletion.complete("completion --cmd dj").strip()
 
@@ -155,3 +155,52 @@ def test_timing():
     # notify us if adding typer inflates command exec time by more than 20 percent
     assert no_typer_seconds / typer_seconds > 0.2
     assert no_typer_seconds / typer_no_app_seconds > 0.2
+
+
+def test_direct_invocation_overhead():
+    """
+    Microbenchmark the per call overhead of invoking command functions directly
+    through get_command() and through attribute access on command instances.
+    """
+    from timeit import repeat
+
+    from django_typer.management import get_command
+
+    command = get_command("groups")
+    plain = type(command).divide
+    divide = get_command("groups", "math", "divide")
+    proxy = command.math.divide
+
+    def per_call(func, *args, number=2000):
+        return min(repeat(lambda: func(*args), number=number, repeat=5)) / number
+
+    plain_s = per_call(plain, command, 10, 2, [])
+    direct_s = per_call(divide, 10, 2, [])
+    proxy_s = per_call(proxy, 10, 2, [])
+    attr_s = per_call(lambda: command.math.divide(10, 2, []))
+
+    print(f"\nplain function call: {plain_s * 1e6:0.3f} us")
+    print(f"get_command() callable: {direct_s * 1e6:0.3f} us")
+    print(f"bound proxy: {proxy_s * 1e6:0.3f} us")
+    print(f"attribute access and call: {attr_s * 1e6:0.3f} us")
+
+    # get_command() returns the bound function itself and proxies only add a
+    # cached invoker lookup - the timings above are informational only
+    assert divide.__func__ is plain
+    invoker = command._invoker(proxy.proxied)
+    assert invoker.__func__ is plain
+    assert invoker.__self__ is command
+
+    from unittest import mock
+
+    from django_typer import management
+
+    command = get_command("groups")
+    with mock.patch.object(
+        management,
+        "_get_direct_function",
+        wraps=management._get_direct_function,
+    ) as resolve:
+        for _ in range(3):
+            assert command.math.divide(10, 2, []) == "5.00"
+    assert resolve.call_count == 1
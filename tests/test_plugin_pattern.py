@@ -22,6 +22,7 @@
   --no-color         Don't colorize the command output.
   --force-color      Force colorization of the command output.
   --skip-checks      Skip system checks.
+  --timings          Print how long each phase of the command took.
   --help             Show this message and exit.
 
 Commands:
@@ -59,6 +60,7 @@
 │ --no-color                 Don't colorize the command output.                │
 │ --force-color              Force colorization of the command output.         │
 │ --skip-checks              Skip system checks.                               │
+│ --timings                  Print how long each phase of the command took.    │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 ╭─ Commands ───────────────────────────────────────────────────────────────────╮
 │ adapted                                                                      │
@@ -127,6 +129,7 @@
 │ --no-color                 Don't colorize the command output.                │
 │ --force-color              Force colorization of the command output.         │
 │ --skip-checks              Skip system checks.                               │
+│ --timings                  Print how long each phase of the command took.    │
 ╰──────────────────────────────────────────────────────────────────────────────╯
 """
 adapted_help_no_adapters_no_rich = """
@@ -146,6 +149,7 @@
   --no-color         Don't colorize the command output.
   --force-color      Force colorization of the command output.
   --skip-checks      Skip system checks.
+  --timings          Print how long each phase of the command took.
   --help             Show this message and exit.
 """
 
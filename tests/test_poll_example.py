@@ -1,7 +1,7 @@
 import contextlib
 from io import StringIO
 
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
 from django.test import TestCase
 from django.utils import timezone
 import contextlib
@@ -105,6 +105,20 @@ def test_tutorial_modelobjparser_cmd(self):
         cmd(polls=[self.q1])
         self.assertEqual(log.getvalue().count("Successfully"), 3)
 
+    def test_tutorial_modelobjparser_bulk(self):
+        log = StringIO()
+        polls = [str(q.id) for q in [self.q1, self.q2, self.q3]]
+        # one query to fetch all of the polls and one update per poll
+        with self.assertNumQueries(4):
+            call_command(f"closepoll_t6{self.typer}", *polls, stdout=log)
+        self.assertEqual(log.getvalue().count("Successfully"), 3)
+        self.assertFalse(Question.objects.filter(opened=True).exists())
+
+        missing = str(self.q3.id + 100)
+        with self.assertRaises(CommandError) as err:
+            call_command(f"closepoll_t6{self.typer}", polls[0], missing, stdout=log)
+        self.assertIn(f"'{missing}' does not exist", str(err.exception))
+
     def test_poll_ex(self):
         with contextlib.redirect_stdout(StringIO()) as output:
             call_command(f"closepoll{self.typer}", str(self.q2.id))
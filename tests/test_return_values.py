@@ -1,7 +1,10 @@
+from io import StringIO
+
 from django.core.management import call_command
 from django.test import TestCase
 
 from django_typer.management import get_command
+from tests.apps.test_app.models import ShellCompleteTester
 from tests.utils import run_command
 
 
@@ -19,3 +22,34 @@ def test_return_cli(self):
 
     def test_return_call(self):
         self.assertEqual(call_command("return"), {"key": "value"})
+
+
+class TestStreamResult(TestCase):
+    def test_stream_generator(self):
+        stdout = StringIO()
+        self.assertIsNone(call_command("stream_result", "lines", stdout=stdout))
+        self.assertEqual(
+            stdout.getvalue(), "".join(f"line {idx}\n" for idx in range(5))
+        )
+        self.assertEqual(
+            run_command("stream_result", "lines", "--count", "3")[0].splitlines(),
+            ["line 0", "line 1", "line 2"],
+        )
+
+    def test_iterators_not_streamed_by_default(self):
+        # the iterator is returned from call_command untouched
+        command = get_command("stream_result", stdout=StringIO())
+        command.stream_results = False
+        lines = call_command(command, "lines", "--count", "2")
+        self.assertEqual(list(lines), ["line 0", "line 1"])
+
+    def test_direct_call_not_streamed(self):
+        lines = get_command("stream_result", "lines")(count=2)
+        self.assertEqual(list(lines), ["line 0", "line 1"])
+
+    def test_stream_queryset(self):
+        for name in ["a", "b", "c"]:
+            ShellCompleteTester.objects.create(char_field=name, text_field=name * 2)
+        stdout = StringIO()
+        call_command("stream_result", "objects", "--field", "text_field", stdout=stdout)
+        self.assertEqual(stdout.getvalue(), "aa\nbb\ncc\n")
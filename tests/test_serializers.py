@@ -0,0 +1,122 @@
+import json
+import os
+import subprocess
+import sys
+from importlib.util import find_spec
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from django_typer.management import get_command
+from django_typer.serializers import MessagePackSerializer
+from tests.apps.test_app.models import ShellCompleteTester
+from tests.utils import manage_py, run_command
+
+msgpack_installed = find_spec("msgpack") is not None
+
+
+class TestSerializers(TestCase):
+    def setUp(self):
+        super().setUp()
+        for name, number in [("a", 1.5), ("b", None), ("c", 3.0)]:
+            ShellCompleteTester.objects.create(char_field=name, float_field=number)
+
+    def serialize(self, *args) -> str:
+        stdout = StringIO()
+        self.assertIsNone(call_command("serialize_result", *args, stdout=stdout))
+        return stdout.getvalue()
+
+    def test_jsonl_objects(self):
+        lines = self.serialize("--format", "jsonl", "objects").splitlines()
+        objects = [json.loads(line) for line in lines]
+        self.assertEqual([obj["char_field"] for obj in objects], ["a", "b", "c"])
+        self.assertEqual([obj["float_field"] for obj in objects], [1.5, None, 3.0])
+        self.assertEqual(
+            [obj["id"] for obj in objects],
+            list(
+                ShellCompleteTester.objects.order_by("pk").values_list("pk", flat=True)
+            ),
+        )
+
+    def test_jsonl_single(self):
+        self.assertEqual(
+            self.serialize("--format", "jsonl", "single"),
+            '{"key": "value", "when": "2026-01-02"}\n',
+        )
+
+    def test_csv(self):
+        self.assertEqual(
+            self.serialize("--format", "csv", "values").splitlines(),
+            ["char_field,float_field", "a,1.5", "b,", "c,3.0"],
+        )
+        self.assertEqual(
+            self.serialize("--format", "csv", "rows").splitlines(), ["a,1", "b,2"]
+        )
+
+    def test_default_output(self):
+        self.assertEqual(self.serialize("rows").splitlines(), ["('a', 1)", "('b', 2)"])
+
+    def test_unknown_format(self):
+        with self.assertRaises(CommandError):
+            call_command("serialize_result", "--format", "xml", "single")
+        _, stderr, retcode = run_command(
+            "serialize_result", "--format", "xml", "single"
+        )
+        self.assertNotEqual(retcode, 0)
+        self.assertIn("xml is not one of: jsonl, csv, msgpack", stderr)
+
+    def test_serializers_imported_lazily(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, django; django.setup(); "
+                "import django_typer.management, django_typer.types; "
+                "print('django_typer.serializers' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=manage_py.parent,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "tests.settings.base"},
+        )
+        self.assertEqual(result.stdout.strip(), "False", result.stderr)
+
+    def test_format_option_opt_in(self):
+        self.assertIn("--format", run_command("serialize_result", "--help")[0])
+        self.assertNotIn("--format", run_command("stream_result", "--help")[0])
+
+    def test_result_format(self):
+        command = get_command("serialize_result", stdout=StringIO())
+        command.result_format = "jsonl"
+        self.assertIsNone(command.execute("rows"))
+        self.assertEqual(command.stdout._out.getvalue(), '["a", 1]\n["b", 2]\n')
+
+    def test_msgpack_text_stream(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "serialize_result", "--format", "msgpack", "single", stdout=StringIO()
+            )
+
+    @pytest.mark.skipif(msgpack_installed, reason="msgpack is installed")
+    def test_msgpack_not_installed(self):
+        stdout, stderr, retcode = run_command(
+            "serialize_result", "--format", "msgpack", "single"
+        )
+        self.assertNotEqual(retcode, 0)
+        self.assertIn("requires the msgpack package", stderr)
+
+    @pytest.mark.skipif(not msgpack_installed, reason="msgpack is not installed")
+    def test_msgpack(self):
+        import msgpack
+
+        stream = BytesIO()
+        serializer = MessagePackSerializer(stream)
+        for obj in ShellCompleteTester.objects.order_by("pk"):
+            serializer.write(obj)
+        serializer.close()
+        stream.seek(0)
+        self.assertEqual(
+            [obj["char_field"] for obj in msgpack.Unpacker(stream)], ["a", "b", "c"]
+        )
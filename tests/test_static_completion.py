@@ -0,0 +1,210 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from django_typer.management import get_command
+from django_typer.management.commands.shellcompletion import Command as ShellCompletion
+from django_typer.shells.bash import BashComplete
+from tests.utils import run_command
+
+
+def get_completer(shell, **kwargs):
+    shellcompletion = get_command("shellcompletion", ShellCompletion)
+    shellcompletion.init(shell=shell)
+    shellcompletion.fallback = None
+    return shellcompletion.shell_class(
+        prog_name="manage.py", command=shellcompletion, static=True, **kwargs
+    )
+
+
+def test_static_table():
+    table = get_completer("zsh").static_table()
+    assert table["n:"] == "s"
+    assert "shellcompletion" in table["l:"].splitlines()
+    assert table["l:\tshellcompletion"] == "plain\nshellcompletion\n_"
+
+    assert table["n:shellcompletion"] == "s"
+    assert table["l:shellcompletion"].splitlines() == [
+        "install",
+        "uninstall",
+        "complete",
+        "serve",
+    ]
+    assert table["f:shellcompletion\t--shell"] == "v:shell"
+    assert table["f:shellcompletion\t--no-color"] == "o:no_color"
+    assert "bash" in table["c:shellcompletion\t--shell"].splitlines()
+
+    # positional arguments are completed dynamically
+    assert table["n:shellcompletion complete"] == "d"
+    # the fallback and settings options have completion callbacks
+    assert "c:shellcompletion install\t--fallback" not in table
+    assert "c:shellcompletion\t--settings" not in table
+
+    # click choices
+    assert table["c:choices\t--char-choices"].splitlines()[:3] == ["git", "svn", "hg"]
+
+    # subcommands of chained groups may be followed by their siblings
+    assert table["n:chain"] == "s"
+    assert table["n:chain command1"] == "d"
+
+
+def test_static_custom_fallback():
+    shellcompletion = get_command("shellcompletion", ShellCompletion)
+    shellcompletion.init(shell="zsh")
+    shellcompletion.fallback = "django_typer.completers.path.paths"
+    table = shellcompletion.shell_class(
+        prog_name="manage.py", command=shellcompletion, static=True
+    ).static_table()
+    assert table["n:"] == "d"
+    assert "l:" not in table
+    assert table["n:shellcompletion"] == "s"
+
+
+@pytest.mark.parametrize("shell", ["bash", "zsh", "fish", "pwsh"])
+def test_static_install_script(shell):
+    completer = get_completer(shell)
+    source = completer.source()
+    assert f"{completer.func_name}_static" in source
+    assert "shellcompletion" in source
+    completer.static = False
+    assert f"{completer.func_name}_static" not in completer.source()
+
+
+BASH_HARNESS = """
+source {script}
+line="$1"
+COMP_LINE="$line"
+COMP_POINT=${{#line}}
+read -ra COMP_WORDS <<< "$line"
+[[ $line == *" " ]] && COMP_WORDS+=("")
+COMP_CWORD=$(( ${{#COMP_WORDS[@]}} - 1 ))
+response=()
+if {func}_static; then
+    printf '%s\\n' "${{response[@]}}"
+else
+    echo DYNAMIC
+fi
+"""
+
+ZSH_HARNESS = """
+compdef() {{ :; }}
+source {script}
+line="$1"
+words=(${{(z)line}})
+[[ $line == *" " ]] && words+=("")
+CURRENT=${{#words}}
+SUFFIX=""
+response=()
+if {func}_static 2; then
+    printf '%s\\n' "${{response[@]}}"
+else
+    echo DYNAMIC
+fi
+"""
+
+FISH_HARNESS = """
+function commandline
+    switch "$argv[1]"
+        case -cp -p
+            printf '%s' "$HARNESS_LINE"
+        case -opc
+            string split -n ' ' -- (string replace -r -- '\\S*$' '' "$HARNESS_LINE")
+        case -ct
+            string match -r -- '\\S*$' "$HARNESS_LINE"
+    end
+end
+source {script}
+if set -l results ({func}_static)
+    printf '%s\\n' $results
+else
+    echo DYNAMIC
+end
+"""
+
+needs_bash = pytest.mark.skipif(
+    not (shutil.which("bash") and (BashComplete._check_version() or (0, 0)) >= (4, 2)),
+    reason="bash >= 4.2 is required for static completion",
+)
+needs_zsh = pytest.mark.skipif(not shutil.which("zsh"), reason="zsh is not installed")
+needs_fish = pytest.mark.skipif(
+    not shutil.which("fish"), reason="fish is not installed"
+)
+
+SHELLS = [
+    pytest.param("bash", marks=needs_bash),
+    pytest.param("zsh", marks=needs_zsh),
+    pytest.param("fish", marks=needs_fish),
+]
+
+
+def run_static(shell, line, tmp_path):
+    """
+    Run the static completion walker of the shell's installed script on the line.
+    """
+    completer = get_completer(shell)
+    script = tmp_path / f"completion.{shell}"
+    script.write_text(completer.source())
+    harness = {"bash": BASH_HARNESS, "zsh": ZSH_HARNESS, "fish": FISH_HARNESS}[shell]
+    return subprocess.run(
+        [
+            shell,
+            "-c",
+            harness.format(script=script, func=f"_{completer.func_name}"),
+            "harness",
+            line,
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "HARNESS_LINE": line},
+    ).stdout
+
+
+@pytest.mark.parametrize("shell", SHELLS)
+@pytest.mark.parametrize(
+    "line",
+    [
+        "manage.py sh",
+        "manage.py ",
+        "manage.py shellcompletion ",
+        "manage.py shellcompletion u",
+        "manage.py shellcompletion --",
+        "manage.py shellcompletion --shell ",
+        "manage.py shellcompletion --shell b",
+        "manage.py shellcompletion --shell bash --",
+        "manage.py shellcompletion --shell bash ",
+        "manage.py shellcompletion install ",
+        "manage.py shellcompletion install --no-prompt --",
+        "manage.py shellcompletion install --no-prompt x",
+        "manage.py choices --char-choices ",
+        "manage.py choices --char-choices s",
+        "manage.py bug_145 grp cmd --",
+    ],
+)
+def test_static_matches_dynamic(shell, line, tmp_path):
+    static = run_static(shell, line, tmp_path)
+    assert "DYNAMIC" not in static
+    dynamic = run_command(
+        "shellcompletion", "--shell", shell, "complete", line, parse_json=False
+    )[0]
+    assert static.split() == dynamic.split()
+
+
+@pytest.mark.parametrize("shell", SHELLS)
+@pytest.mark.parametrize(
+    "line",
+    [
+        "manage.py -",
+        "manage.py shellcompletion complete ",
+        "manage.py shellcompletion install --fallback ",
+        "manage.py shellcompletion --shell bash --shell ",
+        "manage.py chain command1 ",
+        "manage.py unknown ",
+        "manage.py shellcompletion --shell=",
+        "manage.py 'shellcompletion' ",
+    ],
+)
+def test_static_dynamic(shell, line, tmp_path):
+    assert run_static(shell, line, tmp_path).strip() == "DYNAMIC"
@@ -0,0 +1,87 @@
+import time
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from django_typer.management import get_command
+from django_typer.timings import Timer, timings_recorded
+
+
+def test_timer_exclusive_phases():
+    timer = Timer()
+    with timer.phase("outer"):
+        time.sleep(0.02)
+        with timer.phase("inner"):
+            time.sleep(0.05)
+        with timer.phase("inner"):
+            time.sleep(0.05)
+    assert list(timer.phases) == ["inner", "outer"]
+    assert timer.phases["inner"] >= 0.1
+    assert 0.02 <= timer.phases["outer"] < 0.1
+    assert timer.total == sum(timer.phases.values())
+
+    timings = timer.as_dict(command="test")
+    assert timings["command"] == "test"
+    assert timings["phases"] == timer.phases
+    assert "inner" in timer.render() and "total" in timer.render()
+
+    timer.reset()
+    assert timer.phases == {}
+
+
+class TimingsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.recorded = []
+        timings_recorded.connect(self.receiver)
+
+    def tearDown(self):
+        timings_recorded.disconnect(self.receiver)
+        super().tearDown()
+
+    def receiver(self, sender, command, timings, **_):
+        self.recorded.append((sender, command, timings))
+
+    def test_timings_recorded(self):
+        stderr = StringIO()
+        self.assertEqual(
+            call_command("groups", "echo", "hello", stderr=stderr).strip(), "hello"
+        )
+        self.assertEqual(stderr.getvalue(), "")
+
+        self.assertEqual(len(self.recorded), 1)
+        sender, command, timings = self.recorded[0]
+        self.assertIs(sender, type(command))
+        self.assertEqual(timings["command"], "groups")
+        for phase in ["create_parser", "parse", "convert", "callbacks", "invoke"]:
+            self.assertIn(phase, timings["phases"])
+        self.assertAlmostEqual(timings["total"], sum(timings["phases"].values()))
+        # the timer is reset for the next run
+        self.assertEqual(command.timer.phases, {})
+
+    def test_timings_option(self):
+        stderr = StringIO()
+        call_command("finalize_simple", "--timings", stderr=stderr, skip_checks=False)
+        output = stderr.getvalue()
+        for phase in ["checks", "parse", "callbacks", "finalize", "total"]:
+            self.assertIn(phase, output)
+        self.assertEqual(len(self.recorded), 1)
+
+    def test_timings_suppressed(self):
+        from django_typer.management import TyperCommand
+
+        class Command(TyperCommand):
+            suppressed_base_arguments = {"--timings"}
+
+            def handle(self):
+                return "handled"
+
+        def dests(command):
+            return [
+                action.dest
+                for action in command.create_parser("./manage.py", "cmd")._actions
+            ]
+
+        self.assertIn("timings", dests(get_command("groups")))
+        self.assertNotIn("timings", dests(Command()))
@@ -0,0 +1,92 @@
+import gc
+import json
+import os
+import tempfile
+import weakref
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from django_typer.management import TyperCommand
+from django_typer.utils import get_current_command
+from tests.utils import run_command
+
+BATCH = """\
+groups echo hello
+# comments and blank lines are skipped
+
+{"argv": ["batch_env", "BATCH_VAR"], "env": {"BATCH_VAR": "set"}}
+batch_env BATCH_VAR
+unknown_command
+groups math divide 1 0 1
+{"argv": "groups echo"}
+groups echo 'hello world'
+"""
+
+
+class TyperBatchTests(TestCase):
+    def batch(self, *args, lines=BATCH):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "batch.txt"
+            path.write_text(lines)
+            stdout = StringIO()
+            try:
+                call_command("typer_batch", str(path), *args, stdout=stdout)
+            except CommandError as err:
+                self.assertIn("invocation(s) failed", str(err))
+            return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_batch(self):
+        results = self.batch()
+        self.assertEqual(
+            [(result["line"], result["status"]) for result in results],
+            [(1, 0), (4, 0), (5, 0), (6, 1), (7, 1), (8, 2), (9, 0)],
+        )
+        self.assertEqual(results[0]["argv"], ["groups", "echo", "hello"])
+        self.assertEqual(results[0]["stdout"], "hello\n")
+        self.assertEqual(results[1]["stdout"].strip(), "set")
+        # the environment is restored after each invocation
+        self.assertEqual(results[2]["stdout"].strip(), "<unset>")
+        self.assertNotIn("BATCH_VAR", os.environ)
+        self.assertIn("Unknown command", results[3]["stderr"])
+        self.assertIn("ZeroDivisionError", results[4]["stderr"])
+        self.assertIn("Invalid invocation", results[5]["stderr"])
+        self.assertEqual(results[6]["stdout"], "hello world\n")
+        self.assertIsNone(get_current_command())
+
+    def test_connections(self):
+        with mock.patch(
+            "django_typer.management.commands.typer_batch.connections"
+        ) as connections:
+            self.batch(lines="groups echo hello\n")
+            connections.close_all.assert_not_called()
+            self.batch("--no-reuse-connections", lines="groups echo hello\n")
+            connections.close_all.assert_called_once()
+
+    def test_commands_released(self):
+        instances = weakref.WeakSet()
+        init = TyperCommand.__init__
+
+        def track(self, *args, **kwargs):
+            init(self, *args, **kwargs)
+            if self._name == "groups":
+                instances.add(self)
+
+        with mock.patch.object(TyperCommand, "__init__", track):
+            self.batch(lines="groups echo hello\ngroups math divide 1 0 1\n")
+        gc.collect()
+        self.assertEqual(len(instances), 0)
+
+    def test_stdin(self):
+        stdout, stderr, retcode = run_command(
+            "typer_batch",
+            input=b"groups echo hello\nunknown_command\n",
+            parse_json=False,
+        )
+        self.assertEqual(retcode, 1)
+        self.assertIn("1 invocation(s) failed", stderr)
+        results = [json.loads(line) for line in stdout.splitlines()]
+        self.assertEqual([result["status"] for result in results], [0, 1])
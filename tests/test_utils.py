@@ -48,6 +48,45 @@ def func6(): ...
     assert not accepts_var_kwargs(func6)
 
 
+def test_signature_cache():
+    import gc
+    import inspect
+    import weakref
+    from unittest import mock
+
+    from django_typer import utils
+
+    def method(self, a, b=None): ...
+
+    def func(a, **kwargs): ...
+
+    with mock.patch("inspect.signature", wraps=inspect.signature) as signature:
+        for _ in range(3):
+            assert utils.is_method(method)
+            assert not utils.is_method(func)
+            assert utils.accepted_kwargs(method, {"b": 1, "c": 2}) == {"b": 1}
+            assert utils.accepted_kwargs(func, {"b": 1, "c": 2}) == {"b": 1, "c": 2}
+            assert utils.accepts_var_kwargs(func)
+        assert signature.call_count == 2
+
+    # functions are only weakly referenced
+    assert method in utils._signatures
+    ref = weakref.ref(method)
+    del method, signature  # the mock remembers its calls
+    gc.collect()
+    assert ref() is None
+
+    size = len(utils._signatures)
+
+    # the cache is bounded
+    with mock.patch.object(utils, "_SIGNATURE_CACHE_SIZE", size):
+        utils.is_method(lambda self: None)
+        assert len(utils._signatures) <= size
+
+    # callables that can not be weakly referenced are not cached
+    assert utils.accepts_var_kwargs(dict.get) is False
+
+
 def test_call_frame_check():
     result = subprocess.run(
         [sys.executable, str(check_frame.absolute())], text=True, capture_output=True
@@ -0,0 +1,178 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from django_typer import runner
+from tests.utils import manage_py
+
+pytestmark = pytest.mark.skipif(
+    not runner.supported, reason="The warm runner is not supported on this platform."
+)
+
+SETTINGS = "tests.settings.base"
+PYTHONPATH = str(manage_py.parent)
+
+
+@pytest.fixture
+def warm_runner(tmp_path):
+    socket = tmp_path / "runner.sock"
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from django_typer.runner import serve_main; "
+            "sys.exit(serve_main())",
+            "--settings",
+            SETTINGS,
+            "--pythonpath",
+            PYTHONPATH,
+            "--socket",
+            str(socket),
+            "--idle-timeout",
+            "30",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    for _ in range(200):
+        if socket.exists():
+            break
+        time.sleep(0.05)
+    assert socket.exists()
+    yield socket
+    proc.terminate()
+    proc.wait()
+
+
+def run(*argv, socket=None, cwd=None, **env):
+    return subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from django_typer.runner import main; sys.exit(main())",
+            *(["--socket", str(socket)] if socket else []),
+            *argv,
+        ],
+        capture_output=True,
+        text=True,
+        cwd=cwd or manage_py.parent,
+        env={
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": SETTINGS,
+            "PYTHONPATH": PYTHONPATH,
+            **env,
+        },
+    )
+
+
+def test_warm_runner(warm_runner):
+    result = run("echo", "echo-test", "hello", socket=warm_runner)
+    assert result.returncode == 0
+    assert result.stdout.strip() == "hello"
+
+    result = run("echo", "echo-test", "oops", "--error", socket=warm_runner)
+    assert result.returncode == 0
+    assert result.stdout == ""
+    assert result.stderr.strip() == "oops"
+
+    result = run("error", "notint", socket=warm_runner)
+    assert result.returncode == 1
+    assert "django-typer-run error" in result.stdout
+    assert "is not a valid integer" in result.stderr
+
+
+def test_warm_runner_already_listening(warm_runner):
+    second = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from django_typer.runner import serve_main; "
+            "sys.exit(serve_main())",
+            "--settings",
+            SETTINGS,
+            "--pythonpath",
+            PYTHONPATH,
+            "--socket",
+            str(warm_runner),
+        ],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert second.returncode == 1
+    assert "already listening" in second.stderr
+
+    # the first runner keeps its socket
+    result = run("echo", "echo-test", "hello", socket=warm_runner)
+    assert result.returncode == 0
+    assert result.stdout.strip() == "hello"
+
+
+def test_warm_runner_database(warm_runner):
+    # each child must open its own connection
+    for _ in range(3):
+        result = run("check", "--database", "default", socket=warm_runner)
+        assert result.returncode == 0, result.stderr
+        assert "System check identified" in result.stdout + result.stderr
+
+
+def test_warm_runner_fallback(warm_runner, tmp_path):
+    # settings that differ from the runner's are run cold
+    result = run(
+        "echo",
+        "echo-test",
+        "cold",
+        socket=warm_runner,
+        DJANGO_SETTINGS_MODULE="tests.settings.examples",
+    )
+    assert result.returncode == 1
+    assert "Unknown command: 'echo'" in result.stderr
+
+    result = run("echo", "echo-test", "cold", socket=tmp_path / "missing.sock")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "cold"
+
+
+def test_warm_runner_killed(warm_runner, tmp_path):
+    # a command that was handed off to the runner is never run again cold
+    marker = tmp_path / "marker"
+    result = run("runner_interrupt", "die", str(marker), socket=warm_runner)
+    assert result.returncode == 1
+    assert "exited without a status" in result.stderr
+    assert len(marker.read_text().splitlines()) == 1
+
+
+def test_warm_runner_interrupt(warm_runner, tmp_path):
+    marker = tmp_path / "marker"
+    client = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from django_typer.runner import main; sys.exit(main())",
+            "--socket",
+            str(warm_runner),
+            "runner_interrupt",
+            "wait",
+            str(marker),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=manage_py.parent,
+        env={
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": SETTINGS,
+            "PYTHONPATH": PYTHONPATH,
+        },
+    )
+    for _ in range(200):
+        if marker.exists() and marker.read_text():
+            break
+        time.sleep(0.05)
+    client.send_signal(signal.SIGINT)
+    # the client waits for the interrupted command to finish
+    client.wait(timeout=10)
+    assert marker.read_text().splitlines()[1:] == ["interrupted"]